@@ -0,0 +1,107 @@
+from typing import Dict, Iterable, List, Optional
+
+
+class IdentityIndex:
+    """
+    Positions of objects kept in a list, looked up by object identity.
+
+    Finding an object with `list.index` (or removing it with
+    `list.remove`) compares it with every preceding element using
+    `__eq__`, which for classifiers means comparing their conditions,
+    actions and effects. The index finds the position without any
+    comparisons.
+
+    Every object owns a slot assigned in insertion order. A Fenwick tree
+    over the slots counts live objects, so the position of an object is
+    the number of live slots up to its own - the order of the list is
+    preserved when objects are removed from the middle of it.
+
+    Slots of removed objects are not reused. Once more than half of the
+    slots are dead, the index is rebuilt from the live objects, so it
+    never holds more than about twice as many slots as objects. Removing
+    an object from the list itself (`del lst[position]`) still shifts
+    the following elements.
+    """
+
+    def __init__(self, items: Iterable = ()) -> None:
+        self.rebuild(items)
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def __contains__(self, o) -> bool:
+        return id(o) in self._slot_of
+
+    def rebuild(self, items: Iterable) -> None:
+        """
+        Drops the current content and indexes `items` in given order.
+        """
+        self._slots: List = [None]
+        self._slots.extend(items)
+        self._slot_of: Dict[int, int] = \
+            {id(o): slot for slot, o in enumerate(self._slots) if slot}
+
+        # Every slot is live, each node passes its count to the parent
+        size = len(self._slots)
+        tree = [1] * size
+        tree[0] = 0
+        for slot in range(1, size):
+            parent = slot + (slot & -slot)
+            if parent < size:
+                tree[parent] += tree[slot]
+
+        self._tree: List[int] = tree
+
+    def append(self, o) -> None:
+        """
+        Indexes the object appended at the end of the list.
+        """
+        slot = len(self._tree)
+        self._slots.append(o)
+        self._slot_of[id(o)] = slot
+
+        # Node of the new slot covers (slot - lowbit, slot] range
+        lowest = slot - (slot & -slot)
+        self._tree.append(1 + self._prefix(slot - 1) - self._prefix(lowest))
+
+    def position(self, o) -> Optional[int]:
+        """
+        Returns the position of the object in the list or None if it is
+        not indexed.
+        """
+        slot = self._slot_of.get(id(o))
+        if slot is None:
+            return None
+
+        return self._prefix(slot) - 1
+
+    def remove(self, o) -> None:
+        """
+        Removes the object from the index. Nothing happens if it was
+        not indexed.
+        """
+        slot = self._slot_of.pop(id(o), None)
+        if slot is None:
+            return
+
+        self._slots[slot] = None
+
+        # Compact the tree when most of the slots are dead
+        if len(self._slots) > 64 and \
+                len(self._slot_of) < len(self._slots) // 2:
+            self.rebuild([o for o in self._slots if o is not None])
+            return
+
+        tree = self._tree
+        while slot < len(tree):
+            tree[slot] -= 1
+            slot += slot & -slot
+
+    def _prefix(self, slot: int) -> int:
+        tree = self._tree
+        total = 0
+        while slot > 0:
+            total += tree[slot]
+            slot -= slot & -slot
+
+        return total
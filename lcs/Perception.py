@@ -1,23 +1,46 @@
 import collections.abc
+from typing import Hashable, Tuple
 
-from . import check_types
+import numpy as np
+
+from . import check_types, validation_enabled
 
 
 class Perception(collections.abc.Sequence):
     """
     Represents current state of the environment at given time instance.
     By default each environment attribute is represented as `str` type.
+
+    Perceptions are immutable. Tuples are wrapped without copying, NumPy
+    arrays are converted with a single `tolist` call and `bytes` are
+    read as Latin-1 symbols. Type checks of the attributes can be skipped
+    (`validate=False`) for observations coming from an environment which
+    was already validated.
+
+    The hash is computed once, so perceptions can be used as keys
+    of caches. Perceptions are equal to tuples with the same attributes
+    (and have the same hashes).
     """
 
-    __slots__ = ['_items', 'oktypes']
+    __slots__ = ['_items', 'oktypes', '_hash']
 
-    def __init__(self, observation, oktypes=(str,)):
-        self._items = list()
+    def __init__(self, observation, oktypes=(str,), validate=True):
+        cls = type(observation)
+        if cls is tuple:
+            items = observation
+        elif cls is list or cls is str:
+            items = tuple(observation)
+        else:
+            items = _as_tuple(observation)
 
-        for el in observation:
-            check_types(oktypes, el)
+        if validate and validation_enabled() \
+                and not all(isinstance(el, oktypes) for el in items):
+            for el in items:
+                check_types(oktypes, el)
 
-        self._items.extend(list(observation))
+        self._items = items
+        self.oktypes = oktypes
+        self._hash = hash(items)
 
     def __getitem__(self, i):
         return self._items[i]
@@ -25,5 +48,47 @@ class Perception(collections.abc.Sequence):
     def __len__(self) -> int:
         return len(self._items)
 
+    def __iter__(self):
+        return iter(self._items)
+
+    def __eq__(self, other):
+        if isinstance(other, Perception):
+            return self._hash == other._hash and self._items == other._items
+        if isinstance(other, tuple):
+            return self._items == other
+
+        return NotImplemented
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return Perception, (self._items, self.oktypes, False)
+
     def __repr__(self):
         return ''.join(map(str, self))
+
+
+def _as_tuple(observation) -> Tuple:
+    if isinstance(observation, tuple):
+        return observation
+    if isinstance(observation, Perception):
+        return observation._items
+    if isinstance(observation, np.ndarray):
+        return tuple(observation.tolist())
+    if isinstance(observation, (bytes, bytearray)):
+        return tuple(observation.decode('latin-1'))
+
+    return tuple(observation)
+
+
+def perception_key(situation) -> Hashable:
+    """
+    Key identifying the situation in caches. Perceptions are used
+    directly (their hashes are already computed), other sequences are
+    converted to tuples (equal to perceptions with the same attributes).
+    """
+    if isinstance(situation, Perception):
+        return situation
+
+    return tuple(situation)
@@ -0,0 +1,188 @@
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, \
+    Set, Tuple
+
+
+def _effect_key(effect) -> Optional[Tuple]:
+    # Probability-enhanced attributes (ACS2) are not hashable and are
+    # equal to plain symbols - such effects can't be used as keys
+    if any(attr.__hash__ is None for attr in effect):
+        return None
+
+    return tuple(effect)
+
+
+def _restricted(found: List, among: Optional[Sequence]) -> List:
+    if among is None or not found:
+        return found
+
+    ids = {id(cl) for cl in found}
+    return [cl for cl in among if id(cl) in ids]
+
+
+class SimilarityIndex:
+    """
+    Buckets of classifiers sharing the whole condition-action-effect triple
+    (similar classifiers) and sharing the action and effect (the only ones
+    that can subsume each other).
+
+    Looking for a similar classifier or subsumers of a new classifier then
+    examines a single bucket instead of comparing the classifier with all
+    others. Buckets return classifiers in insertion order.
+
+    Keys are derived from the attributes, so classifiers which are equal
+    always end up in the same bucket. Classifiers with probability-enhanced
+    effects are kept in separate buckets (for each action and condition)
+    which are examined by every lookup. Looking up such classifiers
+    is not possible (None is returned).
+
+    Lookups can be restricted to classifiers of a subset of the population
+    (i.e. the action set) with `among` - the result then follows the order
+    of that subset, like scanning it would.
+
+    Classifiers which conditions were modified in place should be
+    re-indexed with `update`.
+    """
+
+    def __init__(self, classifiers: Iterable = ()) -> None:
+        self.rebuild(classifiers)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, cl) -> bool:
+        return id(cl) in self._keys
+
+    def rebuild(self, classifiers: Iterable) -> None:
+        """
+        Drops the current content and indexes `classifiers` in given order.
+        """
+        self._keys: Dict[int, Tuple[Hashable, Hashable, int]] = {}
+        self._order = 0
+        self._unordered: Set[Hashable] = set()
+        self._similar: Dict[Hashable, Dict[int, object]] = {}
+        self._subsumers: Dict[Hashable, Dict[int, object]] = {}
+
+        for cl in classifiers:
+            self.add(cl)
+
+    def add(self, cl) -> None:
+        """
+        Appends the classifier to the index (as the last one).
+        """
+        if id(cl) in self._keys:
+            return
+
+        self._order += 1
+        self._index(cl, self._order)
+
+    def update(self, cl) -> None:
+        """
+        Re-indexes the classifier if its condition was modified in place.
+        It keeps its original position in the insertion order.
+        """
+        keys = self._keys.get(id(cl))
+        if keys is not None:
+            self.remove(cl)
+            self._index(cl, keys[2])
+
+    def remove(self, cl) -> None:
+        """
+        Removes the classifier from the index. Nothing happens if it was
+        not indexed.
+        """
+        keys = self._keys.pop(id(cl), None)
+        if keys is None:
+            return
+
+        for buckets, key in zip((self._similar, self._subsumers), keys[:2]):
+            bucket = buckets[key]
+            del bucket[id(cl)]
+            if not bucket:
+                del buckets[key]
+                self._unordered.discard(key)
+
+    def similar(self, cl,
+                among: Optional[Sequence] = None) -> Optional[List]:
+        """
+        Returns indexed classifiers equal to `cl` (with the same condition,
+        action and effect) in insertion order or None if `cl` has
+        a probability-enhanced effect. With `among` only its classifiers
+        are returned (in its order).
+        """
+        effect = _effect_key(cl.effect)
+        if effect is None:
+            return None
+
+        condition = tuple(cl.condition)
+        candidates = self._lookup(self._similar,
+                                  (condition, (cl.action, effect)),
+                                  (condition, (cl.action, None)))
+
+        return _restricted([other for other in candidates if other == cl],
+                           among)
+
+    def subsumer_candidates(self, cl,
+                            limit: Optional[int] = None,
+                            among: Optional[Sequence] = None) \
+            -> Optional[List]:
+        """
+        Returns indexed classifiers with the same action and effect
+        as `cl` (only those can subsume it) in insertion order.
+        Classifiers with probability-enhanced effects are always included.
+
+        With `among` only its classifiers are returned (in its order).
+
+        None is returned if `cl` has a probability-enhanced effect or
+        there are at least `limit` candidates in the index.
+        """
+        effect = _effect_key(cl.effect)
+        if effect is None:
+            return None
+
+        candidates = self._lookup(self._subsumers,
+                                  (cl.action, effect),
+                                  (cl.action, None),
+                                  limit)
+        if candidates is None:
+            return None
+
+        return _restricted(candidates, among)
+
+    def _index(self, cl, order: int) -> None:
+        subsumer_key = (cl.action, _effect_key(cl.effect))
+        similar_key = (tuple(cl.condition), subsumer_key)
+        self._keys[id(cl)] = similar_key, subsumer_key, order
+
+        self._similar.setdefault(similar_key, {})[id(cl)] = cl
+        self._subsumers.setdefault(subsumer_key, {})[id(cl)] = cl
+
+        if order < self._order:
+            # Re-indexed classifier was put at the end of the buckets
+            self._unordered.update((similar_key, subsumer_key))
+
+    def _lookup(self, buckets, key: Hashable, enhanced_key: Hashable,
+                limit: Optional[int] = None) -> Optional[List]:
+        plain = buckets.get(key, {})
+        enhanced = buckets.get(enhanced_key, {})
+        if limit is not None and len(plain) + len(enhanced) >= limit:
+            return None
+
+        found = self._ordered(buckets, key)
+        if enhanced:
+            found.extend(self._ordered(buckets, enhanced_key))
+            found.sort(key=self._order_of)
+
+        return found
+
+    def _ordered(self, buckets, key: Hashable) -> List:
+        bucket = buckets.get(key, {})
+        if key in self._unordered:
+            self._unordered.discard(key)
+            bucket = dict(sorted(bucket.items(),
+                                 key=lambda item: self._order_of(item[1])))
+            buckets[key] = bucket
+
+        return list(bucket.values())
+
+    def _order_of(self, cl) -> int:
+        return self._keys[id(cl)][2]
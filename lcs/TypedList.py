@@ -1,6 +1,6 @@
 import collections.abc
 
-from . import check_types
+from . import check_types, validation_enabled
 
 
 class TypedList(collections.abc.MutableSequence):
@@ -11,11 +11,24 @@ class TypedList(collections.abc.MutableSequence):
         self._items = list()
         self.oktypes = oktypes
 
-        for el in args:
-            check_types(oktypes, el)
+        if validation_enabled():
+            for el in args:
+                check_types(oktypes, el)
 
         self._items.extend(list(args))
 
+    @classmethod
+    def _trusted(cls, items: list, oktypes):
+        """
+        Creates the list taking over `items` built by the library from
+        elements which were already checked (the list is neither copied
+        nor validated).
+        """
+        typed_list = cls.__new__(cls)
+        typed_list._items = items
+        typed_list.oktypes = oktypes
+        return typed_list
+
     def insert(self, index: int, o) -> None:
         check_types(self.oktypes, o)
         self._items.insert(index, o)
@@ -1,3 +1,5 @@
-from .utils import check_types
+from .utils import check_types, set_validation, validation_enabled
 from .Perception import Perception
 from .TypedList import TypedList
+from .IdentityIndex import IdentityIndex
+from .SimilarityIndex import SimilarityIndex
@@ -1,15 +1,101 @@
-from typing import Dict, Any, Optional
+import random
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from lcs import checkpoint
 
 Metric = Dict[str, Any]
 
 
 class Agent:
+    # Training state restored from the checkpoint (see `load`)
+    resume_state: Optional[Dict[str, Any]] = None
+
+    # Random number generator owned by the agent (saved in checkpoints)
+    _rng: Optional[np.random.Generator] = None
+
     def explore(self, env, trials):
         raise NotImplementedError()
 
     def exploit(self, env, trials):
         raise NotImplementedError()
 
+    def save(self, path: str, **state) -> None:
+        """
+        Saves the population and configuration of the agent
+        (see `lcs.checkpoint`).
+
+        Parameters
+        ----------
+        path: str
+            output file
+        state
+            additional training state
+        """
+        checkpoint.save(path, self.cfg, self.population, state)
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Creates the agent from the checkpoint. If the checkpoint was made
+        during training, the next `explore`/`exploit` call resumes it -
+        starts from the trial following the checkpoint (with the same
+        state of random number generators) and runs until the total
+        number of trials is reached.
+
+        Parameters
+        ----------
+        path: str
+            checkpoint file
+
+        Returns
+        -------
+        Agent
+            restored agent
+        """
+        restored = checkpoint.load(path)
+        agent = cls(restored.cfg, restored.population)
+        if 'trial' in restored.state:
+            agent.resume_state = restored.state
+
+        return agent
+
+    def _start_training(self) -> Tuple[int, int]:
+        """
+        Returns the trial and the number of steps the training starts
+        from - zeros unless the training is resumed from the checkpoint.
+        """
+        state, self.resume_state = self.resume_state, None
+        if state is None:
+            return 0, 0
+
+        random.setstate(state['random'])
+        np.random.set_state(state['numpy_random'])
+        if 'rng' in state:
+            self._rng = np.random.default_rng()
+            self._rng.bit_generator.state = state['rng']
+
+        return state['trial'], state['steps']
+
+    def _save_checkpoint(self, trial: int, steps: int) -> None:
+        """
+        Saves the checkpoint every `cfg.checkpoint_frequency` trials.
+        The `cfg.checkpoint_path` can contain a `{trial}` placeholder.
+        """
+        frequency = getattr(self.cfg, 'checkpoint_frequency', None)
+        if not frequency or trial % frequency != 0:
+            return
+
+        state = dict(trial=trial,
+                     steps=steps,
+                     random=random.getstate(),
+                     numpy_random=np.random.get_state())
+        if self._rng is not None:
+            state['rng'] = self._rng.bit_generator.state
+
+        self.save(self.cfg.checkpoint_path.format(trial=trial), **state)
+
     def _collect_agent_metrics(self, trial, steps, total_steps, reward) -> Metric:
         raise NotImplementedError()
 
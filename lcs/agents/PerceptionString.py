@@ -6,6 +6,9 @@ from lcs import TypedList
 
 class PerceptionString(TypedList):
 
+    # Structural hash, computed on demand and dropped on every modification
+    _hash = None
+
     def __init__(self, observation, wildcard='#', oktypes=(str,dict)):
         # str is for plain Effect element
         # dict is for Probability-Enhanced Effect element
@@ -16,6 +19,12 @@ class PerceptionString(TypedList):
         assert type(wildcard) in self.oktypes
         self.wildcard = wildcard
 
+    @classmethod
+    def _trusted(cls, items: list, oktypes=(str, dict), wildcard='#'):
+        ps = super()._trusted(items, oktypes)
+        ps.wildcard = wildcard
+        return ps
+
     @classmethod
     def empty(cls,
               length: int,
@@ -43,8 +52,32 @@ class PerceptionString(TypedList):
         ps_str = [copy(wildcard) for _ in range(length)]
         return cls(ps_str, wildcard=wildcard, oktypes=oktypes)
 
+    def insert(self, index: int, o) -> None:
+        self._hash = None
+        super().insert(index, o)
+
+    def __setitem__(self, i, o):
+        self._hash = None
+        super().__setitem__(i, o)
+
+    def __delitem__(self, i):
+        self._hash = None
+        super().__delitem__(i)
+
     def __eq__(self, other):
+        # Strings with known (cached) different hashes can't be equal
+        other_hash = getattr(other, '_hash', None)
+        if self._hash is not None and other_hash is not None \
+                and self._hash != other_hash:
+            return False
+
         return self._items == other._items
 
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+
+        return self._hash
+
     def __repr__(self):
         return ''.join(map(str, self))
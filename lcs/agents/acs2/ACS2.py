@@ -1,17 +1,55 @@
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
-from lcs import Perception
+from lcs import Perception, profiling
 
 from . import ClassifiersList, Configuration
 from ...agents import Agent
 from ...agents.Agent import Metric
+from ...metrics import MetricsSink, ListSink
+from ...profiling import Profiler
+from ...tracing import Tracer
 from ...strategies.action_selection import choose_action
 
 
 logger = logging.getLogger(__name__)
 
 
+class _Episode:
+    """
+    State of the trial executed in one of environments explored
+    in lockstep (see `ACS2.explore_vectorized`).
+    """
+
+    __slots__ = ['env', 'state', 'prev_state', 'action', 'action_set',
+                 'reward', 'done', 'steps', 'total_reward',
+                 'correct', 'all']
+
+    def __init__(self, env, state: Perception) -> None:
+        self.env = env
+        self.state = state
+        self.prev_state = None
+        self.action = None
+        self.action_set = ClassifiersList()
+        self.reward = None
+        self.done = False
+        self.steps = 0
+        self.total_reward = 0
+        self.correct = 0
+        self.all = 0
+
+    def learn(self, anticipations: Tuple[int, int]) -> None:
+        self.correct += anticipations[0]
+        self.all += anticipations[1]
+
+    @property
+    def correct_anticipations(self) -> float:
+        if self.all > 0:
+            return 100.0 * self.correct / self.all
+
+        return 50.0
+
+
 class ACS2(Agent):
     def __init__(self,
                  cfg: Configuration,
@@ -23,30 +61,54 @@ class ACS2(Agent):
         else:
             self.population = ClassifiersList()
 
-    def explore(self, env, trials):
+        if cfg.use_match_index:
+            self.population.build_match_index(cfg.classifier_wildcard)
+
+        if cfg.use_match_set_cache:
+            self.population.build_match_set_cache()
+
+        if cfg.use_array_store:
+            self.population.build_store()
+
+        if cfg.use_identity_index:
+            self.population.build_identity_index()
+
+        if cfg.use_similarity_index:
+            self.population.build_similarity_index()
+
+    def explore(self, env, trials, metrics_sink: Optional[MetricsSink] = None):
         """
         Explores the environment in given set of trials.
         :param env: environment
         :param trials: number of trials
+        :param metrics_sink: sink consuming metrics of each trial
+            (by default all metrics are kept in memory)
         :return: population of classifiers and metrics
         """
-        return self._evaluate(env, trials, self._run_trial_explore)
+        return self._evaluate(
+            env, trials, self._run_trial_explore, metrics_sink)
 
-    def exploit(self, env, trials):
+    def exploit(self, env, trials, metrics_sink: Optional[MetricsSink] = None):
         """
         Exploits the environments in given set of trials (always executing
         best possible action - no exploration).
         :param env: environment
         :param trials: number of trials
+        :param metrics_sink: sink consuming metrics of each trial
+            (by default all metrics are kept in memory)
         :return: population of classifiers and metrics
         """
-        return self._evaluate(env, trials, self._run_trial_exploit)
+        return self._evaluate(
+            env, trials, self._run_trial_exploit, metrics_sink)
 
-    def explore_exploit(self, env, trials):
+    def explore_exploit(self, env, trials,
+                        metrics_sink: Optional[MetricsSink] = None):
         """
         Alternates between exploration and exploitation phases.
         :param env: environment
         :param trials: number of trials
+        :param metrics_sink: sink consuming metrics of each trial
+            (by default all metrics are kept in memory)
         :return: population of classifiers and metrics
         """
         def switch_phases(env, steps, current_trial):
@@ -55,9 +117,179 @@ class ACS2(Agent):
             else:
                 return self._run_trial_exploit(env, None)
 
-        return self._evaluate(env, trials, switch_phases)
+        return self._evaluate(env, trials, switch_phases, metrics_sink)
 
-    def _evaluate(self, env, max_trials, func):
+    def explore_vectorized(self, envs, trials,
+                           metrics_sink: Optional[MetricsSink] = None):
+        """
+        Explores multiple copies of the environment stepped in lockstep,
+        all learned by the same population. In each step match sets for
+        perceptions of all environments are formed together (identical
+        perceptions are matched once). Then for each environment (in the
+        order of `envs`) learning is applied and an action is chosen.
+        Finally all environments execute their actions.
+
+        Classifiers removed by learning in one environment are dropped
+        from match and action sets held for others. With a single
+        environment the result is the same as of `explore`.
+
+        Environments which finish a trial start the next one until
+        `trials` are started. Metrics are collected for every finished
+        trial (trials are numbered in the order of finishing). Training
+        resumed from the checkpoint starts new trials in all environments.
+
+        Environments running in worker processes (see `lcs.workers`)
+        are sent actions as soon as they are chosen.
+        :param envs: independent copies of the environment
+        :param trials: number of trials (in all environments)
+        :param metrics_sink: sink consuming metrics of each trial
+            (by default all metrics are kept in memory)
+        :return: population of classifiers and metrics
+        """
+        current_trial, steps = self._start_training()
+
+        if metrics_sink is None:
+            metrics_sink = ListSink()
+
+        shared = len(envs) > 1
+        if shared and self.population.identity_index is None:
+            self.population.build_identity_index()
+
+        profiler = Profiler() if self.cfg.use_profiler else None
+
+        try:
+            with profiling.activated(profiler):
+                started = current_trial
+                episodes = []
+                for env in envs[:max(trials - started, 0)]:
+                    episodes.append(_Episode(env, self._perceive(env.reset())))
+                    started += 1
+
+                while episodes:
+                    t = profiling.start()
+                    match_sets = self.population.form_match_sets(
+                        [episode.state for episode in episodes])
+                    t = profiling.lap('match_set', t)
+
+                    for i, (episode, match_set) in enumerate(
+                            zip(episodes, match_sets)):
+                        if shared:
+                            match_set = self._alive(match_set)
+
+                        if episode.steps > 0:
+                            episode.learn(self._learn(
+                                match_set,
+                                self._alive(episode.action_set)
+                                if shared else episode.action_set,
+                                episode.prev_state,
+                                episode.action,
+                                episode.state,
+                                episode.reward,
+                                steps + i))
+                            t = profiling.start()
+
+                        episode.action = choose_action(
+                            match_set,
+                            self.cfg.number_of_possible_actions,
+                            self.cfg.epsilon)
+                        episode.action_set = match_set.form_action_set(
+                            episode.action)
+                        t = profiling.lap('action_selection', t)
+
+                        # Environments running in worker processes start
+                        # computing while the agent learns in others
+                        if hasattr(episode.env, 'step_async'):
+                            episode.env.step_async(
+                                self.cfg.environment_adapter.to_env_action(
+                                    episode.action))
+                            t = profiling.lap('environment', t)
+
+                    for episode in episodes:
+                        if hasattr(episode.env, 'step_async'):
+                            outcome = episode.env.step_wait()
+                        else:
+                            outcome = episode.env.step(
+                                self.cfg.environment_adapter.to_env_action(
+                                    episode.action))
+
+                        raw_state, episode.reward, episode.done, _ = outcome
+
+                        episode.prev_state = episode.state
+                        episode.state = self._perceive(raw_state, False)
+                    t = profiling.lap('environment', t)
+
+                    running = []
+                    for i, episode in enumerate(episodes):
+                        if shared:
+                            episode.action_set = \
+                                self._alive(episode.action_set)
+
+                        episode.learn(self._learn_after_step(
+                            episode.action_set,
+                            episode.prev_state,
+                            episode.action,
+                            episode.state,
+                            episode.reward,
+                            episode.done,
+                            steps + i))
+                        episode.total_reward += episode.reward
+                        episode.steps += 1
+
+                        if not episode.done:
+                            running.append(episode)
+                            continue
+
+                        trial_metrics = self._collect_metrics(
+                            episode.env, current_trial, episode.steps,
+                            steps + i + 1, episode.total_reward)
+                        trial_metrics['agent']['correct_anticipations'] = \
+                            episode.correct_anticipations
+
+                        if profiler is not None:
+                            trial_metrics['profile'] = profiler.snapshot()
+
+                        metrics_sink.write(trial_metrics)
+
+                        current_trial += 1
+                        self._save_checkpoint(current_trial, steps + i + 1)
+
+                        if started < trials:
+                            env = episode.env
+                            running.append(
+                                _Episode(env, self._perceive(env.reset())))
+                            started += 1
+
+                    steps += len(episodes)
+                    episodes = running
+        finally:
+            # Metrics of finished trials are kept even if training fails
+            metrics_sink.flush()
+
+        return self.population, metrics_sink.metrics
+
+    def _perceive(self, raw_state, validate: bool = True) -> Perception:
+        """
+        Converts the observation into perception. Types of attributes
+        are validated only when the trial starts (`validate`).
+        """
+        genotype = self.cfg.environment_adapter.to_genotype(raw_state)
+        if self.cfg.alphabet is not None:
+            genotype = self.cfg.alphabet.intern(genotype)
+
+        return Perception(genotype, validate=validate)
+
+    def _alive(self, classifiers: ClassifiersList) -> ClassifiersList:
+        """
+        Drops classifiers which are no longer in the population.
+        """
+        index = self.population.identity_index
+        if all(cl in index for cl in classifiers):
+            return classifiers
+
+        return ClassifiersList._trusted(
+            [cl for cl in classifiers if cl in index])
+
+    def _evaluate(self, env, max_trials, func, metrics_sink=None):
         """
         Runs the classifier in desired strategy (see `func`) and collects
         metrics.
@@ -71,41 +303,59 @@ class ACS2(Agent):
         func: Callable
             Function accepting three parameters: env, steps already made,
              current trial
+        metrics_sink: Optional[MetricsSink]
+            sink consuming metrics of each trial (`ListSink` by default)
 
         Returns
         -------
         tuple
-            population of classifiers and metrics
+            population of classifiers and metrics retained by the sink
         """
-        current_trial = 0
-        steps = 0
+        current_trial, steps = self._start_training()
+
+        if metrics_sink is None:
+            metrics_sink = ListSink()
+
+        profiler = Profiler() if self.cfg.use_profiler else None
 
-        metrics = []
-        while current_trial < max_trials:
-            logger.info("** Running trial {}/{} using strategy `{}` **"
-                        .format(current_trial, max_trials, func))
+        try:
+            with profiling.activated(profiler):
+                while current_trial < max_trials:
+                    logger.info(
+                        "** Running trial %d/%d using strategy `%s` **",
+                        current_trial, max_trials, func)
 
-            steps_in_trial, reward, corr_pcnt = func(env, steps, current_trial)
-            steps += steps_in_trial
+                    steps_in_trial, reward, corr_pcnt = func(
+                        env, steps, current_trial)
+                    steps += steps_in_trial
 
-            trial_metrics = self._collect_metrics(
-                env, current_trial, steps_in_trial, steps, reward)
-            trial_metrics['agent']['correct_anticipations'] = corr_pcnt
+                    trial_metrics = self._collect_metrics(
+                        env, current_trial, steps_in_trial, steps, reward)
+                    trial_metrics['agent']['correct_anticipations'] = corr_pcnt
 
-            metrics.append(trial_metrics)
+                    if profiler is not None:
+                        trial_metrics['profile'] = profiler.snapshot()
 
-            if current_trial % 25 == 0:
-                logger.info(trial_metrics)
+                    metrics_sink.write(trial_metrics)
 
-            current_trial += 1
+                    if current_trial % 25 == 0:
+                        logger.info(trial_metrics)
 
-        return self.population, metrics
+                    current_trial += 1
+                    self._save_checkpoint(current_trial, steps)
+        finally:
+            # Metrics of finished trials are kept even if training fails
+            metrics_sink.flush()
+
+        return self.population, metrics_sink.metrics
 
     def _run_trial_explore(self, env, time, current_trial=None):
+        trace = Tracer(logger)
+
         # Initial conditions
         steps = 0
         raw_state = env.reset()
-        state = Perception(self.cfg.environment_adapter.to_genotype(raw_state))
+        state = self._perceive(raw_state)
         action = None
         reward = None
         total_reward = 0
@@ -116,101 +366,156 @@ class ACS2(Agent):
         all_anticipations = 0
 
         while not done:
+            t = profiling.start()
             match_set = self.population.form_match_set(state)
+            t = profiling.lap('match_set', t)
 
             if steps > 0:
                 # Apply learning in the last action set
-                d_correct, d_all = ClassifiersList.apply_alp(
-                    self.population,
-                    match_set,
-                    action_set,
-                    prev_state,
-                    action,
-                    state,
-                    time + steps,
-                    self.cfg.theta_exp,
-                    self.cfg)
+                d_correct, d_all = self._learn(
+                    match_set, action_set, prev_state, action, state,
+                    reward, time + steps)
                 correct_anticipations += d_correct
                 all_anticipations += d_all
-                ClassifiersList.apply_reinforcement_learning(
-                    action_set,
-                    reward,
-                    match_set.get_maximum_fitness(),
-                    self.cfg.beta,
-                    self.cfg.gamma
-                )
-                if self.cfg.do_ga:
-                    ClassifiersList.apply_ga(
-                        time + steps,
-                        self.population,
-                        match_set,
-                        action_set,
-                        state,
-                        self.cfg.theta_ga,
-                        self.cfg.mu,
-                        self.cfg.chi,
-                        self.cfg.theta_as,
-                        self.cfg.do_subsumption,
-                        self.cfg.theta_exp)
+                t = profiling.start()
 
             action = choose_action(
                 match_set,
                 self.cfg.number_of_possible_actions,
                 self.cfg.epsilon)
             internal_action = self.cfg.environment_adapter.to_env_action(action)
-            logger.info("Step {} of exploring the environment:".format(steps))
-            logger.info(" * current state: {}".format(state))
-            logger.info(" * current environment:\n{}".format(env.render('ansi')))
-            logger.info(" * decision: executing action {}".format(action))
+            if trace.steps:
+                trace.step("Step %d of exploring the environment:", steps)
+                trace.step(" * current state: %s", state)
+                trace.step(" * current environment:\n%s", env.render('ansi'))
+                trace.step(" * decision: executing action %s", action)
             action_set = match_set.form_action_set(action)
+            trace.dump(" * match set:\n%s", match_set)
+            trace.dump(" * action set:\n%s", action_set)
+            t = profiling.lap('action_selection', t)
 
             prev_state = state
             raw_state, reward, done, _ = env.step(internal_action)
-            state = Perception(self.cfg.environment_adapter.to_genotype(raw_state))
+            state = self._perceive(raw_state, False)
+            t = profiling.lap('environment', t)
 
-            if done:
-                d_correct, d_all = ClassifiersList.apply_alp(
-                    self.population,
-                    None,
-                    action_set,
-                    prev_state,
-                    action,
-                    state,
-                    time + steps,
-                    self.cfg.theta_exp,
-                    self.cfg)
-                correct_anticipations += d_correct
-                all_anticipations += d_all
-                ClassifiersList.apply_reinforcement_learning(
-                    action_set,
-                    reward,
-                    0,
-                    self.cfg.beta,
-                    self.cfg.gamma)
-            if self.cfg.do_ga:
-                ClassifiersList.apply_ga(
-                    time + steps,
-                    self.population,
-                    None,
-                    action_set,
-                    state,
-                    self.cfg.theta_ga,
-                    self.cfg.mu,
-                    self.cfg.chi,
-                    self.cfg.theta_as,
-                    self.cfg.do_subsumption,
-                    self.cfg.theta_exp)
+            d_correct, d_all = self._learn_after_step(
+                action_set, prev_state, action, state, reward, done,
+                time + steps)
+            correct_anticipations += d_correct
+            all_anticipations += d_all
 
             total_reward += reward
             steps += 1
 
         return steps, total_reward, 100.0 * correct_anticipations / all_anticipations if all_anticipations > 0 else 50.0
 
+    def _learn(self, match_set, action_set, prev_state, action, state,
+               reward, time: int) -> Tuple[int, int]:
+        """
+        Applies ALP, RL and GA in the action set of the previous step
+        (when the next step is to be taken in `state`).
+
+        Returns
+        -------
+        Tuple[int, int]
+            number of correct and all anticipations
+        """
+        t = profiling.start()
+        d_correct, d_all = ClassifiersList.apply_alp(
+            self.population,
+            match_set,
+            action_set,
+            prev_state,
+            action,
+            state,
+            time,
+            self.cfg.theta_exp,
+            self.cfg)
+        t = profiling.lap('alp', t)
+        ClassifiersList.apply_reinforcement_learning(
+            action_set,
+            reward,
+            match_set.get_maximum_fitness(),
+            self.cfg.beta,
+            self.cfg.gamma
+        )
+        t = profiling.lap('rl', t)
+        if self.cfg.do_ga:
+            ClassifiersList.apply_ga(
+                time,
+                self.population,
+                match_set,
+                action_set,
+                state,
+                self.cfg.theta_ga,
+                self.cfg.mu,
+                self.cfg.chi,
+                self.cfg.theta_as,
+                self.cfg.do_subsumption,
+                self.cfg.theta_exp)
+            profiling.lap('ga', t)
+
+        return d_correct, d_all
+
+    def _learn_after_step(self, action_set, prev_state, action, state,
+                          reward, done: bool, time: int) -> Tuple[int, int]:
+        """
+        Applies learning right after the environment step - ALP and RL
+        in the action set if the trial ended and GA.
+
+        Returns
+        -------
+        Tuple[int, int]
+            number of correct and all anticipations
+        """
+        d_correct, d_all = 0, 0
+
+        t = profiling.start()
+        if done:
+            d_correct, d_all = ClassifiersList.apply_alp(
+                self.population,
+                None,
+                action_set,
+                prev_state,
+                action,
+                state,
+                time,
+                self.cfg.theta_exp,
+                self.cfg)
+            t = profiling.lap('alp', t)
+            ClassifiersList.apply_reinforcement_learning(
+                action_set,
+                reward,
+                0,
+                self.cfg.beta,
+                self.cfg.gamma)
+            t = profiling.lap('rl', t)
+        if self.cfg.do_ga:
+            ClassifiersList.apply_ga(
+                time,
+                self.population,
+                None,
+                action_set,
+                state,
+                self.cfg.theta_ga,
+                self.cfg.mu,
+                self.cfg.chi,
+                self.cfg.theta_as,
+                self.cfg.do_subsumption,
+                self.cfg.theta_exp)
+            profiling.lap('ga', t)
+
+        return d_correct, d_all
+
     def _run_trial_exploit(self, env, time=None, current_trial=None):
+        trace = Tracer(logger)
+        can_rate = 'rate_action' in env.env.__dir__()
+
         # Initial conditions
         steps = 0
         raw_state = env.reset()
-        state = self.cfg.environment_adapter.to_genotype(raw_state)
+        state = self._perceive(raw_state, False)
 
         reward = None
         total_reward = 0
@@ -220,12 +525,14 @@ class ACS2(Agent):
         episode = []
 
         while not done:
-            logger.info("Step {} of exploiting the environment:".format(steps))
-            logger.info(
-                " * current environment:\n{}".format(env.render('ansi')))
+            if trace.steps:
+                trace.step("Step %d of exploiting the environment:", steps)
+                trace.step(" * current environment:\n%s", env.render('ansi'))
 
+            t = profiling.start()
             match_set = self.population.form_match_set(state)
-            logger.info(" * match set:\n{}".format(match_set))
+            trace.dump(" * match set:\n%s", match_set)
+            t = profiling.lap('match_set', t)
 
             if steps > 0:
                 ClassifiersList.apply_reinforcement_learning(
@@ -234,6 +541,7 @@ class ACS2(Agent):
                     match_set.get_maximum_fitness(),
                     self.cfg.beta,
                     self.cfg.gamma)
+                t = profiling.lap('rl', t)
 
             # Here when exploiting always choose best action
             action = choose_action(
@@ -241,35 +549,56 @@ class ACS2(Agent):
                 self.cfg.number_of_possible_actions,
                 epsilon=0.0)
             internal_action = self.cfg.environment_adapter.to_env_action(action)
-            logger.info(" * decision: executing action {}".format(action))
+            trace.step(" * decision: executing action %s", action)
 
             rating = None
-            if 'rate_action' in env.env.__dir__():
+            if can_rate:
                 rating = env.env.rate_action(internal_action)
                 if rating is not None:
                     sum_rating += rating
-                    logger.info(" * action rating: {}".format(rating))
+                    trace.step(" * action rating: %s", rating)
 
             action_set = match_set.form_action_set(action)
-            logger.info(" * action set:\n{}".format(action_set))
+            trace.dump(" * action set:\n%s", action_set)
+            t = profiling.lap('action_selection', t)
 
-            episode.append(internal_action)
+            if trace.trials:
+                episode.append(internal_action)
             raw_state, reward, done, _ = env.step(internal_action)
-            state = self.cfg.environment_adapter.to_genotype(raw_state)
+            state = self._perceive(raw_state, False)
+            t = profiling.lap('environment', t)
 
             if done:
                 ClassifiersList.apply_reinforcement_learning(
                     action_set, reward, 0, self.cfg.beta, self.cfg.gamma)
+                profiling.lap('rl', t)
 
             total_reward += reward
             steps += 1
 
-        logger.info("This episode: {}".format("".join(str(x) for x in episode)))
-        logger.info("Average action rating in this trial: {} in {} steps".format(sum_rating / steps, steps))
+        if trace.trials:
+            trace.trial("This episode: %s", "".join(str(x) for x in episode))
+            trace.trial("Average action rating in this trial: %s in %d steps",
+                        sum_rating / steps, steps)
 
         return steps, total_reward, -1.0
 
     def _collect_agent_metrics(self, trial, steps, total_steps, reward) -> Metric:
+        arrays = self.population.arrays('num', 'q', 'r')
+        if arrays is not None:
+            num, q, r = arrays
+            return {
+                'population': len(self.population),
+                'numerosity': int(num.sum()),
+                'reliable': int((q > self.cfg.theta_r).sum()),
+                'quality': float(q.mean()),
+                'fitness': float((q * r).mean()),
+                'trial': trial,
+                'steps': steps,
+                'total_steps': total_steps,
+                'reward': reward
+            }
+
         return {
             'population': len(self.population),
             'numerosity': sum(cl.num for cl in self.population),
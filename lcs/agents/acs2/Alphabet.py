@@ -0,0 +1,52 @@
+import sys
+from typing import Dict, Iterable, List, Tuple
+
+
+class Alphabet:
+    """
+    Symbols which can be perceived in the environment.
+
+    Some environments produce symbols which are not plain `str` objects
+    (i.e. NumPy strings) or build them anew in every step (i.e. `str`
+    of a number). Normalising the perceived symbols to canonical `str`
+    objects makes all the symbols stored in conditions, effects and marks
+    plain strings shared between classifiers. It also validates that only
+    the symbols of the alphabet are perceived.
+
+    The agent keeps operating on `str` symbols (they are not translated
+    to integer codes). One-character `str` symbols are already shared by
+    the interpreter, so environments producing them do not gain anything.
+    """
+
+    def __init__(self, symbols: Iterable) -> None:
+        self.symbols: Tuple[str, ...] = tuple(
+            sys.intern(str(symbol)) for symbol in symbols)
+        self._canonical: Dict[str, str] = {}
+
+        for symbol in self.symbols:
+            if symbol in self._canonical:
+                raise ValueError("Duplicated symbol: {}".format(symbol))
+            self._canonical[symbol] = symbol
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol) -> bool:
+        return symbol in self._canonical
+
+    def __repr__(self):
+        return "Alphabet({})".format(list(self.symbols))
+
+    def intern(self, observation: Iterable) -> List[str]:
+        """
+        Replaces the symbols of the observation with canonical ones.
+
+        Raises
+        ------
+        ValueError
+            if the observation contains unknown symbol
+        """
+        try:
+            return list(map(self._canonical.__getitem__, observation))
+        except KeyError as e:
+            raise ValueError("Unknown symbol: {}".format(e.args[0])) from None
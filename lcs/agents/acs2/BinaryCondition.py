@@ -0,0 +1,232 @@
+from typing import Dict, List, Optional, Tuple, Union
+
+from lcs import Perception
+from . import Condition
+
+_VALID_SYMBOLS: Dict[str, dict] = {}
+_CARE_SYMBOLS: Dict[str, dict] = {}
+
+# Recently packed perceptions by identity (kept alive, so their ids are
+# not reused). A match set is formed by matching the same perception
+# with every classifier, so it is packed once for all of them.
+_PACKED: Dict[int, Tuple] = {}
+_PACKED_LIMIT = 64
+
+# Symbols of every (care, value) byte pair, by wildcard
+_SYMBOL_CHUNKS: Dict[str, Dict[int, Tuple[str, ...]]] = {}
+
+
+def pack(observation, wildcard='#') -> Tuple[int, int]:
+    """
+    Packs a binary perception string into a (care, value) pair of integers.
+    Bit `i` of `care` is set when the attribute `i` is specified (not
+    a wildcard), bit `i` of `value` holds the attribute itself.
+
+    Parameters
+    ----------
+    observation
+        sequence of '0', '1' and wildcard symbols or already packed
+        perception string
+    wildcard
+        wildcard symbol
+
+    Returns
+    -------
+    Tuple[int, int]
+        care mask and value mask
+    """
+    # Perceptions are immutable - their masks can be reused
+    if isinstance(observation, Perception):
+        cached = _PACKED.get(id(observation))
+        if cached is not None and cached[1] == wildcard:
+            return cached[2]
+
+        if len(_PACKED) >= _PACKED_LIMIT:
+            _PACKED.clear()
+
+        packed = _pack(observation, wildcard)
+        _PACKED[id(observation)] = (observation, wildcard, packed)
+        return packed
+
+    masks = getattr(observation, 'packed', None)
+    if masks is not None:
+        return masks
+
+    return _pack(observation, wildcard)
+
+
+def _pack(observation, wildcard: str) -> Tuple[int, int]:
+    if wildcard not in _VALID_SYMBOLS:
+        _VALID_SYMBOLS[wildcard] = str.maketrans('', '', '01' + wildcard)
+        _CARE_SYMBOLS[wildcard] = str.maketrans({'0': '1', wildcard: '0'})
+
+    symbols = ''.join(observation)
+    if symbols.translate(_VALID_SYMBOLS[wildcard]) \
+            or len(symbols) != len(observation):
+        raise ValueError(
+            "Only binary symbols are allowed: {}".format(observation))
+
+    if not symbols:
+        return 0, 0
+
+    symbols = symbols[::-1]
+    care = int(symbols.translate(_CARE_SYMBOLS[wildcard]), 2)
+    value = int(symbols.replace(wildcard, '0'), 2)
+
+    return care, value
+
+
+def _unpack_byte(care: int, value: int, wildcard: str) -> Tuple[str, ...]:
+    return tuple(('1' if value >> bit & 1 else '0')
+                 if care >> bit & 1 else wildcard
+                 for bit in range(8))
+
+
+class PackedSymbols:
+    """
+    Perception string of binary symbols stored as a pair of integer bit
+    masks (see `pack`). Shared by `BinaryCondition` and `BinaryEffect`.
+    """
+
+    _name = 'String'
+
+    wildcard: str
+    _length: int
+    _care: int
+    _value: int
+    _hash: Optional[int]
+
+    @property
+    def packed(self) -> Tuple[int, int]:
+        return self._care, self._value
+
+    def insert(self, index: int, o) -> None:
+        raise TypeError(
+            "Binary {} has a fixed length".format(self._name.lower()))
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._unpack()[i]
+
+        bit = 1 << self._position(i)
+        if not self._care & bit:
+            return self.wildcard
+
+        return '1' if self._value & bit else '0'
+
+    def __setitem__(self, i, o):
+        self._hash = None
+        if isinstance(i, slice):
+            for idx, el in zip(range(*i.indices(self._length)), o):
+                self[idx] = el
+            return
+
+        bit = 1 << self._position(i)
+        o = self._to_symbol(o)
+        if o == self.wildcard:
+            self._care &= ~bit
+            self._value &= ~bit
+        elif o == '1':
+            self._care |= bit
+            self._value |= bit
+        elif o == '0':
+            self._care |= bit
+            self._value &= ~bit
+        else:
+            raise ValueError("Only binary symbols are allowed: {}".format(o))
+
+    def __delitem__(self, i):
+        raise TypeError(
+            "Binary {} has a fixed length".format(self._name.lower()))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return iter(self._unpack())
+
+    def __eq__(self, other):
+        if isinstance(other, PackedSymbols):
+            return self._length == other._length and \
+                self._care == other._care and \
+                self._value == other._value
+
+        return list(self) == list(other)
+
+    def __hash__(self):
+        # Must be the same as for the plain string with the same symbols
+        if self._hash is None:
+            self._hash = hash(tuple(self._unpack()))
+
+        return self._hash
+
+    def _unpack(self) -> List[str]:
+        """
+        Unpacks all the symbols at once, a byte of both masks at a time.
+        """
+        chunks = _SYMBOL_CHUNKS.setdefault(self.wildcard, {})
+        care, value = self._care, self._value
+        symbols: List[str] = []
+
+        for _ in range((self._length + 7) // 8):
+            key = (care & 0xff) << 8 | value & 0xff
+            chunk = chunks.get(key)
+            if chunk is None:
+                chunk = chunks[key] = _unpack_byte(
+                    care & 0xff, value & 0xff, self.wildcard)
+
+            symbols.extend(chunk)
+            care >>= 8
+            value >>= 8
+
+        del symbols[self._length:]
+        return symbols
+
+    def _position(self, i: int) -> int:
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("{} index out of range".format(self._name))
+        return i
+
+    @staticmethod
+    def _to_symbol(attr):
+        return attr
+
+
+class BinaryCondition(PackedSymbols, Condition):
+    """
+    Condition for binary environments. Instead of the list of symbols
+    attributes are stored as a pair of integer bit masks, so that matching,
+    specificity and subsumption checks are just a few bitwise operations.
+
+    Only '0', '1' and the wildcard symbols are allowed.
+    """
+
+    _name = 'Condition'
+
+    def __init__(self, observation, wildcard='#', oktypes=(str,)) -> None:
+        self.oktypes = oktypes
+        self.wildcard = wildcard
+        self._length = len(observation)
+        self._care, self._value = pack(observation, wildcard)
+
+    @property
+    def specificity(self) -> int:
+        return bin(self._care).count('1')
+
+    def specialize_with_condition(self, other: Condition) -> None:
+        care, value = pack(other, self.wildcard)
+        self._hash = None
+        self._care |= care
+        self._value = (self._value & ~care) | value
+
+    def generalize(self, position=None):
+        self[position] = self.wildcard
+
+    def does_match(self, other: Union[Perception, Condition]) -> bool:
+        care, value = pack(other, self.wildcard)
+        return not (self._value ^ value) & self._care & care
+
+    def does_match_condition(self, other: Condition) -> bool:
+        return self.does_match(other)
@@ -0,0 +1,66 @@
+from lcs import Perception
+from . import Effect, ProbabilityEnhancedAttribute
+from .BinaryCondition import PackedSymbols, pack
+
+
+class BinaryEffect(PackedSymbols, Effect):
+    """
+    Effect for binary environments stored as a pair of integer bit masks
+    (see `BinaryCondition`).
+
+    Probability-Enhanced Effects are not supported. A probability-enhanced
+    attribute can be assigned only if it is reduced to a single symbol.
+    """
+
+    _name = 'Effect'
+
+    def __init__(self, observation, wildcard='#', oktypes=(str,)) -> None:
+        self.oktypes = oktypes
+        self.wildcard = wildcard
+        self._length = len(observation)
+        self._care, self._value = pack(
+            [self._to_symbol(attr) for attr in observation]
+            if not hasattr(observation, 'packed') else observation,
+            wildcard)
+
+    @property
+    def specify_change(self) -> bool:
+        return self._care != 0
+
+    def is_specializable(self, p0: Perception, p1: Perception) -> bool:
+        care0, value0 = pack(p0, self.wildcard)
+        care1, value1 = pack(p1, self.wildcard)
+        changed = ((value0 ^ value1) | (care0 ^ care1)) & care1
+
+        return not self._care & ~changed and \
+            not (self._value ^ value1) & self._care
+
+    def does_anticipate_correctly(self, p0: Perception, p1: Perception):
+        care0, value0 = pack(p0, self.wildcard)
+        care1, value1 = pack(p1, self.wildcard)
+        changed = (value0 ^ value1) | (care0 ^ care1)
+        unchanged_mask = ~self._care & ((1 << self._length) - 1)
+
+        return not changed & unchanged_mask and \
+            self.is_specializable(p0, p1)
+
+    def is_enhanced(self) -> bool:
+        return False
+
+    def update_enhanced_effect_probs(self, perception: Perception,
+                                     update_rate: float):
+        pass
+
+    def __str__(self):
+        return ''.join(self)
+
+    @staticmethod
+    def _to_symbol(attr):
+        if isinstance(attr, dict):
+            attr = ProbabilityEnhancedAttribute(attr)
+            if attr.is_enhanced():
+                raise TypeError(
+                    "Binary effect does not support enhanced attributes")
+            return attr.the_only_symbol()
+
+        return attr
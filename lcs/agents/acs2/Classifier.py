@@ -4,7 +4,7 @@ from typing import Optional, Union, Callable, List
 
 from lcs import Perception
 from . import Configuration, Condition, Effect, PMark
-from . import ProbabilityEnhancedAttribute
+from . import ProbabilityEnhancedAttribute, BinaryCondition, BinaryEffect
 
 import gym_maze
 
@@ -35,14 +35,25 @@ class Classifier(object):
         def build_perception_string(cls, initial,
                                     length=self.cfg.classifier_length,
                                     wildcard=self.cfg.classifier_wildcard):
+            if cls is Condition and type(initial) is Condition:
+                # Copy of the condition of another classifier. Effects are
+                # always rebuilt - enhanced attributes might get copied.
+                return Condition._trusted(
+                    list(initial), initial.oktypes, wildcard)
+
             if initial:
                 return cls(initial, wildcard=wildcard)
 
             return cls.empty(wildcard=wildcard, length=length)
 
-        self.condition = build_perception_string(Condition, condition)
+        if self.cfg.use_bit_packing:
+            condition_cls, effect_cls = BinaryCondition, BinaryEffect
+        else:
+            condition_cls, effect_cls = Condition, Effect
+
+        self.condition = build_perception_string(condition_cls, condition)
         self.action = action
-        self.effect = build_perception_string(Effect, effect)
+        self.effect = build_perception_string(effect_cls, effect)
 
         self.mark = PMark(cfg=self.cfg)
 
@@ -74,15 +85,20 @@ class Classifier(object):
         self.ee = False
 
     def __eq__(self, other):
-        if self.condition == other.condition and \
-                self.action == other.action and \
+        if self is other:
+            return True
+
+        # Conditions and effects with already calculated (cached) hashes
+        # are told apart without comparing their attributes
+        if self.action == other.action and \
+                self.condition == other.condition and \
                 self.effect == other.effect:
             return True
 
         return False
 
     def __hash__(self):
-        return hash((str(self.condition), self.action, str(self.effect)))
+        return hash((hash(self.condition), self.action, hash(self.effect)))
 
     def __repr__(self):
         return "{} {:2} {:16} {:21} q: {:<5.3} r: {:<6.4} ir: {:<6.4} " \
@@ -122,8 +138,7 @@ class Classifier(object):
             copied classifier
         """
         new_cls = cls(
-            condition=Condition(old_cls.condition,
-                                old_cls.cfg.classifier_wildcard),
+            condition=old_cls.condition,
             action=old_cls.action,
             effect=old_cls.effect,
             quality=old_cls.q,
@@ -231,11 +246,11 @@ class Classifier(object):
                 if self.effect[idx] == self.cfg.classifier_wildcard:
                     self.effect[idx] = situation[idx]
                 else:
-                    if not isinstance(self.effect[idx],
-                                      ProbabilityEnhancedAttribute):
-                        self.effect[idx] = ProbabilityEnhancedAttribute(
-                            self.effect[idx])
-                    self.effect[idx].insert_symbol(situation[idx])
+                    attr = self.effect[idx]
+                    if not isinstance(attr, ProbabilityEnhancedAttribute):
+                        attr = ProbabilityEnhancedAttribute(attr)
+                    attr.insert_symbol(situation[idx])
+                    self.effect[idx] = attr
                 self.condition[idx] = previous_situation[idx]
 
     def merge_with(self, other_classifier, perception, time):
@@ -330,28 +345,8 @@ class Classifier(object):
             True if classifier's effect pat anticipates correctly,
             False otherwise
         """
-        def effect_item_is_correct(effect_item, p0_item, p1_item):
-            if not isinstance(effect_item, ProbabilityEnhancedAttribute):
-                if effect_item == self.cfg.classifier_wildcard:
-                    if p0_item != p1_item:
-                        return False
-                else:
-                    if p0_item == p1_item:
-                        return False
-
-                    if effect_item != p1_item:
-                        return False
-            else:
-                if not effect_item.does_contain(p1_item):
-                    return False
-
-            # All checks passed
-            return True
-
-        return all(effect_item_is_correct(eitem,
-                                          previous_situation[idx],
-                                          situation[idx])
-                   for idx, eitem in enumerate(self.effect))
+        return self.effect.does_anticipate_correctly(previous_situation,
+                                                     situation)
 
     def set_mark(self, perception: Perception) -> None:
         """
@@ -1,14 +1,19 @@
 import random
 import logging
 from itertools import chain
-from typing import Optional, List
+from typing import Dict, Hashable, Optional, List, Sequence
+
+import numpy as np
 
 import lcs.strategies.anticipatory_learning_process as alp
 import lcs.strategies.genetic_algorithms as ga
 import lcs.strategies.reinforcement_learning as rl
-from lcs import Perception, TypedList
+import lcs.strategies.selection as selection
+from lcs import Perception, TypedList, IdentityIndex, SimilarityIndex, \
+    profiling
+from lcs.Perception import perception_key
 from lcs.agents.acs2 import Configuration
-from . import Classifier
+from . import Classifier, MatchIndex, MatchSetCache, ClassifiersStore
 from .components import alp as alp_acs2
 
 
@@ -16,16 +21,295 @@ class ClassifiersList(TypedList):
     """
     Represents overall population, match/action sets
     """
+    match_index: Optional[MatchIndex] = None
+    match_set_cache: Optional[MatchSetCache] = None
+    store: Optional[ClassifiersStore] = None
+    identity_index: Optional[IdentityIndex] = None
+    similarity_index: Optional[SimilarityIndex] = None
+
     def __init__(self, *args) -> None:
         super().__init__((Classifier, ), *args)
 
+    @classmethod
+    def _trusted(cls, items: List[Classifier], oktypes=(Classifier, )):
+        return super()._trusted(items, oktypes)
+
+    def build_match_index(self, wildcard='#') -> None:
+        """
+        Enables the bitmap index used for forming match sets. From now on
+        the index is kept up to date by every insertion and removal.
+
+        Conditions of classifiers already in the list should not be
+        modified in place without calling `refresh` afterwards.
+
+        Parameters
+        ----------
+        wildcard
+            classifier wildcard symbol
+        """
+        index = MatchIndex(wildcard)
+        index.rebuild(self)
+        self.match_index = index
+
+    def build_match_set_cache(self) -> None:
+        """
+        Enables caching match sets formed for the same perceptions.
+        The cache is kept up to date by every insertion and removal.
+
+        Conditions of classifiers already in the list should not be
+        modified in place without calling `refresh` afterwards.
+        """
+        self.match_set_cache = MatchSetCache()
+
+    def build_identity_index(self) -> None:
+        """
+        Enables finding positions of classifiers by identity, so removing
+        them (`safe_remove`) does not compare classifiers with each other.
+        From now on the index is kept up to date by every insertion and
+        removal.
+        """
+        self.identity_index = IdentityIndex(self)
+
+    def build_similarity_index(self) -> None:
+        """
+        Enables looking up similar classifiers and possible subsumers
+        of new classifiers in hashed buckets instead of scanning the
+        action set. From now on the index is kept up to date by every
+        insertion and removal.
+        """
+        self.similarity_index = SimilarityIndex(self)
+
+    def refresh(self, cl: Classifier) -> None:
+        """
+        Updates population indices (and the parameter store) after the
+        condition or the effect of the classifier was modified in place.
+
+        Parameters
+        ----------
+        cl: Classifier
+            modified classifier
+        """
+        if self.store is not None:
+            self.store.refresh(cl)
+
+        if self.similarity_index is not None:
+            self.similarity_index.update(cl)
+
+        if self.match_index is not None:
+            self.match_index.update(cl)
+
+        if self.match_set_cache is not None:
+            self.match_set_cache.invalidate()
+
+    def build_store(self) -> None:
+        """
+        Moves numerical parameters of all classifiers into the
+        struct-of-arrays `ClassifiersStore`. From now on every inserted
+        classifier is adopted by the store and every removed one is
+        released from it.
+
+        Sets containing only stored classifiers (like match or action sets
+        formed from this population) are then processed with batched
+        array operations.
+        """
+        store = ClassifiersStore(capacity=max(len(self), 64))
+        for cl in self:
+            store.adopt(cl)
+        self.store = store
+
+    def arrays(self, *names: str) -> Optional[List[np.ndarray]]:
+        """
+        Returns arrays of given parameters (i.e. 'q', 'num') of classifiers
+        in the list. Available only if all classifiers are kept in the same
+        `ClassifiersStore`, otherwise None is returned.
+
+        Returns
+        -------
+        Optional[List[np.ndarray]]
+            list of arrays, one for each parameter name
+        """
+        batch = self.batch()
+        if batch is None:
+            return None
+
+        store, slots = batch
+        return [getattr(store, name)[slots] for name in names]
+
+    def batch(self):
+        """
+        Returns the `ClassifiersStore` and the array of slots of all
+        classifiers in the list or None if they are not kept in the same
+        store.
+        """
+        if self.store is not None:
+            return self.store, np.flatnonzero(self.store.live)
+
+        if len(self) == 0:
+            return None
+
+        store = getattr(self._items[0], '_store', None)
+        if store is None:
+            return None
+
+        slots = store.slots(self._items)
+        if slots is None:
+            return None
+
+        return store, slots
+
+    def insert(self, index: int, o) -> None:
+        appended = index >= len(self)
+        super().insert(index, o)
+
+        if self.store is not None:
+            self.store.adopt(o)
+
+        if self.match_index is not None:
+            if appended:
+                self.match_index.add(o)
+            else:
+                self.match_index.rebuild(self)
+
+        if self.match_set_cache is not None:
+            if appended:
+                self.match_set_cache.added(o)
+            else:
+                self.match_set_cache.invalidate()
+
+        if self.identity_index is not None:
+            if appended:
+                self.identity_index.append(o)
+            else:
+                self.identity_index.rebuild(self)
+
+        if self.similarity_index is not None:
+            if appended:
+                self.similarity_index.add(o)
+            else:
+                self.similarity_index.rebuild(self)
+
+    def safe_remove(self, o) -> None:
+        if self.identity_index is not None:
+            position = self.identity_index.position(o)
+            if position is not None:
+                del self[position]
+                return
+
+        super().safe_remove(o)
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        if self.match_index is not None:
+            self.match_index.rebuild(self)
+
+        if self.match_set_cache is not None:
+            self.match_set_cache.invalidate()
+
+        if self.identity_index is not None:
+            self.identity_index.rebuild(self)
+
+        if self.similarity_index is not None:
+            self.similarity_index.rebuild(self)
+
+    def __setitem__(self, i, o):
+        replaced = self[i]
+        super().__setitem__(i, o)
+
+        if self.store is not None:
+            if all(cl is not replaced for cl in self._items):
+                self.store.release(replaced)
+            self.store.adopt(o)
+
+        if self.match_index is not None:
+            self.match_index.rebuild(self)
+
+        if self.match_set_cache is not None:
+            self.match_set_cache.invalidate()
+
+        if self.identity_index is not None:
+            self.identity_index.rebuild(self)
+
+        if self.similarity_index is not None:
+            self.similarity_index.rebuild(self)
+
+    def __delitem__(self, i):
+        removed = self[i] if isinstance(i, slice) else [self[i]]
+        super().__delitem__(i)
+
+        if self.store is not None:
+            for cl in removed:
+                self.store.release(cl)
+
+        if self.match_index is not None:
+            if isinstance(i, slice):
+                self.match_index.rebuild(self)
+            else:
+                self.match_index.remove(removed[0])
+
+        if self.match_set_cache is not None:
+            for cl in removed:
+                self.match_set_cache.removed(cl)
+
+        if self.identity_index is not None:
+            if isinstance(i, slice):
+                self.identity_index.rebuild(self)
+            else:
+                self.identity_index.remove(removed[0])
+
+        if self.similarity_index is not None:
+            if isinstance(i, slice):
+                self.similarity_index.rebuild(self)
+            else:
+                self.similarity_index.remove(removed[0])
+
     def form_match_set(self, situation: Perception) -> "ClassifiersList":
-        matching = [cl for cl in self if cl.condition.does_match(situation)]
-        return ClassifiersList(*matching)
+        if self.match_set_cache is not None:
+            return ClassifiersList._trusted(list(self.match_set_cache.match(
+                situation, lambda: self._matching(situation))))
+
+        return ClassifiersList._trusted(self._matching(situation))
+
+    def form_match_sets(self, situations: Sequence[Perception]) \
+            -> List["ClassifiersList"]:
+        """
+        Forms match sets for many situations at once (i.e. perceived in
+        multiple copies of the environment). Every distinct situation
+        is matched with the population only once.
+
+        Parameters
+        ----------
+        situations: Sequence[Perception]
+            perceptions
+
+        Returns
+        -------
+        List[ClassifiersList]
+            match sets in the order of situations
+        """
+        formed: Dict[Hashable, ClassifiersList] = {}
+        match_sets = []
+
+        for situation in situations:
+            key = perception_key(situation)
+            match_set = formed.get(key)
+            if match_set is None:
+                match_set = formed[key] = self.form_match_set(situation)
+            else:
+                match_set = ClassifiersList._trusted(list(match_set))
+
+            match_sets.append(match_set)
+
+        return match_sets
+
+    def _matching(self, situation: Perception) -> List[Classifier]:
+        if self.match_index is not None:
+            return self.match_index.match(situation)
+
+        return [cl for cl in self if cl.condition.does_match(situation)]
 
     def form_action_set(self, action: int) -> "ClassifiersList":
         matching = [cl for cl in self if cl.action == action]
-        return ClassifiersList(*matching)
+        return ClassifiersList._trusted(matching)
 
     def expand(self) -> List[Classifier]:
         """
@@ -49,6 +333,11 @@ class ClassifiersList(TypedList):
         float
             fitness value
         """
+        batch = self.batch()
+        if batch is not None:
+            store, slots = batch
+            return store.maximum_fitness(slots)
+
         anticipated_change_cls = [cl for cl in self
                                   if cl.does_anticipate_change()]
 
@@ -69,8 +358,8 @@ class ClassifiersList(TypedList):
         candidates = [classifier for classifier in action_set if classifier.is_enhanceable()]
 
         logging.debug(
-            "Applying enhanced effect part; number of candidates={}; previous situation: {}".format(
-                len(candidates), previous_situation))
+            "Applying enhanced effect part; number of candidates=%d; "
+            "previous situation: %s", len(candidates), previous_situation)
 
         # If there's no more than one candidate, it's not worth an effort
         if len(candidates) < 2:
@@ -136,7 +425,14 @@ class ClassifiersList(TypedList):
             all_anticipations += 1
             if cl.does_anticipate_correctly(p0, p1):
                 correct_anticipations += 1
+                specificity = cl.condition.specificity
                 new_cl = alp_acs2.expected_case(cl, p0, time)
+                if cl.condition.specificity != specificity:
+                    # Expected case generalized the condition in place
+                    population.refresh(cl)
+                elif cfg.do_pee and population.store is not None:
+                    # Enhanced effect probabilities were updated in place
+                    population.store.refresh(cl)
                 was_expected_case = True
             else:
                 new_cl = alp_acs2.unexpected_case(cl, p0, p1, time)
@@ -145,6 +441,7 @@ class ClassifiersList(TypedList):
                     # Removes classifier from population, match set
                     # and current list
                     delete_count += 1
+                    profiling.count('inadequate')
                     lists = [x for x in [population, match_set, action_set]
                              if x]
                     for lst in lists:
@@ -152,7 +449,8 @@ class ClassifiersList(TypedList):
 
             if new_cl is not None:
                 new_cl.tga = time
-                alp.add_classifier(new_cl, action_set, new_list, theta_exp)
+                alp.add_classifier(new_cl, action_set, new_list, theta_exp,
+                                   population.similarity_index)
 
         if cfg.do_pee:
             ClassifiersList.apply_enhanced_effect_part_check(action_set,
@@ -163,8 +461,10 @@ class ClassifiersList(TypedList):
 
         # No classifier anticipated correctly - generate new one
         if not was_expected_case:
+            profiling.count('covering')
             new_cl = alp_acs2.cover(p0, action, p1, time, cfg)
-            alp.add_classifier(new_cl, action_set, new_list, theta_exp)
+            alp.add_classifier(new_cl, action_set, new_list, theta_exp,
+                               population.similarity_index)
 
         # Merge classifiers from new_list into self and population
         action_set.extend(new_list)
@@ -183,8 +483,7 @@ class ClassifiersList(TypedList):
                                      p: float,
                                      beta: float,
                                      gamma: float) -> None:
-        for cl in action_set:
-            rl.update_classifier(cl, reward, p, beta, gamma)
+        rl.update_classifiers(action_set, reward, p, beta, gamma)
 
     @staticmethod
     def apply_ga(time: int,
@@ -203,8 +502,14 @@ class ClassifiersList(TypedList):
             ga.set_timestamps(action_set, time)
 
             # Select parents
-            parent1, parent2 = ga.roulette_wheel_selection(
-                action_set, lambda cl: pow(cl.q, 3) * cl.num)
+            arrays = action_set.arrays('q', 'num')
+            if arrays is not None:
+                q, num = arrays
+                parent1, parent2 = selection.roulette_wheel(
+                    action_set, q ** 3 * num, k=2)
+            else:
+                parent1, parent2 = ga.roulette_wheel_selection(
+                    action_set, lambda cl: pow(cl.q, 3) * cl.num)
 
             child1 = Classifier.copy_from(parent1, time)
             child2 = Classifier.copy_from(parent2, time)
@@ -226,8 +531,10 @@ class ClassifiersList(TypedList):
             child2.q /= 2
 
             # We are interested only in classifiers with specialized condition
-            unique_children = {cl for cl in [child1, child2]
-                               if cl.condition.specificity > 0}
+            # (in the order of creation, regardless of their hashes)
+            unique_children = list(dict.fromkeys(
+                cl for cl in [child1, child2]
+                if cl.condition.specificity > 0))
 
             ga.delete_classifiers(
                 population, match_set, action_set,
@@ -0,0 +1,198 @@
+import math
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from . import Classifier
+
+FLOAT_PARAMETERS = ('q', 'r', 'ir', 'tav')
+INT_PARAMETERS = ('num', 'exp', 'tga')
+PARAMETERS = FLOAT_PARAMETERS + INT_PARAMETERS + ('talp',)
+
+
+class ClassifiersStore:
+    """
+    Struct-of-arrays storage for numerical parameters of classifiers.
+
+    Each adopted classifier gets a slot in contiguous NumPy arrays holding
+    its quality, reward, immediate reward, numerosity, experience and time
+    stamps. The classifier object itself becomes a `StoredClassifier` -
+    a thin view reading and writing these arrays - so it can be still used
+    everywhere a `Classifier` is expected, while whole sets of classifiers
+    can be processed with batched array operations.
+
+    Additionally the store caches whether the classifier anticipates
+    a change (`change` array). Call `refresh` (or `ClassifiersList.refresh`)
+    after the effect of a stored classifier is modified in place.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.q = np.zeros(capacity, dtype=np.float64)
+        self.r = np.zeros(capacity, dtype=np.float64)
+        self.ir = np.zeros(capacity, dtype=np.float64)
+        self.tav = np.zeros(capacity, dtype=np.float64)
+        self.num = np.zeros(capacity, dtype=np.int64)
+        self.exp = np.zeros(capacity, dtype=np.int64)
+        self.tga = np.zeros(capacity, dtype=np.int64)
+        # Not yet applied classifiers have no ALP time stamp (NaN)
+        self.talp = np.full(capacity, np.nan, dtype=np.float64)
+        self.change = np.zeros(capacity, dtype=bool)
+        self.live = np.zeros(capacity, dtype=bool)
+
+        self._free: List[int] = list(reversed(range(capacity)))
+
+    def __len__(self) -> int:
+        return int(self.live.sum())
+
+    def adopt(self, cl: Classifier) -> None:
+        """
+        Moves numerical parameters of the classifier to the store.
+        The classifier becomes a view on the store.
+
+        Parameters
+        ----------
+        cl: Classifier
+            classifier to be adopted
+        """
+        if isinstance(cl, StoredClassifier):
+            if cl._store is self:
+                return
+            raise ValueError("Classifier is already kept in other store")
+
+        if not self._free:
+            self._grow()
+
+        slot = self._free.pop()
+        attributes = cl.__dict__
+
+        for name in FLOAT_PARAMETERS + INT_PARAMETERS:
+            getattr(self, name)[slot] = attributes.pop(name)
+
+        talp = attributes.pop('talp')
+        self.talp[slot] = np.nan if talp is None else talp
+        self.change[slot] = cl.does_anticipate_change()
+        self.live[slot] = True
+
+        attributes['_store'] = self
+        attributes['_slot'] = slot
+        cl.__class__ = StoredClassifier
+
+    def release(self, cl: Classifier) -> None:
+        """
+        Moves the parameters back to the classifier object and frees
+        its slot. Nothing happens if the classifier is not kept here.
+
+        Parameters
+        ----------
+        cl: Classifier
+            stored classifier
+        """
+        if not isinstance(cl, StoredClassifier) or cl._store is not self:
+            return
+
+        slot = cl._slot
+        values = {name: getattr(cl, name) for name in PARAMETERS}
+
+        cl.__class__ = Classifier
+        del cl.__dict__['_store']
+        del cl.__dict__['_slot']
+        cl.__dict__.update(values)
+
+        self.live[slot] = False
+        self.change[slot] = False
+        self._free.append(slot)
+
+    def refresh(self, cl: Classifier) -> None:
+        """
+        Updates cached properties after the classifier effect was modified
+        in place.
+        """
+        if isinstance(cl, StoredClassifier) and cl._store is self:
+            self.change[cl._slot] = cl.does_anticipate_change()
+
+    def slots(self, classifiers: Iterable) -> Optional[np.ndarray]:
+        """
+        Returns the array of slots occupied by given classifiers or None
+        if any of them is not kept in this store.
+        """
+        slots = []
+        for cl in classifiers:
+            if getattr(cl, '_store', None) is not self:
+                return None
+            slots.append(cl._slot)
+
+        return np.array(slots, dtype=np.intp)
+
+    def maximum_fitness(self, slots) -> float:
+        """
+        Returns the maximum fitness amongst the classifiers (in given
+        slots) anticipating a change, 0.0 if there are none.
+        """
+        anticipating = slots[self.change[slots]]
+        if len(anticipating) == 0:
+            return 0.0
+
+        return float((self.q[anticipating] * self.r[anticipating]).max())
+
+    def _grow(self) -> None:
+        capacity = len(self.live)
+        new_capacity = max(2 * capacity, 1)
+
+        for name in PARAMETERS + ('change', 'live'):
+            old = getattr(self, name)
+            fill = np.nan if name == 'talp' else 0
+            new = np.full(new_capacity, fill, dtype=old.dtype)
+            new[:capacity] = old
+            setattr(self, name, new)
+
+        self._free.extend(reversed(range(capacity, new_capacity)))
+
+
+def _float_parameter(name: str) -> property:
+    def fget(self):
+        return float(getattr(self._store, name)[self._slot])
+
+    def fset(self, value):
+        getattr(self._store, name)[self._slot] = value
+
+    return property(fget, fset)
+
+
+def _int_parameter(name: str) -> property:
+    def fget(self):
+        return int(getattr(self._store, name)[self._slot])
+
+    def fset(self, value):
+        getattr(self._store, name)[self._slot] = value
+
+    return property(fget, fset)
+
+
+def _talp_fget(self):
+    talp = self._store.talp[self._slot]
+    return None if math.isnan(talp) else int(talp)
+
+
+def _talp_fset(self, value):
+    self._store.talp[self._slot] = np.nan if value is None else value
+
+
+class StoredClassifier(Classifier):
+    """
+    Classifier which numerical parameters are kept in `ClassifiersStore`.
+    Classifiers become stored ones when they are adopted by the store,
+    they should not be created directly.
+    """
+
+    q = _float_parameter('q')
+    r = _float_parameter('r')
+    ir = _float_parameter('ir')
+    tav = _float_parameter('tav')
+    num = _int_parameter('num')
+    exp = _int_parameter('exp')
+    tga = _int_parameter('tga')
+    talp = property(_talp_fget, _talp_fset)
+
+    @classmethod
+    def copy_from(cls, old_cls: Classifier, time: int):
+        return Classifier.copy_from(old_cls, time)
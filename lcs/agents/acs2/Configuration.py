@@ -1,3 +1,4 @@
+from .Alphabet import Alphabet
 from .EnvironmentAdapter import EnvironmentAdapter
 
 
@@ -7,12 +8,22 @@ class Configuration:
                  number_of_possible_actions,
                  classifier_wildcard='#',
                  environment_adapter=EnvironmentAdapter,
+                 alphabet=None,
                  environment_metrics_fcn=None,
                  performance_fcn=None,
                  performance_fcn_params={},
                  do_pee=False,
                  do_ga=False,
                  do_subsumption=True,
+                 use_match_index=False,
+                 use_match_set_cache=False,
+                 use_bit_packing=False,
+                 use_array_store=False,
+                 use_identity_index=False,
+                 use_similarity_index=False,
+                 use_profiler=False,
+                 checkpoint_path=None,
+                 checkpoint_frequency=0,
                  beta=0.05,
                  gamma=0.95,
                  theta_i=0.1,
@@ -33,6 +44,10 @@ class Configuration:
         :param classifier_wildcard: wildcard symbol
         :param environment_adapter: EnvironmentAdapter class ACS2 needs to use
             to interact with the environment
+        :param alphabet: symbols perceived in the environment (`Alphabet`
+            or iterable of symbols), perceived symbols are replaced with
+            canonical ones. By default taken from the environment adapter
+            (no replacing when not specified there)
         :param environment_metrics_fcn:
         :param performance_fcn: function for estimating agent performance
         :param performance_fcn_params: optional parameters needed for
@@ -40,6 +55,24 @@ class Configuration:
         :param do_pee: whether to use Probability-Enhanced Effects
         :param do_ga: switch *Genetic Generalization* module
         :param do_subsumption:
+        :param use_match_index: whether to index the population conditions
+            to speed up forming match sets
+        :param use_match_set_cache: whether to reuse match sets formed
+            for the same perceptions (deterministic environments)
+        :param use_bit_packing: whether to store conditions and effects
+            as bit masks (binary environments without PEE only)
+        :param use_array_store: whether to keep numerical parameters of
+            the population in NumPy arrays allowing batched updates
+        :param use_identity_index: whether to find classifiers removed
+            from the population by identity instead of comparing them
+        :param use_similarity_index: whether to look up similar classifiers
+            and subsumers of new classifiers in hashed buckets
+        :param use_profiler: whether to measure time spent in phases of
+            the learning cycle (reported in trial metrics)
+        :param checkpoint_path: file where the population is periodically
+            saved during training (may contain `{trial}` placeholder)
+        :param checkpoint_frequency: number of trials between checkpoints
+            (0 disables checkpointing)
         :param beta:
         :param gamma:
         :param theta_i: inadequacy threshold
@@ -58,12 +91,28 @@ class Configuration:
         self.number_of_possible_actions = number_of_possible_actions
         self.classifier_wildcard = classifier_wildcard
         self.environment_adapter = environment_adapter
+        if alphabet is None:
+            alphabet = getattr(environment_adapter, 'alphabet', None)
+        if alphabet is not None and not isinstance(alphabet, Alphabet):
+            alphabet = Alphabet(alphabet)
+        if alphabet is not None and classifier_wildcard in alphabet:
+            raise ValueError("Wildcard can't be a symbol of the alphabet")
+        self.alphabet = alphabet
         self.environment_metrics_fcn = environment_metrics_fcn
         self.performance_fcn = performance_fcn
         self.performance_fcn_params = performance_fcn_params
         self.do_pee = do_pee
         self.do_ga = do_ga
         self.do_subsumption = do_subsumption
+        self.use_match_index = use_match_index
+        self.use_match_set_cache = use_match_set_cache
+        self.use_bit_packing = use_bit_packing
+        self.use_array_store = use_array_store
+        self.use_identity_index = use_identity_index
+        self.use_similarity_index = use_similarity_index
+        self.use_profiler = use_profiler
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_frequency = checkpoint_frequency
         self.theta_exp = theta_exp
         self.beta = beta
         self.gamma = gamma
@@ -107,6 +107,48 @@ class Effect(PerceptionString):
 
         return True
 
+    def does_anticipate_correctly(self,
+                                  p0: Perception,
+                                  p1: Perception) -> bool:
+        """
+        Checks anticipation. While the pass-through symbols directly
+        anticipate that these attributes stay the same, the specified
+        attributes anticipate a change to the specified value.
+
+        Parameters
+        ----------
+        p0: Perception
+            previous perception
+        p1: Perception
+            current perception
+
+        Returns
+        -------
+        bool
+            True if the change from `p0` to `p1` is anticipated correctly,
+            False otherwise
+        """
+        def effect_item_is_correct(effect_item, p0_item, p1_item):
+            if not isinstance(effect_item, ProbabilityEnhancedAttribute):
+                if effect_item == self.wildcard:
+                    if p0_item != p1_item:
+                        return False
+                else:
+                    if p0_item == p1_item:
+                        return False
+
+                    if effect_item != p1_item:
+                        return False
+            else:
+                if not effect_item.does_contain(p1_item):
+                    return False
+
+            # All checks passed
+            return True
+
+        return all(effect_item_is_correct(eitem, p0[idx], p1[idx])
+                   for idx, eitem in enumerate(self))
+
     def is_enhanced(self) -> bool:
         """
         Checks whether any element of the Effect is Probability-Enhanced.
@@ -136,6 +178,18 @@ class Effect(PerceptionString):
                 effect_symbol = perception[i]
                 elem.increase_probability(effect_symbol, update_rate)
 
+    def __hash__(self):
+        if self._hash is not None:
+            return self._hash
+
+        if not any(isinstance(attr, ProbabilityEnhancedAttribute)
+                   for attr in self):
+            return super().__hash__()
+
+        # Enhanced attributes are modified in place, so the hash can't be
+        # cached. They are equal to the symbol they are reduced to.
+        return hash(tuple(_symbols(attr) for attr in self))
+
     def __str__(self):
         if DETAILED_PEE_PRINTING:
             return ''.join(str(attr) for attr in self)
@@ -145,3 +199,14 @@ class Effect(PerceptionString):
             else:
                 assert all(isinstance(attr, str) for attr in self)
                 return ''.join(attr for attr in self)
+
+
+def _symbols(attr):
+    if not isinstance(attr, ProbabilityEnhancedAttribute):
+        return attr
+
+    symbols = attr.symbols_specified()
+    if len(symbols) == 1:
+        return symbols.pop()
+
+    return frozenset(symbols)
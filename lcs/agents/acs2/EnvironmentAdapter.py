@@ -14,8 +14,13 @@ class EnvironmentAdapter:
 
     Subclass this class in pyALCS integration to provide an adapter
     for a specific environment.
+
+    Adapters can declare the `alphabet` of symbols perceived by the agent
+    (see `Alphabet`), it is used unless specified in the configuration.
     """
 
+    alphabet = None
+
     @staticmethod
     def to_lcs_action(env_action):
         """
@@ -0,0 +1,177 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lcs import Perception
+
+
+class MatchIndex:
+    """
+    Per-attribute bitmap index over the conditions of a population.
+
+    Every indexed classifier owns a slot (a bit position). For each
+    condition attribute the index keeps a bitmap of classifiers specifying
+    that attribute and a bitmap per specified symbol. A perception is then
+    matched with a few big-integer operations per attribute instead of
+    comparing every classifier condition symbol by symbol.
+
+    Slots are assigned in insertion order and never reused until the index
+    is compacted, so classifiers retrieved from the bitmap come back in the
+    same order as they were appended to the population.
+    """
+
+    def __init__(self, wildcard='#') -> None:
+        self.wildcard = wildcard
+        self._clear()
+
+    def _clear(self) -> None:
+        self._slots: List = []
+        self._conditions: List[Optional[Tuple]] = []
+        self._slot_of: Dict[int, int] = {}
+        self._live = 0
+        self._specified: List[int] = []
+        self._symbols: List[Dict] = []
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def __contains__(self, cl) -> bool:
+        return id(cl) in self._slot_of
+
+    def add(self, cl) -> None:
+        """
+        Appends the classifier to the index (as the last one).
+
+        Parameters
+        ----------
+        cl:
+            classifier to be indexed
+        """
+        if id(cl) in self._slot_of:
+            return
+
+        slot = len(self._slots)
+        condition = tuple(cl.condition)
+
+        self._slots.append(cl)
+        self._conditions.append(condition)
+        self._slot_of[id(cl)] = slot
+        self._mark(slot, condition)
+
+    def remove(self, cl) -> None:
+        """
+        Removes the classifier from the index. Nothing happens if it was
+        not indexed.
+
+        Parameters
+        ----------
+        cl:
+            classifier to be removed
+        """
+        slot = self._slot_of.pop(id(cl), None)
+        if slot is None:
+            return
+
+        self._unmark(slot, self._conditions[slot])
+        self._slots[slot] = None
+        self._conditions[slot] = None
+
+        # Compact the bitmaps when most of the slots are dead
+        if len(self._slots) > 64 and \
+                len(self._slot_of) < len(self._slots) // 2:
+            self.rebuild([c for c in self._slots if c is not None])
+
+    def update(self, cl) -> None:
+        """
+        Re-indexes the classifier if its condition was modified in place
+        while being a part of the population.
+
+        Parameters
+        ----------
+        cl:
+            indexed classifier
+        """
+        slot = self._slot_of.get(id(cl))
+        if slot is None:
+            return
+
+        condition = tuple(cl.condition)
+        if condition != self._conditions[slot]:
+            self._unmark(slot, self._conditions[slot])
+            self._conditions[slot] = condition
+            self._mark(slot, condition)
+
+    def rebuild(self, classifiers: Iterable) -> None:
+        """
+        Drops the current content and indexes `classifiers` in given order.
+        """
+        self._clear()
+        for cl in classifiers:
+            self.add(cl)
+
+    def match(self, situation: Perception) -> List:
+        """
+        Returns all indexed classifiers which condition matches given
+        situation. The result is the same as checking
+        `cl.condition.does_match(situation)` for every classifier.
+
+        Parameters
+        ----------
+        situation: Perception
+            current perception
+
+        Returns
+        -------
+        List
+            matching classifiers ordered by insertion
+        """
+        mask = self._live
+
+        for idx, symbol in enumerate(situation):
+            if not mask:
+                break
+            if idx >= len(self._specified) or symbol == self.wildcard:
+                continue
+
+            mismatch = self._specified[idx] ^ self._symbols[idx].get(symbol, 0)
+            mask &= ~mismatch
+
+        return self._decode(mask)
+
+    def _decode(self, mask: int) -> List:
+        bits = bin(mask)[:1:-1]
+        slots = self._slots
+        result = []
+
+        pos = bits.find('1')
+        while pos != -1:
+            result.append(slots[pos])
+            pos = bits.find('1', pos + 1)
+
+        return result
+
+    def _mark(self, slot: int, condition: Tuple) -> None:
+        bit = 1 << slot
+        self._live |= bit
+
+        while len(self._specified) < len(condition):
+            self._specified.append(0)
+            self._symbols.append({})
+
+        for idx, symbol in enumerate(condition):
+            if symbol != self.wildcard:
+                self._specified[idx] |= bit
+                symbols = self._symbols[idx]
+                symbols[symbol] = symbols.get(symbol, 0) | bit
+
+    def _unmark(self, slot: int, condition: Tuple) -> None:
+        bit = 1 << slot
+        self._live &= ~bit
+
+        for idx, symbol in enumerate(condition):
+            if symbol != self.wildcard:
+                self._specified[idx] &= ~bit
+                symbols = self._symbols[idx]
+                remaining = symbols[symbol] & ~bit
+                if remaining:
+                    symbols[symbol] = remaining
+                else:
+                    del symbols[symbol]
@@ -0,0 +1,112 @@
+from typing import Callable, Dict, Hashable, List, Tuple
+
+from lcs.Perception import perception_key
+
+
+class MatchSetCache:
+    """
+    Cache of match sets keyed by the perception.
+
+    In deterministic environments the agent perceives the same situations
+    over and over again. Every structural change of the population
+    (appending or removing a classifier) bumps the `generation` counter and
+    is recorded in a journal, so a match set cached in an older generation
+    is brought up to date by replaying only the changes made since then
+    (matching newly appended classifiers and dropping removed ones)
+    instead of scanning the whole population again.
+
+    Changes of classifiers numerosity or other parameters do not affect
+    the match sets and are not tracked. Any other change (inserting in
+    the middle, reordering, modifying a condition in place) must be
+    reported with `invalidate`.
+    """
+
+    def __init__(self, max_size: int = 4096, max_journal: int = 4096) -> None:
+        self.max_size = max_size
+        self.max_journal = max_journal
+        self.generation = 0
+
+        self._base = 0
+        self._journal: List[Tuple[bool, object]] = []
+        self._entries: Dict[Hashable, Tuple[int, List]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def added(self, cl) -> None:
+        """
+        Records the classifier appended at the end of the population.
+        """
+        self._record(True, cl)
+
+    def removed(self, cl) -> None:
+        """
+        Records the classifier removed from the population.
+        """
+        self._record(False, cl)
+
+    def invalidate(self) -> None:
+        """
+        Drops all cached match sets.
+        """
+        self.generation += 1
+        self._base = self.generation
+        self._journal.clear()
+        self._entries.clear()
+
+    def match(self, situation, form: Callable[[], List]) -> List:
+        """
+        Returns the list of classifiers matching the situation.
+
+        Parameters
+        ----------
+        situation
+            current perception
+        form: Callable
+            function forming the match set from scratch (called when
+            the situation is not cached)
+
+        Returns
+        -------
+        List
+            matching classifiers in the population order
+        """
+        key = perception_key(situation)
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] < self._base:
+            matching = list(form())
+        else:
+            generation, matching = entry
+            if generation != self.generation:
+                matching = self._patch(
+                    matching, situation, generation - self._base)
+        if entry is None and len(self._entries) >= self.max_size:
+            # Forget the oldest perception
+            del self._entries[next(iter(self._entries))]
+
+        self._entries[key] = (self.generation, matching)
+
+        return matching
+
+    def _patch(self, matching: List, situation, start: int) -> List:
+        matching = list(matching)
+
+        for added, cl in self._journal[start:]:
+            if added:
+                if cl.condition.does_match(situation):
+                    matching.append(cl)
+            else:
+                for idx, other in enumerate(matching):
+                    if other is cl:
+                        del matching[idx]
+                        break
+
+        return matching
+
+    def _record(self, added: bool, cl) -> None:
+        if len(self._journal) >= self.max_journal:
+            self.invalidate()
+
+        self._journal.append((added, cl))
+        self.generation += 1
@@ -1,15 +1,46 @@
 import random
-from typing import List
+from typing import FrozenSet, List, Optional
 
 from lcs import Perception, TypedList
 from . import Configuration, Condition
 
 
+_EMPTY: FrozenSet = frozenset()
+
+
 class PMark(TypedList):
+    """
+    Symbols marked for each attribute. Most classifiers are never marked,
+    so sets of symbols are created only when accessed by index (which
+    allows modifying them) - iterating over the mark yields a shared empty
+    set for attributes which were not accessed.
+    """
+
     def __init__(self, cfg: Configuration) -> None:
         self.cfg = cfg
-        initial: List = [set() for _ in range(self.cfg.classifier_length)]
-        super().__init__((set,), *initial)
+        super().__init__((set,))
+        self._items: List[Optional[set]] = \
+            [None] * self.cfg.classifier_length
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[idx] for idx in range(*i.indices(len(self)))]
+
+        item = self._items[i]
+        if item is None:
+            item = self._items[i] = set()
+
+        return item
+
+    def __iter__(self):
+        for item in self._items:
+            yield _EMPTY if item is None else item
+
+    def __eq__(self, other):
+        if not isinstance(other, PMark):
+            return NotImplemented
+
+        return list(self) == list(other)
 
     def is_marked(self) -> bool:
         """
@@ -18,7 +49,7 @@ class PMark(TypedList):
         bool
             If mark is specified at any attribute
         """
-        return any(len(attrib) != 0 for attrib in self)
+        return any(self._items)
 
     def complement_marks(self, perception: Perception) -> bool:
         """
@@ -75,8 +106,8 @@ class PMark(TypedList):
                 nr2 += 1
 
         if nr1 > 0:
-            possible_idx = [pi for pi, p in enumerate(p0) if
-                            p not in self[pi] and len(self[pi]) > 0]
+            possible_idx = [pi for pi, (p, item) in enumerate(zip(p0, self))
+                            if p not in item and len(item) > 0]
             rand_idx = random.choice(possible_idx)
             diff[rand_idx] = p0[rand_idx]
         elif nr2 > 0:
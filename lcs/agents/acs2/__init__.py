@@ -1,9 +1,15 @@
+from .Alphabet import Alphabet
 from .Configuration import Configuration
 from .EnvironmentAdapter import EnvironmentAdapter
 from .ProbabilityEnhancedAttribute import ProbabilityEnhancedAttribute
 from .Condition import Condition
 from .Effect import Effect
+from .BinaryCondition import BinaryCondition
+from .BinaryEffect import BinaryEffect
 from .PMark import PMark
 from .Classifier import Classifier
+from .MatchIndex import MatchIndex
+from .MatchSetCache import MatchSetCache
+from .ClassifiersStore import ClassifiersStore, StoredClassifier
 from .ClassifiersList import ClassifiersList
 from .ACS2 import ACS2
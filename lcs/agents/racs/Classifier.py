@@ -4,6 +4,7 @@ from typing import Optional, List, Callable
 from lcs import Perception
 from lcs.representations import UBR
 from . import Condition, Effect, Mark, Configuration
+from .EncodedPerception import encode
 
 
 class Classifier:
@@ -55,15 +56,20 @@ class Classifier:
         self.tav = tav
 
     def __eq__(self, other):
-        if self.condition == other.condition and \
-                self.action == other.action and \
+        if self is other:
+            return True
+
+        # Conditions and effects with already calculated (cached) hashes
+        # are told apart without comparing their attributes
+        if self.action == other.action and \
+                self.condition == other.condition and \
                 self.effect == other.effect:
             return True
 
         return False
 
     def __hash__(self):
-        return hash((str(self.condition), self.action, str(self.effect)))
+        return hash((hash(self.condition), self.action, hash(self.effect)))
 
     @classmethod
     def copy_from(cls, old_cls: "Classifier", time: int):
@@ -148,8 +154,8 @@ class Classifier:
             Requires the effect attribute to be a wildcard to specialize it.
             By default false
         """
-        p0_enc = list(map(self.cfg.encoder.encode, p0))
-        p1_enc = list(map(self.cfg.encoder.encode, p1))
+        p0_enc = encode(p0, self.cfg.encoder)
+        p1_enc = encode(p1, self.cfg.encoder)
 
         for idx, item in enumerate(p1_enc):
             if leave_specialized:
@@ -208,8 +214,8 @@ class Classifier:
         bool
             True if anticipation is correct, False otherwise
         """
-        p0_enc = list(map(self.cfg.encoder.encode, previous_situation))
-        p1_enc = list(map(self.cfg.encoder.encode, situation))
+        p0_enc = encode(previous_situation, self.cfg.encoder)
+        p1_enc = encode(situation, self.cfg.encoder)
 
         for idx, eitem in enumerate(self.effect):
             if eitem == self.cfg.classifier_wildcard:
@@ -2,28 +2,169 @@ import random
 from itertools import chain
 from typing import Optional, List
 
+import numpy as np
+
 import lcs.strategies.anticipatory_learning_process as alp
 import lcs.strategies.genetic_algorithms as ga
 import lcs.strategies.reinforcement_learning as rl
-from lcs import TypedList, Perception
+from lcs import TypedList, Perception, IdentityIndex, SimilarityIndex, \
+    profiling
 from lcs.agents.racs import Configuration
-from lcs.agents.racs.components.genetic_algorithm import mutate
-from . import Classifier
+from lcs.agents.racs.components.genetic_algorithm import mutate_many
+from . import Classifier, IntervalIndex
 from .components import alp as alp_racs
 
 
 class ClassifierList(TypedList):
+    interval_index: Optional[IntervalIndex] = None
+    identity_index: Optional[IdentityIndex] = None
+    similarity_index: Optional[SimilarityIndex] = None
 
     def __init__(self, *args) -> None:
         super().__init__((Classifier,), *args)
 
+    @classmethod
+    def _trusted(cls, items: List[Classifier], oktypes=(Classifier,)):
+        return super()._trusted(items, oktypes)
+
+    def build_interval_index(self, cfg: Configuration) -> None:
+        """
+        Enables the index of condition bounds used for forming match sets.
+        From now on the index is kept up to date by every insertion and
+        removal.
+
+        Conditions of classifiers already in the list should not be
+        modified in place without calling `refresh` afterwards.
+
+        Parameters
+        ----------
+        cfg: Configuration
+            agent configuration (classifier length and encoder)
+        """
+        index = IntervalIndex(cfg.classifier_length, cfg.encoder)
+        index.rebuild(self)
+        self.interval_index = index
+
+    def build_identity_index(self) -> None:
+        """
+        Enables finding positions of classifiers by identity, so removing
+        them (`safe_remove`) does not compare classifiers with each other.
+        From now on the index is kept up to date by every insertion and
+        removal.
+        """
+        self.identity_index = IdentityIndex(self)
+
+    def build_similarity_index(self) -> None:
+        """
+        Enables looking up similar classifiers and possible subsumers
+        of new classifiers in hashed buckets instead of scanning the
+        action set. From now on the index is kept up to date by every
+        insertion and removal.
+        """
+        self.similarity_index = SimilarityIndex(self)
+
+    def refresh(self, cl: Classifier) -> None:
+        """
+        Updates population indices after the condition of the classifier
+        was modified in place.
+
+        Parameters
+        ----------
+        cl: Classifier
+            modified classifier
+        """
+        if self.similarity_index is not None:
+            self.similarity_index.update(cl)
+
+        if self.interval_index is not None:
+            self.interval_index.update(cl)
+
+    def insert(self, index: int, o) -> None:
+        appended = index >= len(self)
+        super().insert(index, o)
+
+        if self.interval_index is not None:
+            if appended:
+                self.interval_index.add(o)
+            else:
+                self.interval_index.rebuild(self)
+
+        if self.identity_index is not None:
+            if appended:
+                self.identity_index.append(o)
+            else:
+                self.identity_index.rebuild(self)
+
+        if self.similarity_index is not None:
+            if appended:
+                self.similarity_index.add(o)
+            else:
+                self.similarity_index.rebuild(self)
+
+    def safe_remove(self, o) -> None:
+        if self.identity_index is not None:
+            position = self.identity_index.position(o)
+            if position is not None:
+                del self[position]
+                return
+
+        super().safe_remove(o)
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        if self.interval_index is not None:
+            self.interval_index.rebuild(self)
+
+        if self.identity_index is not None:
+            self.identity_index.rebuild(self)
+
+        if self.similarity_index is not None:
+            self.similarity_index.rebuild(self)
+
+    def __setitem__(self, i, o):
+        super().__setitem__(i, o)
+        if self.interval_index is not None:
+            self.interval_index.rebuild(self)
+
+        if self.identity_index is not None:
+            self.identity_index.rebuild(self)
+
+        if self.similarity_index is not None:
+            self.similarity_index.rebuild(self)
+
+    def __delitem__(self, i):
+        removed = self[i]
+        super().__delitem__(i)
+
+        if self.interval_index is not None:
+            if isinstance(i, slice):
+                self.interval_index.rebuild(self)
+            else:
+                self.interval_index.remove(removed)
+
+        if self.identity_index is not None:
+            if isinstance(i, slice):
+                self.identity_index.rebuild(self)
+            else:
+                self.identity_index.remove(removed)
+
+        if self.similarity_index is not None:
+            if isinstance(i, slice):
+                self.similarity_index.rebuild(self)
+            else:
+                self.similarity_index.remove(removed)
+
     def form_match_set(self, situation: Perception) -> "ClassifierList":
+        if self.interval_index is not None:
+            return ClassifierList._trusted(
+                self.interval_index.match(situation))
+
         matching = [cl for cl in self if cl.condition.does_match(situation)]
-        return ClassifierList(*matching)
+        return ClassifierList._trusted(matching)
 
     def form_action_set(self, action: int) -> "ClassifierList":
         matching = [cl for cl in self if cl.action == action]
-        return ClassifierList(*matching)
+        return ClassifierList._trusted(matching)
 
     def expand(self) -> List[Classifier]:
         """
@@ -77,12 +218,17 @@ class ClassifierList(TypedList):
             cl.set_alp_timestamp(time)
 
             if cl.does_anticipate_correctly(p0, p1):
+                specificity = cl.condition.specificity
                 new_cl = alp_racs.expected_case(cl, p0, time)
+                if cl.condition.specificity != specificity:
+                    # Expected case generalized the condition in place
+                    population.refresh(cl)
                 was_expected_case = True
             else:
                 new_cl = alp_racs.unexpected_case(cl, p0, p1, time)
                 if cl.is_inadequate():
                     delete_counter += 1
+                    profiling.count('inadequate')
 
                     lists = [x for x in [population, match_set, action_set]
                              if x]
@@ -91,12 +237,15 @@ class ClassifierList(TypedList):
 
             if new_cl is not None:
                 new_cl.tga = time
-                alp.add_classifier(new_cl, action_set, new_list, theta_exp)
+                alp.add_classifier(new_cl, action_set, new_list, theta_exp,
+                                   population.similarity_index)
 
         # No classifier anticipated correctly - generate new one
         if not was_expected_case:
+            profiling.count('covering')
             new_cl = alp_racs.cover(p0, action, p1, time, cfg)
-            alp.add_classifier(new_cl, action_set, new_list, theta_exp)
+            alp.add_classifier(new_cl, action_set, new_list, theta_exp,
+                               population.similarity_index)
 
         # Merge classifiers from new_list into self and population
         action_set.extend(new_list)
@@ -113,8 +262,7 @@ class ClassifierList(TypedList):
                                      p: float,
                                      beta: float,
                                      gamma: float) -> None:
-        for cl in action_set:
-            rl.update_classifier(cl, reward, p, beta, gamma)
+        rl.update_classifiers(action_set, reward, p, beta, gamma)
 
     @staticmethod
     def apply_ga(time: int,
@@ -127,7 +275,8 @@ class ClassifierList(TypedList):
                  chi: float,
                  theta_as: int,
                  do_subsumption: bool,
-                 theta_exp: int) -> None:
+                 theta_exp: int,
+                 rng: Optional[np.random.Generator] = None) -> None:
 
         if ga.should_apply(action_set, time, theta_ga):
             ga.set_timestamps(action_set, time)
@@ -141,8 +290,7 @@ class ClassifierList(TypedList):
 
             # Execute mutation
             attribute_range = child1.cfg.encoder.range
-            mutate(child1, attribute_range, mu)
-            mutate(child2, attribute_range, mu)
+            mutate_many([child1, child2], attribute_range, mu, rng)
 
             # Execute cross-over
             if random.random() < chi:
@@ -157,8 +305,10 @@ class ClassifierList(TypedList):
             child2.q /= 2
 
             # We are interested only in classifiers with specialized condition
-            unique_children = {cl for cl in [child1, child2]
-                               if cl.condition.specificity > 0}
+            # (in the order of creation, regardless of their hashes)
+            unique_children = list(dict.fromkeys(
+                cl for cl in [child1, child2]
+                if cl.condition.specificity > 0))
 
             ga.delete_classifiers(
                 population, match_set, action_set,
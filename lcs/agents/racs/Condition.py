@@ -1,18 +1,22 @@
 import random
-import statistics
 from copy import copy
 from typing import Callable
 
 from lcs import Perception
 from . import Configuration
+from .EncodedPerception import encode
 from .. import PerceptionString
 
 
 class Condition(PerceptionString):
 
+    # Sum of attribute spans used for the cover ratio (None when unknown)
+    __slots__ = ['_span_sum']
+
     def __init__(self, lst, cfg: Configuration) -> None:
         self.cfg = cfg
         super().__init__(lst, cfg.classifier_wildcard, cfg.oktypes)
+        self._span_sum = None
 
     @classmethod
     def generic(cls, cfg: Configuration):
@@ -43,8 +47,31 @@ class Condition(PerceptionString):
             0.0 means that condition is extremely narrow
             1.0 means that condition is maximally general
         """
+        span_sum = getattr(self, '_span_sum', None)
+        if span_sum is None:
+            span_sum = sum(r.bound_span for r in self)
+            self._span_sum = span_sum
+
         maximum_span = self.cfg.encoder.range[1]
-        return statistics.mean(r.bound_span / maximum_span for r in self)
+        return span_sum / (maximum_span * len(self))
+
+    def __setitem__(self, i, o):
+        replaced = self[i]
+        super().__setitem__(i, o)
+
+        if getattr(self, '_span_sum', None) is not None and \
+                isinstance(i, int):
+            self._span_sum += o.bound_span - replaced.bound_span
+        else:
+            self._span_sum = None
+
+    def __delitem__(self, i):
+        super().__delitem__(i)
+        self._span_sum = None
+
+    def insert(self, index: int, o) -> None:
+        super().insert(index, o)
+        self._span_sum = None
 
     def specialize_with_condition(self, other: "Condition") -> None:
         """
@@ -90,7 +117,7 @@ class Condition(PerceptionString):
             self.generalize(ridx)
 
     def does_match(self, perception: Perception):
-        encoded_perception = map(self.cfg.encoder.encode, perception)
+        encoded_perception = encode(perception, self.cfg.encoder)
         return all(p in ubr for p, ubr in zip(encoded_perception, self))
 
     def does_match_condition(self, other: "Condition"):
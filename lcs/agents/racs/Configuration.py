@@ -13,6 +13,13 @@ class Configuration:
                  performance_fcn_params={},
                  do_ga=False,
                  do_subsumption=True,
+                 use_interval_index=False,
+                 use_identity_index=False,
+                 use_similarity_index=False,
+                 use_profiler=False,
+                 checkpoint_path=None,
+                 checkpoint_frequency=0,
+                 seed=None,
                  beta=0.05,
                  gamma=0.95,
                  theta_i=0.1,
@@ -44,6 +51,18 @@ class Configuration:
         self.do_ga = do_ga
         self.do_subsumption = do_subsumption
 
+        self.use_interval_index = use_interval_index
+        self.use_identity_index = use_identity_index
+        self.use_similarity_index = use_similarity_index
+        self.use_profiler = use_profiler
+
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_frequency = checkpoint_frequency
+
+        # Seed of the GA mutation random number generator (by default
+        # drawn from `random` when the agent is created)
+        self.seed = seed
+
         self.beta = beta
         self.gamma = gamma
         self.theta_i = theta_i
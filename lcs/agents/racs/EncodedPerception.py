@@ -0,0 +1,65 @@
+import collections.abc
+from typing import Sequence
+
+# Longer perceptions are encoded with a single vectorized call
+BATCH_ENCODING_LENGTH = 32
+
+
+class EncodedPerception(collections.abc.Sequence):
+    """
+    Real-valued perception together with its encoded representation.
+
+    rACS compares perceptions with intervals of encoded values, therefore
+    each perception is encoded once (when obtained from the environment)
+    instead of every time it is compared with a classifier.
+
+    Parameters
+    ----------
+    observation
+        raw (real) values of perception attributes
+    encoder
+        encoder used by the agent (`cfg.encoder`)
+    """
+
+    __slots__ = ['_items', 'encoded']
+
+    def __init__(self, observation, encoder) -> None:
+        self._items = list(observation)
+
+        if len(self._items) >= BATCH_ENCODING_LENGTH:
+            self.encoded = tuple(encoder.encode_many(self._items).tolist())
+        else:
+            self.encoded = tuple(map(encoder.encode, self._items))
+
+    def __getitem__(self, i):
+        return self._items[i]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __eq__(self, other):
+        if isinstance(other, EncodedPerception):
+            return self._items == other._items
+        if isinstance(other, collections.abc.Sequence):
+            return self._items == list(other)
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self):
+        return repr(self._items)
+
+
+def encode(perception, encoder) -> Sequence[int]:
+    """
+    Encoded values of the perception. Perceptions already encoded
+    (`EncodedPerception`) are not encoded again.
+    """
+    if isinstance(perception, EncodedPerception):
+        return perception.encoded
+
+    return tuple(map(encoder.encode, perception))
@@ -0,0 +1,152 @@
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from lcs import Perception
+from .EncodedPerception import encode
+
+
+class IntervalIndex:
+    """
+    Bounds of the conditions of a population kept in two (N x L) integer
+    arrays - lower and upper bounds of every `UBR` attribute.
+
+    A perception is matched with a single broadcast comparison of its
+    encoded values with both arrays instead of testing every classifier
+    condition attribute by attribute.
+
+    Every indexed classifier owns a row (slot). Slots are assigned in
+    insertion order and never reused until the index is compacted,
+    so matching classifiers come back in the same order as they were
+    appended to the population.
+
+    Parameters
+    ----------
+    length: int
+        number of condition attributes
+    encoder
+        encoder used for perceptions which are not encoded yet
+    capacity: int
+        initial number of rows
+    """
+
+    def __init__(self, length: int, encoder, capacity: int = 64) -> None:
+        self.length = length
+        self.encoder = encoder
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self._lower = np.zeros((capacity, self.length), dtype=np.int64)
+        self._upper = np.zeros((capacity, self.length), dtype=np.int64)
+        self._live = np.zeros(capacity, dtype=bool)
+        self._slots: List = []
+        self._slot_of: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def __contains__(self, cl) -> bool:
+        return id(cl) in self._slot_of
+
+    def add(self, cl) -> None:
+        """
+        Appends the classifier to the index (as the last one).
+
+        Parameters
+        ----------
+        cl:
+            classifier to be indexed
+        """
+        if id(cl) in self._slot_of:
+            return
+
+        slot = len(self._slots)
+        if slot == len(self._live):
+            self._grow()
+
+        self._slots.append(cl)
+        self._slot_of[id(cl)] = slot
+        self._live[slot] = True
+        self._write(slot, cl.condition)
+
+    def remove(self, cl) -> None:
+        """
+        Removes the classifier from the index. Nothing happens if it was
+        not indexed.
+
+        Parameters
+        ----------
+        cl:
+            classifier to be removed
+        """
+        slot = self._slot_of.pop(id(cl), None)
+        if slot is None:
+            return
+
+        self._slots[slot] = None
+        self._live[slot] = False
+
+        # Compact the arrays when most of the slots are dead
+        if len(self._slots) > 64 and \
+                len(self._slot_of) < len(self._slots) // 2:
+            self.rebuild([c for c in self._slots if c is not None])
+
+    def update(self, cl) -> None:
+        """
+        Re-indexes the classifier if its condition was modified in place
+        while being a part of the population.
+
+        Parameters
+        ----------
+        cl:
+            indexed classifier
+        """
+        slot = self._slot_of.get(id(cl))
+        if slot is not None:
+            self._write(slot, cl.condition)
+
+    def rebuild(self, classifiers: Iterable) -> None:
+        """
+        Drops the current content and indexes `classifiers` in given order.
+        """
+        classifiers = list(classifiers)
+        self._allocate(max(len(classifiers), 64))
+        for cl in classifiers:
+            self.add(cl)
+
+    def match(self, situation: Perception) -> List:
+        """
+        Returns all indexed classifiers which condition matches given
+        situation. The result is the same as checking
+        `cl.condition.does_match(situation)` for every classifier.
+
+        Parameters
+        ----------
+        situation: Perception
+            current perception (preferably already encoded)
+
+        Returns
+        -------
+        List
+            matching classifiers ordered by insertion
+        """
+        n = len(self._slots)
+        p = np.array(encode(situation, self.encoder), dtype=np.int64)
+
+        matching = (self._lower[:n] <= p) & (self._upper[:n] >= p)
+        mask = self._live[:n] & matching.all(axis=1)
+
+        slots = self._slots
+        return [slots[slot] for slot in np.flatnonzero(mask).tolist()]
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._live)
+        for name in ('_lower', '_upper', '_live'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _write(self, slot: int, condition) -> None:
+        self._lower[slot] = [ubr.lower_bound for ubr in condition]
+        self._upper[slot] = [ubr.upper_bound for ubr in condition]
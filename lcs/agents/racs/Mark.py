@@ -3,6 +3,7 @@ from typing import List
 
 from lcs import Perception, TypedList
 from lcs.agents.racs import Configuration, Condition
+from lcs.agents.racs.EncodedPerception import encode
 from lcs.representations import UBR
 
 
@@ -40,7 +41,7 @@ class Mark(TypedList):
 
         """
         changed = False
-        encoded_perception = list(map(self.cfg.encoder.encode, perception))
+        encoded_perception = encode(perception, self.cfg.encoder)
 
         for idx, attrib in enumerate(self):
             new_elem = encoded_perception[idx]
@@ -75,7 +76,7 @@ class Mark(TypedList):
             return self.complement_marks(perception)
 
         changed = False
-        encoded_perception = list(map(self.cfg.encoder.encode, perception))
+        encoded_perception = encode(perception, self.cfg.encoder)
 
         for idx, item in enumerate(condition):
             if item == self.cfg.classifier_wildcard:
@@ -115,7 +116,7 @@ class Mark(TypedList):
         diff = Condition.generic(self.cfg)
 
         if self.is_marked():
-            enc_p0 = list(map(self.cfg.encoder.encode, p0))
+            enc_p0 = encode(p0, self.cfg.encoder)
 
             # Unique and fuzzy difference counts
             nr1, nr2 = 0, 0
@@ -1,10 +1,17 @@
 import logging
-from typing import Optional, Callable, Tuple, List
+import random
+from typing import Optional, Callable, Tuple
 
+import numpy as np
+
+from lcs import profiling
 from lcs.strategies.action_selection import choose_action
 from ...agents import Agent
 from ...agents.Agent import Metric
-from ...agents.racs import Configuration, ClassifierList
+from ...metrics import MetricsSink, ListSink
+from ...profiling import Profiler
+from ...agents.racs import Configuration, ClassifierList, \
+    EncodedPerception
 from ...utils import parse_state, parse_action
 
 logger = logging.getLogger(__name__)
@@ -19,13 +26,41 @@ class RACS(Agent):
         self.cfg = cfg
         self.population = population or ClassifierList()
 
-    def explore(self, env, trials) -> Tuple:
-        return self._evaluate(env, trials, self._run_trial_explore)
+        if cfg.use_interval_index:
+            self.population.build_interval_index(cfg)
+
+        if cfg.use_identity_index:
+            self.population.build_identity_index()
+
+        if cfg.use_similarity_index:
+            self.population.build_similarity_index()
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """
+        Random number generator of GA mutation. It is created when first
+        used (seeded with `cfg.seed` or from `random`), so agents which do
+        not run GA do not consume random numbers.
+        """
+        if self._rng is None:
+            seed = getattr(self.cfg, 'seed', None)
+            if seed is None:
+                seed = random.getrandbits(64)
+            self._rng = np.random.default_rng(seed)
+
+        return self._rng
+
+    def explore(self, env, trials,
+                metrics_sink: Optional[MetricsSink] = None) -> Tuple:
+        return self._evaluate(
+            env, trials, self._run_trial_explore, metrics_sink)
 
-    def exploit(self, env, trials):
-        return self._evaluate(env, trials, self._run_trial_exploit)
+    def exploit(self, env, trials, metrics_sink: Optional[MetricsSink] = None):
+        return self._evaluate(
+            env, trials, self._run_trial_exploit, metrics_sink)
 
-    def _evaluate(self, env, max_trials: int, func: Callable) -> Tuple:
+    def _evaluate(self, env, max_trials: int, func: Callable,
+                  metrics_sink: Optional[MetricsSink] = None) -> Tuple:
         """
         Runs the classifier in desired strategy (see `func`) and collects
         metrics.
@@ -39,30 +74,53 @@ class RACS(Agent):
         func: Callable
             Function accepting three parameters: env, steps already made,
              current trial
+        metrics_sink: Optional[MetricsSink]
+            sink consuming metrics of each trial (`ListSink` by default)
 
         Returns
         -------
         tuple
-            population of classifiers and metrics
+            population of classifiers and metrics retained by the sink
         """
-        current_trial = 0
-        steps = 0
+        current_trial, steps = self._start_training()
+
+        if metrics_sink is None:
+            metrics_sink = ListSink()
 
-        metrics: List = []
-        while current_trial < max_trials:
-            steps_in_trial = func(env, steps, current_trial)
-            steps += steps_in_trial
+        profiler = Profiler() if self.cfg.use_profiler else None
 
-            trial_metrics = self._collect_metrics(
-                env, current_trial, steps_in_trial, steps)
-            metrics.append(trial_metrics)
+        try:
+            with profiling.activated(profiler):
+                while current_trial < max_trials:
+                    steps_in_trial, reward = func(env, steps, current_trial)
+                    steps += steps_in_trial
 
-            if current_trial % 25 == 0:
-                logger.info(trial_metrics)
+                    trial_metrics = self._collect_metrics(
+                        env, current_trial, steps_in_trial, steps, reward)
 
-            current_trial += 1
+                    if profiler is not None:
+                        trial_metrics['profile'] = profiler.snapshot()
 
-        return self.population, metrics
+                    metrics_sink.write(trial_metrics)
+
+                    if current_trial % 25 == 0:
+                        logger.info(trial_metrics)
+
+                    current_trial += 1
+                    self._save_checkpoint(current_trial, steps)
+        finally:
+            # Metrics of finished trials are kept even if training fails
+            metrics_sink.flush()
+
+        return self.population, metrics_sink.metrics
+
+    def _perceive(self, raw_state) -> EncodedPerception:
+        """
+        Maps and encodes the environment state once, so classifiers
+        do not have to encode it while being compared with it.
+        """
+        state = parse_state(raw_state, self.cfg.perception_mapper_fcn)
+        return EncodedPerception(state, self.cfg.encoder)
 
     def _run_trial_explore(self, env, time, current_trial=None):
         logger.debug("** Running trial explore ** ")
@@ -70,16 +128,19 @@ class RACS(Agent):
         # Initial conditions
         steps = 0
         raw_state = env.reset()
-        state = parse_state(raw_state, self.cfg.perception_mapper_fcn)
+        state = self._perceive(raw_state)
 
         action = None
         reward = None
+        total_reward = 0
         prev_state = None
         action_set = ClassifierList()
         done = False
 
         while not done:
+            t = profiling.start()
             match_set = self.population.form_match_set(state)
+            t = profiling.lap('match_set', t)
 
             if steps > 0:
                 # Apply learning in the last action set
@@ -93,12 +154,14 @@ class RACS(Agent):
                     time + steps,
                     self.cfg.theta_exp,
                     self.cfg)
+                t = profiling.lap('alp', t)
                 ClassifierList.apply_reinforcement_learning(
                     action_set,
                     reward,
                     match_set.get_maximum_fitness(),
                     self.cfg.beta,
                     self.cfg.gamma)
+                t = profiling.lap('rl', t)
                 if self.cfg.do_ga:
                     ClassifierList.apply_ga(
                         time + steps,
@@ -111,7 +174,9 @@ class RACS(Agent):
                         self.cfg.chi,
                         self.cfg.theta_as,
                         self.cfg.do_subsumption,
-                        self.cfg.theta_exp)
+                        self.cfg.theta_exp,
+                        self.rng)
+                    t = profiling.lap('ga', t)
 
             action = choose_action(
                 match_set,
@@ -120,10 +185,12 @@ class RACS(Agent):
             internal_action = parse_action(action, self.cfg.action_mapping_fcn)
             logger.debug("\tExecuting action: [%d]", action)
             action_set = match_set.form_action_set(action)
+            t = profiling.lap('action_selection', t)
 
             prev_state = state
             raw_state, reward, done, _ = env.step(internal_action)
-            state = parse_state(raw_state, self.cfg.perception_mapper_fcn)
+            state = self._perceive(raw_state)
+            t = profiling.lap('environment', t)
 
             if done:
                 ClassifierList.apply_alp(
@@ -136,12 +203,14 @@ class RACS(Agent):
                     time + steps,
                     self.cfg.theta_exp,
                     self.cfg)
+                t = profiling.lap('alp', t)
                 ClassifierList.apply_reinforcement_learning(
                     action_set,
                     reward,
                     0,
                     self.cfg.beta,
                     self.cfg.gamma)
+                t = profiling.lap('rl', t)
                 if self.cfg.do_ga:
                     ClassifierList.apply_ga(
                         time + steps,
@@ -154,24 +223,31 @@ class RACS(Agent):
                         self.cfg.chi,
                         self.cfg.theta_as,
                         self.cfg.do_subsumption,
-                        self.cfg.theta_exp)
+                        self.cfg.theta_exp,
+                        self.rng)
+                    profiling.lap('ga', t)
+
+            total_reward += reward
             steps += 1
 
-        return steps
+        return steps, total_reward
 
     def _run_trial_exploit(self, env, time=None, current_trial=None):
         logger.debug("** Running trial exploit **")
 
         steps = 0
         raw_state = env.reset()
-        state = parse_state(raw_state, self.cfg.perception_mapper_fcn)
+        state = self._perceive(raw_state)
 
         reward = None
+        total_reward = 0
         action_set = ClassifierList()
         done = False
 
         while not done:
+            t = profiling.start()
             match_set = self.population.form_match_set(state)
+            t = profiling.lap('match_set', t)
 
             if steps > 0:
                 ClassifierList.apply_reinforcement_learning(
@@ -180,6 +256,7 @@ class RACS(Agent):
                     match_set.get_maximum_fitness(),
                     self.cfg.beta,
                     self.cfg.gamma)
+                t = profiling.lap('rl', t)
 
             # Execute best action
             action = choose_action(
@@ -188,9 +265,11 @@ class RACS(Agent):
                 epsilon=0.0)
             internal_action = parse_action(action, self.cfg.action_mapping_fcn)
             action_set = match_set.form_action_set(action)
+            t = profiling.lap('action_selection', t)
 
             raw_state, reward, done, _ = env.step(internal_action)
-            state = parse_state(raw_state, self.cfg.perception_mapper_fcn)
+            state = self._perceive(raw_state)
+            t = profiling.lap('environment', t)
 
             if done:
                 ClassifierList.apply_reinforcement_learning(
@@ -199,12 +278,15 @@ class RACS(Agent):
                     0,
                     self.cfg.beta,
                     self.cfg.gamma)
+                profiling.lap('rl', t)
 
+            total_reward += reward
             steps += 1
 
-        return steps
+        return steps, total_reward
 
-    def _collect_agent_metrics(self, trial, steps, total_steps) -> Metric:
+    def _collect_agent_metrics(self, trial, steps, total_steps,
+                               reward) -> Metric:
         return {
             'population': len(self.population),
             'numerosity': sum(cl.num for cl in self.population),
@@ -216,7 +298,8 @@ class RACS(Agent):
                                 in self.population) / len(self.population)),
             'trial': trial,
             'steps': steps,
-            'total_steps': total_steps
+            'total_steps': total_steps,
+            'reward': reward
         }
 
     def _collect_environment_metrics(self, env) -> Optional[Metric]:
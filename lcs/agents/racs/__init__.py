@@ -1,7 +1,9 @@
 from .Configuration import Configuration
+from .EncodedPerception import EncodedPerception
 from .Condition import Condition
 from .Effect import Effect
 from .Mark import Mark
 from .Classifier import Classifier
+from .IntervalIndex import IntervalIndex
 from .ClassifierList import ClassifierList
 from .RACS import RACS
@@ -1,14 +1,31 @@
 import math
 import random
-from typing import Tuple
+from typing import Iterable, Optional, Tuple
 
-from scipy.stats import norm
+import numpy as np
 
 from lcs.agents.racs import Classifier
 from lcs.representations import UBR
 
-
-def mutate(cl: Classifier, bounds: Tuple[int, int], mu: float) -> None:
+# Coefficients of the rational approximations of the normal quantile
+# function (P. J. Acklam), relative error below 1.15e-9
+_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+      1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+      6.680131188771972e+01, -1.328068155288572e+01, 1.0)
+_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+      -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+      3.754408661907416e+00, 1.0)
+_P_LOW = 0.02425
+_P_MIN, _P_MAX = 1e-300, 1 - 2 ** -53
+_SQRT2 = math.sqrt(2)
+
+
+def mutate(cl: Classifier,
+           bounds: Tuple[int, int],
+           mu: float,
+           rng: Optional[np.random.Generator] = None) -> None:
     """
     Tries to generalize the classifier condition and effect part.
     Each attribute (both lower/upper bound) have `mu` chances of being broaden.
@@ -21,38 +38,89 @@ def mutate(cl: Classifier, bounds: Tuple[int, int], mu: float) -> None:
         tuple with minimum and maximum encoded value for the attribute
     mu: float
         probability of executing mutation on single bound
+    rng: Optional[np.random.Generator]
+        random number generator, by default seeded from `random`
+        (agents pass their own one)
     """
-    for idx, (c, e) in enumerate(zip(cl.condition, cl.effect)):
-        if c != cl.cfg.classifier_wildcard:
-            cl.condition[idx] = _mutate_attribute(c, bounds, mu)
+    mutate_many([cl], bounds, mu, rng)
 
-        if e != cl.cfg.classifier_wildcard:
-            cl.effect[idx] = _mutate_attribute(e, bounds, mu)
 
+def mutate_many(classifiers: Iterable[Classifier],
+                bounds: Tuple[int, int],
+                mu: float,
+                rng: Optional[np.random.Generator] = None) -> None:
+    """
+    Mutates (see `mutate`) all specified attributes of the classifiers
+    at once. New bounds are drawn from the normal distribution truncated
+    to the allowed range, so no samples are rejected.
+
+    Parameters
+    ----------
+    classifiers: Iterable[Classifier]
+        classifiers to be modified
+    bounds: Tuple[int, int]
+        tuple with minimum and maximum encoded value for the attribute
+    mu: float
+        probability of executing mutation on single bound
+    rng: Optional[np.random.Generator]
+        random number generator, by default seeded from `random`
+        (agents pass their own one)
+    """
+    attributes = [(ps, idx, ubr)
+                  for cl in classifiers
+                  for ps in (cl.condition, cl.effect)
+                  for idx, ubr in enumerate(ps)
+                  if ubr != cl.cfg.classifier_wildcard]
+
+    if not attributes:
+        return
+
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+
+    lb = np.array([ubr.lower_bound for _, _, ubr in attributes])
+    ub = np.array([ubr.upper_bound for _, _, ubr in attributes])
+
+    nlb = _mutate_bounds(lb, bounds, mu, rng, lower=True)
+    nub = _mutate_bounds(ub, bounds, mu, rng, lower=False)
+
+    for (ps, idx, _), x1, x2 in zip(attributes, nlb.tolist(), nub.tolist()):
+        ps[idx] = UBR(x1, x2)
 
-def _mutate_attribute(ubr: UBR, bounds: Tuple[int, int], mu: float) -> UBR:
-    rmin, rmax = bounds[0], bounds[1]
 
-    # Calculate global spread
+def _mutate_bounds(values: np.ndarray,
+                   bounds: Tuple[int, int],
+                   mu: float,
+                   rng: np.random.Generator,
+                   lower: bool) -> np.ndarray:
+    """
+    Moves each value with `mu` probability by an integer Gaussian offset,
+    so that it stays between the `bounds` and the UBR gets broader
+    (lower bounds are decreased, upper bounds increased).
+    """
+    rmin, rmax = bounds[0], bounds[1]
     spread = _calculate_spread(rmax)
 
-    lb, ub = ubr.lower_bound, ubr.upper_bound
-    nlb, nub = lb, ub
+    mutated = rng.random(len(values)) < mu
+    if spread <= 0 or not mutated.any():
+        return values
+
+    center = values[mutated]
+    if lower:
+        smallest, largest = np.full_like(center, rmin), center
+    else:
+        smallest, largest = center, np.full_like(center, rmax)
 
-    # Generate new lower bound
-    if random.random() < mu:
-        while True:
-            nlb = _draw(lb, spread)
-            if rmin <= nlb <= lb:
-                break
+    # Drawn values are truncated towards zero - find the real interval
+    # that truncates into [smallest, largest]
+    low = np.where(smallest > 0, smallest, smallest - 1)
+    high = largest + 1
 
-    # Generate new upper bound
-    if random.random() < mu:
-        while True:
-            nub = _draw(ub, spread)
-            if ub <= nub <= rmax:
-                break
-    return UBR(nlb, nub)
+    drawn = _truncated_normal(rng, center, spread, low, high)
+
+    values = values.copy()
+    values[mutated] = np.clip(np.trunc(drawn), smallest, largest)
+    return values
 
 
 def _calculate_spread(rmax: int) -> float:
@@ -73,21 +141,65 @@ def _calculate_spread(rmax: int) -> float:
     return math.log(rmax)
 
 
-def _draw(center: int, spread: float) -> int:
+def _truncated_normal(rng: np.random.Generator,
+                      center: np.ndarray,
+                      spread: float,
+                      low: np.ndarray,
+                      high: np.ndarray) -> np.ndarray:
     """
-    Draws a random number using Gaussian distribution and converts it
-    into integer.
+    Draws random numbers from Gaussian distributions truncated
+    to the (low, high) intervals by inverting their CDFs.
 
     Parameters
     ----------
-    center: int
-        center for Gaussian distribution generator
+    rng: np.random.Generator
+        random number generator
+    center: np.ndarray
+        centers for Gaussian distribution generator
     spread: float
         spread for Gaussian distribution generator
+    low: np.ndarray
+        minimal values
+    high: np.ndarray
+        maximal values
 
     Returns
     -------
-    int
-        random number
+    np.ndarray
+        random numbers
     """
-    return int(norm.rvs(center, spread))
+    cdf_low = _norm_cdf((low - center) / spread)
+    cdf_high = _norm_cdf((high - center) / spread)
+
+    p = cdf_low + rng.random(len(center)) * (cdf_high - cdf_low)
+
+    # Keep the quantiles finite when the interval is far in the tail
+    p = np.clip(p, _P_MIN, _P_MAX)
+
+    return center + spread * _norm_ppf(p)
+
+
+def _norm_cdf(z: np.ndarray) -> np.ndarray:
+    # Batches hold the attributes of two children - `math.erfc` applied
+    # to plain floats is faster than any array expression for so few
+    # values (and much faster than `np.vectorize`)
+    return np.array([0.5 * math.erfc(-x / _SQRT2) for x in z.tolist()])
+
+
+def _norm_ppf(p: np.ndarray) -> np.ndarray:
+    x = np.empty_like(p)
+
+    low = p < _P_LOW
+    q = np.sqrt(-2 * np.log(p[low]))
+    x[low] = np.polyval(_C, q) / np.polyval(_D, q)
+
+    high = p > 1 - _P_LOW
+    q = np.sqrt(-2 * np.log1p(-p[high]))
+    x[high] = -np.polyval(_C, q) / np.polyval(_D, q)
+
+    central = ~(low | high)
+    q = p[central] - 0.5
+    r = q * q
+    x[central] = q * np.polyval(_A, r) / np.polyval(_B, r)
+
+    return x
@@ -0,0 +1,276 @@
+"""
+Compact, versioned serialization of agent populations (checkpoints).
+
+Instead of pickling classifier objects one by one (each with its own
+references to the configuration, mark and effect objects) the population
+is stored column-wise: the configuration once, numerical parameters as
+arrays, conditions and effects as lists of attributes and only non-empty
+marks. Objects are restored without re-validating their contents, so
+loading is fast even for large populations.
+
+The file starts with the `MAGIC` bytes and the format version followed
+by the pickled payload (so checkpoints must come from trusted sources).
+"""
+import gc
+import os
+import pickle
+import struct
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+MAGIC = b'PYALCS'
+VERSION = 1
+
+_HEADER = struct.Struct('<6sH')
+
+FLOAT_FIELDS = ('q', 'r', 'ir', 'tav')
+INT_FIELDS = ('num', 'exp', 'tga')
+
+
+class Checkpoint(NamedTuple):
+    cfg: Any
+    population: Any
+    state: Dict[str, Any]
+
+
+def save(path: str,
+         cfg,
+         population,
+         state: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Saves the population (ACS2 or rACS) to the file. The file is replaced
+    atomically, so the previous checkpoint stays intact if saving fails.
+
+    Parameters
+    ----------
+    path: str
+        output file
+    cfg
+        agent configuration shared by all classifiers
+    population
+        list of classifiers
+    state: Optional[Dict[str, Any]]
+        additional (picklable) training state, i.e. current trial
+    """
+    payload = {
+        'cfg': cfg,
+        'state': state or {},
+        'population': _dump_population(population),
+    }
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION))
+        pickle.dump(payload, f, protocol=4)
+
+    os.replace(tmp_path, path)
+
+
+def load(path: str) -> Checkpoint:
+    """
+    Loads the checkpoint saved with `save`.
+
+    The payload is unpickled, therefore loading a checkpoint can execute
+    arbitrary code. Load only checkpoints from trusted sources.
+
+    Parameters
+    ----------
+    path: str
+        checkpoint file
+
+    Returns
+    -------
+    Checkpoint
+        configuration, population and training state
+    """
+    with open(path, 'rb') as f:
+        magic, version = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("Not a population checkpoint: {}".format(path))
+        if version > VERSION:
+            raise ValueError(
+                "Unsupported checkpoint version: {}".format(version))
+
+        # Garbage collector would be triggered many times while creating
+        # lots of objects (that are not garbage)
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            payload = pickle.load(f)
+            population = _load_population(payload['population'],
+                                          payload['cfg'])
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    return Checkpoint(payload['cfg'], population, payload['state'])
+
+
+def _dump_population(population) -> Dict[str, Any]:
+    classifiers = list(population)
+    columns: Dict[str, Any] = {
+        'list': type(population),
+        'size': len(classifiers),
+    }
+
+    if not classifiers:
+        return columns
+
+    first = classifiers[0]
+
+    columns['classifier'] = _classifier_class(first)
+    columns['condition'] = _dump_strings(
+        [cl.condition for cl in classifiers])
+    columns['effect'] = _dump_strings([cl.effect for cl in classifiers])
+    columns['mark'] = _dump_marks([cl.mark for cl in classifiers])
+
+    for name in FLOAT_FIELDS:
+        columns[name] = np.array([getattr(cl, name) for cl in classifiers],
+                                 dtype=np.float64)
+    for name in INT_FIELDS:
+        columns[name] = np.array([getattr(cl, name) for cl in classifiers],
+                                 dtype=np.int64)
+
+    columns['action'] = [cl.action for cl in classifiers]
+    columns['talp'] = [cl.talp for cl in classifiers]
+
+    if hasattr(first, 'ee'):
+        columns['ee'] = np.array([cl.ee for cl in classifiers], dtype=bool)
+
+    return columns
+
+
+def _load_population(columns: Dict[str, Any], cfg):
+    size = columns['size']
+
+    if size == 0:
+        return columns['list']()
+
+    conditions = _load_strings(columns['condition'])
+    effects = _load_strings(columns['effect'])
+    marks = _load_marks(columns['mark'], size, cfg)
+
+    float_columns = [columns[name].tolist() for name in FLOAT_FIELDS]
+    int_columns = [columns[name].tolist() for name in INT_FIELDS]
+    ee = columns['ee'].tolist() if 'ee' in columns else None
+
+    names = ('condition', 'action', 'effect', 'mark', 'talp') + \
+        FLOAT_FIELDS + INT_FIELDS
+    rows = zip(conditions, columns['action'], effects, marks,
+               columns['talp'], *float_columns, *int_columns)
+
+    cls = columns['classifier']
+    classifiers = []
+
+    for idx, row in enumerate(rows):
+        cl = cls.__new__(cls)
+        attributes = cl.__dict__
+        attributes['cfg'] = cfg
+        attributes.update(zip(names, row))
+        if ee is not None:
+            attributes['ee'] = ee[idx]
+
+        classifiers.append(cl)
+
+    return columns['list']._trusted(classifiers)
+
+
+def _dump_strings(strings: List) -> Dict[str, Any]:
+    """
+    Perception strings (conditions, effects) are stored as a template
+    object (attributes shared by all of them, like the wildcard) and the
+    list of items. Bit-packed strings are stored as packed masks.
+    """
+    template = strings[0]
+    packed = hasattr(template, 'packed')
+
+    if packed:
+        items = [s.packed for s in strings]
+    else:
+        items = [s._items for s in strings]
+
+    # Cached hash is specific to the template
+    attributes = {k: v for k, v in vars(template).items() if k != '_hash'}
+
+    return {
+        'class': type(template),
+        'attributes': attributes,
+        'oktypes': template.oktypes,
+        'packed': packed,
+        'items': items,
+    }
+
+
+def _load_strings(column: Dict[str, Any]) -> List:
+    cls = column['class']
+    attributes = column['attributes']
+    oktypes = column['oktypes']
+
+    strings = []
+    for items in column['items']:
+        ps = cls.__new__(cls)
+        ps.__dict__.update(attributes)
+        ps.oktypes = oktypes
+
+        if column['packed']:
+            ps._care, ps._value = items
+        else:
+            ps._items = items
+
+        strings.append(ps)
+
+    return strings
+
+
+def _dump_marks(marks: List) -> Dict[str, Any]:
+    template = marks[0]
+
+    return {
+        'class': type(template),
+        'attributes': dict(vars(template)),
+        'oktypes': template.oktypes,
+        'length': len(template),
+        # Most classifiers are not marked
+        'marked': {idx: mark._items for idx, mark in enumerate(marks)
+                   if any(mark._items)},
+    }
+
+
+def _load_marks(column: Dict[str, Any], size: int, cfg) -> List:
+    cls = column['class']
+    attributes = column['attributes']
+    oktypes = column['oktypes']
+    length = column['length']
+    marked = column['marked']
+
+    # Marks creating sets only when accessed (see `PMark`) are restored
+    # without any sets
+    lazy = None in cls(cfg)._items
+
+    marks = []
+    for idx in range(size):
+        mark = cls.__new__(cls)
+        mark.__dict__.update(attributes)
+        mark.oktypes = oktypes
+
+        items = marked.get(idx)
+        if items is None:
+            if lazy:
+                items = [None] * length
+            else:
+                items = [set() for _ in range(length)]
+
+        mark._items = items
+        marks.append(mark)
+
+    return marks
+
+
+def _classifier_class(cl):
+    # Classifiers kept in array stores (views on the store) are saved
+    # as plain ones
+    if '_store' in vars(cl):
+        return type(cl).__bases__[0]
+
+    return type(cl)
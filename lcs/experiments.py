@@ -0,0 +1,183 @@
+"""
+Running series of independent experiments (configurations repeated with
+many random seeds) in parallel, on a pool of processes.
+
+Every run creates its own agent and environment inside the worker
+process and seeds all random number generators with the run seed before
+starting, so the results of a run depend only on its configuration and
+seed - not on the number of processes or the order of execution
+(agents iterate over sets of symbols, so set `PYTHONHASHSEED` when
+comparing runs from different interpreter sessions).
+
+Example::
+
+    runs = make_runs([Configuration(6, 2), Configuration(6, 2, do_ga=True)],
+                     seeds=range(10))
+
+    for result in run_experiments(ACS2, make_env, runs, trials=1000):
+        print(result.run, result.metrics[-1])
+
+Agent and environment factories (and the configurations) are sent to
+worker processes, therefore they must be picklable (i.e. defined
+at module level).
+"""
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, \
+    Optional
+
+import numpy as np
+
+from lcs.agents.Agent import Metric
+
+METHODS = ('explore', 'exploit', 'explore_exploit')
+
+
+class Run(NamedTuple):
+    """
+    Single experiment - configuration used with given seed.
+    """
+    run_id: int
+    cfg: Any
+    seed: int
+
+
+class RunResult(NamedTuple):
+    """
+    Outcome of the run - collected metrics and (optionally) the final
+    population of classifiers.
+    """
+    run: Run
+    metrics: List[Metric]
+    population: Optional[Any] = None
+
+
+def make_runs(configurations: Iterable, seeds: Iterable[int]) -> List[Run]:
+    """
+    Creates the grid of runs - each configuration is repeated with every
+    seed.
+
+    Parameters
+    ----------
+    configurations: Iterable
+        agent configurations
+    seeds: Iterable[int]
+        random seeds
+
+    Returns
+    -------
+    List[Run]
+        runs ordered by configuration and then by seed
+    """
+    return [Run(idx, cfg, seed) for idx, (cfg, seed)
+            in enumerate(product(configurations, seeds))]
+
+
+def seed_everything(seed: int, env=None) -> None:
+    """
+    Seeds random number generators used by agents (and the environment
+    if it supports seeding).
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+    if env is not None and hasattr(env, 'seed'):
+        env.seed(seed)
+
+
+def perform_run(agent_factory: Callable,
+                env_factory: Callable,
+                run: Run,
+                trials: int,
+                method: str = 'explore',
+                keep_population: bool = False) -> RunResult:
+    """
+    Performs a single run in the current process.
+
+    Parameters
+    ----------
+    agent_factory: Callable
+        function (or agent class) creating the agent from configuration
+    env_factory: Callable
+        function creating the environment
+    run: Run
+        configuration and seed used
+    trials: int
+        number of trials
+    method: str
+        name of the agent method used (`explore`, `exploit` or
+        `explore_exploit`)
+    keep_population: bool
+        whether to return the final population of classifiers
+
+    Returns
+    -------
+    RunResult
+        collected metrics
+    """
+    if method not in METHODS:
+        raise ValueError("Unknown method: {}".format(method))
+
+    env = env_factory()
+    seed_everything(run.seed, env)
+    agent = agent_factory(run.cfg)
+
+    population, metrics = getattr(agent, method)(env, trials)
+
+    return RunResult(run, metrics, population if keep_population else None)
+
+
+def run_experiments(agent_factory: Callable,
+                    env_factory: Callable,
+                    runs: Iterable[Run],
+                    trials: int,
+                    method: str = 'explore',
+                    keep_population: bool = False,
+                    processes: Optional[int] = None) -> Iterator[RunResult]:
+    """
+    Executes runs on the pool of processes. Results are yielded as soon
+    as each run finishes (not in the order of runs - use `Run.run_id`
+    to identify them).
+
+    Parameters
+    ----------
+    agent_factory: Callable
+        function (or agent class) creating the agent from configuration
+    env_factory: Callable
+        function creating the environment
+    runs: Iterable[Run]
+        runs to be performed (see `make_runs`)
+    trials: int
+        number of trials in each run
+    method: str
+        name of the agent method used (`explore`, `exploit` or
+        `explore_exploit`)
+    keep_population: bool
+        whether to send back the final population of classifiers
+    processes: Optional[int]
+        number of worker processes, by default number of CPUs.
+        With a single process runs are performed sequentially in the
+        current process.
+
+    Returns
+    -------
+    Iterator[RunResult]
+        results of finished runs
+    """
+    if method not in METHODS:
+        raise ValueError("Unknown method: {}".format(method))
+
+    if processes == 1:
+        for run in runs:
+            yield perform_run(agent_factory, env_factory, run, trials,
+                              method, keep_population)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(perform_run, agent_factory, env_factory,
+                                   run, trials, method, keep_population)
+                   for run in runs]
+
+        for future in as_completed(futures):
+            yield future.result()
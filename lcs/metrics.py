@@ -0,0 +1,319 @@
+"""
+Sinks consuming metrics collected by agents after each trial.
+
+By default agents keep all metrics in memory (`ListSink`). For long
+experiments metrics can be streamed to files instead - they are written
+incrementally in batches, so memory usage stays flat and the results
+of an interrupted run are not lost.
+"""
+import collections
+import csv
+import glob
+import json
+import os
+from itertools import chain
+from typing import Any, Deque, Dict, Iterable, List
+
+import numpy as np
+
+from lcs.agents.Agent import Metric
+
+
+def flatten(metric: Metric, separator: str = '.') -> Dict[str, Any]:
+    """
+    Flattens nested metrics into a single level dictionary.
+    Missing groups of metrics (None values) are skipped.
+
+    Example: {'agent': {'steps': 1}, 'environment': None} is flattened
+    into {'agent.steps': 1}.
+
+    Parameters
+    ----------
+    metric: Metric
+        trial metrics
+    separator: str
+        separator of nested keys
+
+    Returns
+    -------
+    Dict[str, Any]
+        flat dictionary of metrics
+    """
+    flat: Dict[str, Any] = {}
+
+    for key, value in metric.items():
+        if isinstance(value, dict):
+            for nested_key, nested_value in flatten(value, separator).items():
+                flat[key + separator + nested_key] = nested_value
+        elif value is not None:
+            flat[key] = value
+
+    return flat
+
+
+class MetricsSink:
+    """
+    Base class for metrics sinks. Sinks can be used as context managers
+    (closed on exit).
+    """
+
+    def write(self, metric: Metric) -> None:
+        raise NotImplementedError()
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    @property
+    def metrics(self) -> List[Metric]:
+        """
+        Metrics retained in memory (returned by the agent after
+        the experiment).
+        """
+        return []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ListSink(MetricsSink):
+    """
+    Keeps all metrics in memory.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: List[Metric] = []
+
+    def write(self, metric: Metric) -> None:
+        self._metrics.append(metric)
+
+    @property
+    def metrics(self) -> List[Metric]:
+        return self._metrics
+
+
+class RingBufferSink(MetricsSink):
+    """
+    Keeps only the most recent metrics in memory.
+
+    Parameters
+    ----------
+    size: int
+        number of retained metrics
+    """
+
+    def __init__(self, size: int = 1000) -> None:
+        self._metrics: Deque[Metric] = collections.deque(maxlen=size)
+
+    def write(self, metric: Metric) -> None:
+        self._metrics.append(metric)
+
+    @property
+    def metrics(self) -> List[Metric]:
+        return list(self._metrics)
+
+
+class _BatchingSink(MetricsSink):
+    def __init__(self, batch_size: int) -> None:
+        self.batch_size = batch_size
+        self._batch: List[Metric] = []
+
+    def write(self, metric: Metric) -> None:
+        self._batch.append(metric)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._batch:
+            self._write_batch(self._batch)
+            self._batch = []
+
+    def _write_batch(self, batch: List[Metric]) -> None:
+        raise NotImplementedError()
+
+
+class JsonLinesSink(_BatchingSink):
+    """
+    Appends metrics to the file as JSON objects, one per line.
+
+    Parameters
+    ----------
+    path: str
+        output file
+    batch_size: int
+        number of metrics buffered before writing
+    """
+
+    def __init__(self, path: str, batch_size: int = 100) -> None:
+        super().__init__(batch_size)
+        self._file = open(path, 'a')
+
+    def _write_batch(self, batch: List[Metric]) -> None:
+        self._file.writelines(json.dumps(metric) + '\n' for metric in batch)
+        self._file.flush()
+
+    def close(self) -> None:
+        super().close()
+        self._file.close()
+
+    @staticmethod
+    def load(path: str) -> List[Metric]:
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class CsvSink(_BatchingSink):
+    """
+    Writes flattened metrics (see `flatten`) as CSV rows. Metrics are
+    appended to the existing file (i.e. when training is resumed).
+
+    Columns are determined by the metrics written so far - when new ones
+    appear (i.e. profiler counters of events which did not happen before)
+    the file is rewritten with the extended header. Missing values are
+    left empty.
+
+    Parameters
+    ----------
+    path: str
+        output file
+    batch_size: int
+        number of metrics buffered before writing
+    """
+
+    def __init__(self, path: str, batch_size: int = 100) -> None:
+        super().__init__(batch_size)
+        self.path = path
+        self._fieldnames = self._read_header(path)
+        self._file = open(path, 'a', newline='')
+
+    def _write_batch(self, batch: List[Metric]) -> None:
+        rows = [flatten(metric) for metric in batch]
+
+        fieldnames = _union_of_keys(rows, self._fieldnames)
+        if fieldnames != self._fieldnames:
+            self._rewrite(fieldnames)
+
+        writer = csv.DictWriter(self._file, fieldnames=self._fieldnames)
+        writer.writerows(rows)
+        self._file.flush()
+
+    def _rewrite(self, fieldnames: List[str]) -> None:
+        self._file.close()
+
+        with open(self.path, newline='') as f:
+            written = list(csv.DictReader(f)) if self._fieldnames else []
+
+        with open(self.path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(written)
+
+        self._fieldnames = fieldnames
+        self._file = open(self.path, 'a', newline='')
+
+    @staticmethod
+    def _read_header(path: str) -> List[str]:
+        if not os.path.exists(path):
+            return []
+
+        with open(path, newline='') as f:
+            return next(csv.reader(f), [])
+
+    def close(self) -> None:
+        super().close()
+        self._file.close()
+
+
+class NumpySink(_BatchingSink):
+    """
+    Stores flattened metrics (see `flatten`) column-wise. Each batch is
+    written to the directory as a separate `.npz` chunk holding one array
+    per metric, use `NumpySink.load` to concatenate them.
+
+    Parameters
+    ----------
+    directory: str
+        output directory (created if needed)
+    batch_size: int
+        number of metrics in a single chunk
+    """
+
+    def __init__(self, directory: str, batch_size: int = 1000) -> None:
+        super().__init__(batch_size)
+        self.directory = directory
+        self._chunks = len(self._chunk_files(directory))
+        os.makedirs(directory, exist_ok=True)
+
+    def _write_batch(self, batch: List[Metric]) -> None:
+        rows = [flatten(metric) for metric in batch]
+        columns: Dict[str, Any] = {
+            name: _column([row.get(name) for row in rows])
+            for name in _union_of_keys(rows)}
+
+        path = os.path.join(self.directory,
+                            'chunk-{:06d}.npz'.format(self._chunks))
+        np.savez(path, **columns)
+        self._chunks += 1
+
+    @staticmethod
+    def _chunk_files(directory: str) -> List[str]:
+        return sorted(glob.glob(os.path.join(directory, 'chunk-*.npz')))
+
+    @staticmethod
+    def load(directory: str) -> Dict[str, np.ndarray]:
+        """
+        Loads all chunks written to the directory.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            array of values for each metric
+        """
+        chunks = []
+        for path in NumpySink._chunk_files(directory):
+            with np.load(path) as chunk:
+                chunks.append({name: chunk[name] for name in chunk.files})
+
+        # Metrics missing in some chunks are filled like in `_column`
+        columns = {}
+        for name in _union_of_keys(chunks):
+            arrays = [chunk.get(name) for chunk in chunks]
+            kinds = {a.dtype.kind for a in arrays if a is not None}
+            fill = '' if kinds <= {'U', 'S'} else np.nan
+
+            columns[name] = np.concatenate([
+                a if a is not None
+                else np.full(len(next(iter(chunk.values()))), fill)
+                for a, chunk in zip(arrays, chunks)])
+
+        return columns
+
+
+def _union_of_keys(rows: Iterable[Dict[str, Any]],
+                   initial: Iterable[str] = ()) -> List[str]:
+    """
+    Names of all the keys in the order of their first appearance.
+    """
+    return list(dict.fromkeys(chain(initial, *rows)))
+
+
+def _column(values: List[Any]) -> np.ndarray:
+    """
+    Array of metric values. Missing values are NaN (or empty strings
+    in columns of strings), so arrays never hold Python objects.
+    """
+    present = [value for value in values if value is not None]
+    fill = '' if present and all(isinstance(value, str)
+                                 for value in present) else np.nan
+
+    column = np.array([fill if value is None else value
+                       for value in values])
+    if column.dtype == object:
+        column = column.astype(str)
+
+    return column
@@ -0,0 +1,105 @@
+"""
+Lightweight instrumentation of the learning cycle.
+
+The `Profiler` accumulates time spent in phases of each step (forming
+the match set, ALP, RL, GA, subsumption search, action selection,
+environment step) and counts events (covering, deletions, subsumptions).
+
+Agents activate their profiler while running trials; the instrumented
+code calls module functions (`start`, `lap`, `count`) which do nothing
+when there is no active profiler. Phases can be nested - time of
+the subsumption search is also a part of the ALP and GA phases.
+
+Example::
+
+    cfg = Configuration(8, 8, use_profiler=True)
+    population, metrics = ACS2(cfg).explore(env, 100)
+    metrics[-1]['profile']
+"""
+import collections
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Optional
+
+
+class Profiler:
+    """
+    Accumulates phase timers (in seconds) and event counters.
+    """
+
+    __slots__ = ['timers', 'counters']
+
+    def __init__(self) -> None:
+        self.timers: Dict[str, float] = collections.defaultdict(float)
+        self.counters: Dict[str, int] = collections.defaultdict(int)
+
+    def lap(self, phase: str, since: float) -> float:
+        """
+        Adds time elapsed since `since` to the phase timer.
+
+        Returns
+        -------
+        float
+            current time, so laps can be chained
+        """
+        now = perf_counter()
+        self.timers[phase] += now - since
+        return now
+
+    def count(self, event: str, n: int = 1) -> None:
+        self.counters[event] += n
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Returns the current timers and counters (as a flat dictionary
+        suitable for metrics) and resets them.
+        """
+        result: Dict[str, float] = {}
+        result.update(('time_' + phase, elapsed)
+                      for phase, elapsed in self.timers.items())
+        result.update(self.counters)
+
+        self.timers.clear()
+        self.counters.clear()
+
+        return result
+
+
+_active: Optional[Profiler] = None
+
+
+@contextmanager
+def activated(profiler: Optional[Profiler]):
+    """
+    Activates the profiler (None disables profiling) within the context.
+    """
+    global _active
+    previous, _active = _active, profiler
+    try:
+        yield profiler
+    finally:
+        _active = previous
+
+
+def start() -> float:
+    """
+    Returns the time the phase starts (0.0 when profiling is disabled).
+    """
+    return perf_counter() if _active is not None else 0.0
+
+
+def lap(phase: str, since: float) -> float:
+    """
+    Records the phase of the active profiler, see `Profiler.lap`.
+    """
+    if _active is None:
+        return 0.0
+    return _active.lap(phase, since)
+
+
+def count(event: str, n: int = 1) -> None:
+    """
+    Counts the event in the active profiler.
+    """
+    if _active is not None:
+        _active.counters[event] += n
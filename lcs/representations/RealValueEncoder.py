@@ -1,5 +1,7 @@
 from typing import Tuple
 
+import numpy as np
+
 
 class RealValueEncoder:
     r"""
@@ -48,6 +50,30 @@ class RealValueEncoder:
 
         return round(val * self.resolution)
 
+    def encode_many(self, values) -> np.ndarray:
+        """
+        Encodes many float values at once (see `encode`).
+
+        Parameters
+        ----------
+        values : array_like
+            real-valued numbers in range [0,1] (sequence, NumPy array
+            or buffer)
+
+        Returns
+        -------
+        np.ndarray
+            array of discrete states within resolution
+        """
+        values = np.asarray(values, dtype=np.float64)
+
+        # Negated, so NaN values are rejected as well
+        if not ((values >= 0) & (values <= 1)).all():
+            raise ValueError("Value is not normalized within [0,1] range")
+
+        # Rounding half to even, the same as `round`
+        return np.rint(values * self.resolution).astype(np.int64)
+
     def decode(self, encoded_val: int) -> float:
         """
         Decodes a discrete value to real-valued representation (still [0,1]
@@ -68,3 +94,25 @@ class RealValueEncoder:
             raise ValueError("Value is not from possible resolution range")
 
         return encoded_val / self.resolution
+
+    def decode_many(self, encoded_values) -> np.ndarray:
+        """
+        Decodes many discrete values at once (see `decode`).
+
+        Parameters
+        ----------
+        encoded_values : array_like
+            encoded values (sequence, NumPy array or buffer)
+
+        Returns
+        -------
+        np.ndarray
+            array of real-valued numbers from [0,1] range
+        """
+        encoded_values = np.asarray(encoded_values)
+
+        if not ((encoded_values >= 0) &
+                (encoded_values <= self.resolution)).all():
+            raise ValueError("Value is not from possible resolution range")
+
+        return encoded_values / self.resolution
@@ -1,25 +1,25 @@
-from dataclasses import dataclass
-
-
-@dataclass
 class UBR:
     """
     Real-value representation for unordered-bounded values.
+
+    UBRs are immutable - the bounds (and the span between them) are
+    calculated once when the object is created, so they can be safely
+    shared between conditions and effects of many classifiers.
     """
-    x1: int
-    x2: int
 
-    @property
-    def lower_bound(self) -> int:
-        return min(self.x1, self.x2)
+    __slots__ = ['x1', 'x2', 'lower_bound', 'upper_bound', 'bound_span',
+                 '_hash']
 
-    @property
-    def upper_bound(self) -> int:
-        return max(self.x1, self.x2)
+    def __init__(self, x1: int, x2: int) -> None:
+        lower_bound, upper_bound = (x1, x2) if x1 <= x2 else (x2, x1)
 
-    @property
-    def bound_span(self) -> int:
-        return sum(1 for _ in range(self.lower_bound, self.upper_bound))
+        init = object.__setattr__
+        init(self, 'x1', x1)
+        init(self, 'x2', x2)
+        init(self, 'lower_bound', lower_bound)
+        init(self, 'upper_bound', upper_bound)
+        init(self, 'bound_span', upper_bound - lower_bound)
+        init(self, '_hash', hash((lower_bound, upper_bound)))
 
     def incorporates(self, other: "UBR") -> bool:
         """
@@ -41,9 +41,27 @@ class UBR:
     def __contains__(self, item):
         return self.lower_bound <= item <= self.upper_bound
 
+    def __setattr__(self, name, value):
+        raise AttributeError("UBR is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("UBR is immutable")
+
+    def __reduce__(self):
+        return UBR, (self.x1, self.x2)
+
     def __hash__(self):
-        return hash((self.lower_bound, self.upper_bound))
+        return self._hash
 
     def __eq__(self, o) -> bool:
-        return self.lower_bound == o.lower_bound \
+        if self is o:
+            return True
+        if not isinstance(o, UBR):
+            return NotImplemented
+
+        return self._hash == o._hash \
+            and self.lower_bound == o.lower_bound \
             and self.upper_bound == o.upper_bound
+
+    def __repr__(self):
+        return "UBR(x1={}, x2={})".format(self.x1, self.x2)
@@ -1,7 +1,9 @@
-from lcs.strategies.subsumption import does_subsume
+from lcs import profiling
+from lcs.strategies.subsumption import does_subsume, subsumer_candidates
 
 
-def add_classifier(child, population, new_list, theta_exp: int) -> None:
+def add_classifier(child, population, new_list, theta_exp: int,
+                   index=None) -> None:
     """
     Looks for subsuming / similar classifiers in the population of classifiers
     and those created in the current ALP run (`new_list`).
@@ -19,16 +21,24 @@ def add_classifier(child, population, new_list, theta_exp: int) -> None:
         A list of newly created classifiers in this ALP run
     theta_exp: int
         experience threshold for subsumption
+    index: Optional[SimilarityIndex]
+        index of the whole population used instead of scanning
+        `population` (see `subsumer_candidates`)
     """
     # C++: ClassifierList::insertALPOffspringToNewList()
     # TODO: p0: write tests
     old_cl = None
 
     # Look if there is a classifier that subsumes the insertion candidate
-    for cl in population:
+    t = profiling.start()
+    for cl in subsumer_candidates(child, population, index):
         if does_subsume(cl, child, theta_exp):
             if old_cl is None or cl.is_more_general(old_cl):
                 old_cl = cl
+    profiling.lap('subsumption', t)
+
+    if old_cl is not None:
+        profiling.count('subsumption')
 
     # Check if any similar classifier was in this ALP run
     if old_cl is None:
@@ -38,9 +48,12 @@ def add_classifier(child, population, new_list, theta_exp: int) -> None:
 
     # Check if there is similar classifier already
     if old_cl is None:
-        for cl in population:
-            if cl == child:
-                old_cl = cl
+        similar = index.similar(child, among=population) \
+            if index is not None else None
+        if similar is None:
+            similar = [cl for cl in population if cl == child]
+        if similar:
+            old_cl = similar[-1]
 
     if old_cl is None:
         new_list.append(child)
@@ -1,8 +1,10 @@
 import random
-from typing import Callable, Dict
+from typing import Callable
 
-from lcs import Perception
-from lcs.strategies.subsumption import find_subsumers
+from lcs import Perception, profiling
+from lcs.strategies.selection import fitness_weights, roulette_wheel
+from lcs.strategies.subsumption import find_subsumers, \
+    subsumer_candidates
 
 
 def should_apply(action_set, time: int, theta_ga: int) -> bool:
@@ -30,8 +32,17 @@ def should_apply(action_set, time: int, theta_ga: int) -> bool:
     if action_set is None:
         return False
 
-    overall_time = sum(cl.tga * cl.num for cl in action_set)
-    overall_num = sum(cl.num for cl in action_set)
+    # Populations kept in array stores expose their parameters directly
+    arrays = action_set.arrays('tga', 'num') \
+        if hasattr(action_set, 'arrays') else None
+
+    if arrays is not None:
+        tga, num = arrays
+        overall_time = int((tga * num).sum())
+        overall_num = int(num.sum())
+    else:
+        overall_time = sum(cl.tga * cl.num for cl in action_set)
+        overall_num = sum(cl.num for cl in action_set)
 
     if overall_num == 0:
         return False
@@ -76,10 +87,8 @@ def roulette_wheel_selection(population, fitnessfunc: Callable):
     tuple
         two classifiers selected as parents
     """
-    choices = {cl: fitnessfunc(cl) for cl in population}
-
-    parent1 = _weighted_random_choice(choices)
-    parent2 = _weighted_random_choice(choices)
+    parent1, parent2 = roulette_wheel(
+        population, fitness_weights(population, fitnessfunc), k=2)
 
     return parent1, parent2
 
@@ -147,7 +156,9 @@ def add_classifier(cl, p: Perception,
     theta_exp: int
         subsumption experience threshold
     """
-    old_cl = _find_old_classifier(action_set, cl, do_subsumption, theta_exp)
+    old_cl = _find_old_classifier(action_set, cl, do_subsumption, theta_exp,
+                                  getattr(population, 'similarity_index',
+                                          None))
 
     if old_cl is None:
         population.append(cl)
@@ -175,27 +186,52 @@ def delete_classifiers(population, match_set, action_set,
         The action set size threshold (θas ∈ N) specifies
         the maximal number of classifiers in an action set.
     """
-    while (insize + sum(cl.num for cl in action_set)) > theta_as:
+    numerosity = sum(cl.num for cl in action_set)
+
+    while insize + numerosity > theta_as:
         cl_del = None
 
         while cl_del is None:  # We must delete at least one
-            for cl in action_set.expand():
-                if random.random() < .3:
+            for position, cl in enumerate(action_set):
+                # Each micro-classifier is considered with 0.3 probability.
+                # Considering another copy of the same classifier never
+                # changes the choice, so the macro-classifier is considered
+                # when at least one of its copies is.
+                if random.random() < 1 - 0.7 ** cl.num:
                     if cl_del is None:
-                        cl_del = cl
+                        cl_del, del_position = cl, position
                     else:
                         if _is_preferred_to_delete(cl_del, cl):
-                            cl_del = cl
+                            cl_del, del_position = cl, position
 
         if cl_del is not None:
+            profiling.count('deletion')
+            numerosity -= 1
             if cl_del.num > 1:
                 cl_del.num -= 1
             else:
                 # Removes classifier from population, match set
-                # and current list
-                lists = [x for x in [population, match_set, action_set] if x]
-                for lst in lists:
-                    lst.safe_remove(cl_del)
+                # and current list (by identity - classifiers are never
+                # compared with each other)
+                for lst in [x for x in [population, match_set] if x]:
+                    _remove_identical(lst, cl_del)
+                del action_set[del_position]
+
+
+def _remove_identical(classifiers, cl) -> None:
+    """
+    Removes the classifier itself (not an equal one) from the list.
+    Lists with identity index (see `use_identity_index`) find it without
+    scanning, other lists are scanned comparing identities.
+    """
+    if getattr(classifiers, 'identity_index', None) is not None:
+        classifiers.safe_remove(cl)
+        return
+
+    for position, other in enumerate(classifiers):
+        if other is cl:
+            del classifiers[position]
+            return
 
 
 def _is_preferred_to_delete(cl_del, cl) -> bool:
@@ -227,22 +263,31 @@ def _is_preferred_to_delete(cl_del, cl) -> bool:
 
 
 def _find_old_classifier(
-        population, cl, use_subsumption: bool, theta_exp: int):
+        population, cl, use_subsumption: bool, theta_exp: int, index=None):
 
     old_cl = None
 
     if use_subsumption:
-        subsumers = find_subsumers(cl, population, theta_exp)
+        t = profiling.start()
+        subsumers = find_subsumers(
+            cl, subsumer_candidates(cl, population, index), theta_exp)
+        profiling.lap('subsumption', t)
 
         # Try to find most general subsumer
         try:
             old_cl = subsumers[0]
+            profiling.count('subsumption')
         except IndexError:
             pass
 
     # If there is no subsumer - look for similar classifiers
     if old_cl is None:
-        old_cl = _find_similar(cl, population)
+        similar = index.similar(cl, among=population) \
+            if index is not None else None
+        if similar is None:
+            old_cl = _find_similar(cl, population)
+        elif similar:
+            old_cl = similar[0]
 
     return old_cl
 
@@ -264,14 +309,3 @@ def _find_similar(other_cl, population):
         None otherwise
     """
     return next(filter(lambda cl: cl == other_cl, population), None)
-
-
-def _weighted_random_choice(choices: Dict):
-    max = sum(choices.values())
-    pick = random.uniform(0, max)
-    current = 0
-
-    for key, value in choices.items():
-        current += value
-        if current > pick:
-            return key
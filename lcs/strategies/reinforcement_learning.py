@@ -25,3 +25,62 @@ def update_classifier(cl, step_reward: int, max_fitness: float,
     # Update classifier properties
     cl.r += beta * (_reward - cl.r)
     cl.ir += beta * (step_reward - cl.ir)
+
+
+def update_classifiers(classifiers, step_reward: int, max_fitness: float,
+                       beta: float, gamma: float):
+    """
+    Applies Reinforcement Learning to the whole set of classifiers (i.e.
+    action set) in one call. Results are identical to calling
+    `update_classifier` for each classifier.
+
+    If the set exposes `batch()` returning an array store with slots of
+    its classifiers (see `lcs.agents.acs2.ClassifiersStore`) the update is
+    performed with array operations.
+
+    Parameters
+    ----------
+    classifiers:
+        set of classifiers with `r` and `ir` properties
+    step_reward: int
+        current reward obtained from the environment after executing step
+    max_fitness: float
+        maximum fitness - back-propagated reinforcement. Maximum fitness
+        from the match set
+    beta: float
+    gamma: float
+    """
+    batch = classifiers.batch() if hasattr(classifiers, 'batch') else None
+
+    if batch is not None:
+        store, slots = batch
+        update_arrays(store.r, store.ir, slots,
+                      step_reward, max_fitness, beta, gamma)
+    else:
+        for cl in classifiers:
+            update_classifier(cl, step_reward, max_fitness, beta, gamma)
+
+
+def update_arrays(r, ir, slots, step_reward: int, max_fitness: float,
+                  beta: float, gamma: float):
+    """
+    Array version of `update_classifier`. Reward and immediate reward
+    arrays are updated in place at given positions.
+
+    Parameters
+    ----------
+    r:
+        array of reward predictions
+    ir:
+        array of immediate rewards
+    slots:
+        indices of updated classifiers (should not repeat)
+    step_reward: int
+    max_fitness: float
+    beta: float
+    gamma: float
+    """
+    _reward = step_reward + gamma * max_fitness
+
+    r[slots] += beta * (_reward - r[slots])
+    ir[slots] += beta * (step_reward - ir[slots])
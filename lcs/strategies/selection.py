@@ -0,0 +1,66 @@
+import random
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+
+def fitness_weights(population, fitnessfunc: Callable) -> np.ndarray:
+    """
+    Evaluates the fitness of every object in population once.
+
+    Parameters
+    ----------
+    population
+        population of classifiers
+    fitnessfunc: Callable
+        function evaluating fitness for each classifier
+
+    Returns
+    -------
+    np.ndarray
+        array of weights in the order of population
+    """
+    return np.fromiter((fitnessfunc(cl) for cl in population),
+                       dtype=float, count=len(population))
+
+
+def roulette_wheel(population: Sequence,
+                   weights: Sequence[float],
+                   k: int = 1,
+                   randomfunc: Optional[Callable[[], float]] = None) -> List:
+    """
+    Draws `k` objects from population (with replacement) with
+    probabilities proportional to their weights.
+
+    The cumulative sum of weights is computed once and every draw
+    is a binary search in it.
+
+    Parameters
+    ----------
+    population: Sequence
+        objects to choose from
+    weights: Sequence[float]
+        non-negative weights (i.e. fitness) of the objects
+    k: int
+        number of draws
+    randomfunc: Optional[Callable[[], float]]
+        source of uniform numbers from [0, 1), `random.random` by default
+
+    Returns
+    -------
+    List
+        `k` chosen objects
+    """
+    if randomfunc is None:
+        randomfunc = random.random
+
+    cumulative = np.cumsum(weights, dtype=float)
+    total = cumulative[-1]
+
+    picks = np.array([total * randomfunc() for _ in range(k)])
+    positions = np.searchsorted(cumulative, picks, side='right')
+
+    # Pick can be equal to the total weight due to rounding - the last
+    # object with positive weight is chosen then
+    last = int(np.searchsorted(cumulative, total))
+    return [population[min(pos, last)] for pos in positions.tolist()]
@@ -1,4 +1,33 @@
-from typing import List
+from typing import List, Sequence
+
+
+def subsumer_candidates(cl, classifiers: Sequence, index=None) -> Sequence:
+    """
+    Narrows `classifiers` to those which may subsume `cl`.
+
+    Parameters
+    ----------
+    cl:
+        classifier
+    classifiers: Sequence
+        classifiers examined (i.e. action set)
+    index: Optional[SimilarityIndex]
+        index of the whole population
+
+    Returns
+    -------
+    Sequence
+        `classifiers` with the same action and effect (found in the index)
+        if there are less of them in the population, all `classifiers`
+        otherwise
+    """
+    if index is not None:
+        bucket = index.subsumer_candidates(
+            cl, limit=len(classifiers), among=classifiers)
+        if bucket is not None:
+            return bucket
+
+    return classifiers
 
 
 def find_subsumers(cl, population, theta_exp: int) -> List:
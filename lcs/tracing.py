@@ -0,0 +1,57 @@
+"""
+Level-gated tracing of agents inner loops.
+
+Agents report what happens in each trial using standard loggers with
+three levels of detail:
+
+* `TRIAL` (INFO) - summaries of trials,
+* `STEP` (DEBUG) - every step taken (current state, environment
+  rendering, chosen action),
+* `SETS` (5, named TRACE) - full dumps of match and action sets.
+
+Enabled levels are checked once per trial (see `Tracer`), so when tracing
+is turned off the loops do not build messages, render the environment or
+print classifiers sets at all.
+
+Example::
+
+    logging.getLogger('lcs.agents.acs2').setLevel(tracing.SETS)
+"""
+import logging
+
+TRIAL = logging.INFO
+STEP = logging.DEBUG
+SETS = 5
+
+logging.addLevelName(SETS, 'TRACE')
+
+
+class Tracer:
+    """
+    Snapshot of the tracing levels enabled for the logger.
+
+    Parameters
+    ----------
+    logger: logging.Logger
+        logger used for tracing
+    """
+
+    __slots__ = ['logger', 'trials', 'steps', 'sets']
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+        self.trials = logger.isEnabledFor(TRIAL)
+        self.steps = logger.isEnabledFor(STEP)
+        self.sets = logger.isEnabledFor(SETS)
+
+    def trial(self, msg: str, *args) -> None:
+        if self.trials:
+            self.logger.log(TRIAL, msg, *args)
+
+    def step(self, msg: str, *args) -> None:
+        if self.steps:
+            self.logger.log(STEP, msg, *args)
+
+    def dump(self, msg: str, *args) -> None:
+        if self.sets:
+            self.logger.log(SETS, msg, *args)
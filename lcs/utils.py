@@ -1,8 +1,37 @@
 from typing import Callable
 
+_validation = True
+
+
+def set_validation(enabled: bool) -> bool:
+    """
+    Switches type checks of perception attributes and elements of typed
+    lists (enabled by default). Lists built by the library itself from
+    elements which were already checked are never validated, so checks
+    can be disabled in production once environments are known to
+    produce valid observations.
+
+    Parameters
+    ----------
+    enabled: bool
+        whether elements should be validated
+
+    Returns
+    -------
+    bool
+        previous setting
+    """
+    global _validation
+    previous, _validation = _validation, enabled
+    return previous
+
+
+def validation_enabled() -> bool:
+    return _validation
+
 
 def check_types(oktypes, o):
-    if not isinstance(o, oktypes):
+    if _validation and not isinstance(o, oktypes):
         raise TypeError(
             "Wrong element type: object {}, type {}".format(o, type(o)))
 
@@ -0,0 +1,192 @@
+"""
+Environments running in worker processes.
+
+Stepping CPU-heavy environments (i.e. simulators) in the same process
+as the agent makes them compete for the interpreter. `EnvWorker` creates
+the environment inside a separate process and forwards `reset` and
+`step` calls to it through a pipe, so it can be used in place of the
+environment::
+
+    envs = [EnvWorker(make_env, seed=seed) for seed in range(4)]
+    population, metrics = agent.explore_vectorized(envs, trials=1000)
+
+Actions can also be sent without waiting for the outcome (`step_async`
+followed by `step_wait`). Agents exploring many environments at once
+(`ACS2.explore_vectorized`) do so, therefore environments compute next
+observations while the agent learns.
+
+Environment factory is sent to the worker process, therefore it must be
+picklable (i.e. defined at module level). Only the methods of the
+environment are available - attributes can be read with `call`
+using `getattr` semantics.
+
+Workers can be used by agent methods which only reset, step and render
+the environment (`ACS2.explore` and `ACS2.explore_vectorized`).
+Exploiting reads the wrapped environment (`env.env`) directly, which
+is not available in the main process.
+"""
+import multiprocessing
+from typing import Any, Callable, Optional, Tuple
+
+from lcs.experiments import seed_everything
+
+_RESET, _STEP, _CALL, _CLOSE = range(4)
+
+
+def _work(conn, env_factory: Callable, seed: Optional[int]) -> None:
+    env = env_factory()
+    if seed is not None:
+        seed_everything(seed, env)
+
+    while True:
+        command, args = conn.recv()
+        if command == _CLOSE:
+            break
+
+        try:
+            if command == _RESET:
+                result = env.reset()
+            elif command == _STEP:
+                result = env.step(*args)
+            else:
+                name, args, kwargs = args
+                attr = getattr(env, name)
+                result = attr(*args, **kwargs) if callable(attr) else attr
+        except Exception as e:
+            conn.send((False, e))
+        else:
+            conn.send((True, result))
+
+    conn.close()
+
+
+class EnvWorker:
+    """
+    Proxy of the environment created in a worker process.
+
+    Parameters
+    ----------
+    env_factory: Callable
+        function creating the environment
+    seed: Optional[int]
+        seed of random number generators in the worker process
+        (and of the environment if it supports seeding)
+    """
+
+    def __init__(self,
+                 env_factory: Callable,
+                 seed: Optional[int] = None) -> None:
+        self._name = getattr(env_factory, '__name__', repr(env_factory))
+        self._conn, worker_conn = multiprocessing.Pipe()
+        self._process: Optional[multiprocessing.Process] = \
+            multiprocessing.Process(
+                target=_work, args=(worker_conn, env_factory, seed),
+                daemon=True)
+        self._process.start()
+        worker_conn.close()
+
+        self._waiting = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def reset(self):
+        return self._request(_RESET)
+
+    def step(self, action) -> Tuple[Any, float, bool, Any]:
+        self.step_async(action)
+        return self.step_wait()
+
+    def step_async(self, action) -> None:
+        """
+        Sends the action to the environment without waiting
+        for the outcome.
+        """
+        self._send(_STEP, (action,))
+        self._waiting = True
+
+    def step_wait(self) -> Tuple[Any, float, bool, Any]:
+        """
+        Waits for the outcome of the action sent with `step_async`.
+        """
+        if not self._waiting:
+            raise RuntimeError("No action was sent to the environment")
+
+        self._waiting = False
+        return self._receive()
+
+    @property
+    def env(self):
+        raise AttributeError(
+            "Environment of the worker is not available in the main "
+            "process, use `call` to access it")
+
+    def render(self, mode='human'):
+        return self.call('render', mode)
+
+    def call(self, name: str, *args, **kwargs):
+        """
+        Calls the method of the environment (or returns its attribute).
+        """
+        return self._request(_CALL, (name, args, kwargs))
+
+    def close(self) -> None:
+        """
+        Stops the worker process. Nothing happens if it was already
+        stopped.
+        """
+        if self._process is None:
+            return
+
+        try:
+            if self._waiting:
+                self._conn.recv()
+            self._conn.send((_CLOSE, None))
+        except (BrokenPipeError, EOFError):
+            pass
+
+        self._conn.close()
+        self._process.join()
+        self._process = None
+
+    def _request(self, command: int, args=()):
+        if self._waiting:
+            raise RuntimeError("Waiting for the outcome of the action")
+
+        self._send(command, args)
+        return self._receive()
+
+    def _send(self, command: int, args) -> None:
+        if self._process is None:
+            raise RuntimeError("Worker process was stopped")
+
+        try:
+            self._conn.send((command, args))
+        except (BrokenPipeError, ConnectionResetError):
+            raise self._died() from None
+
+    def _receive(self):
+        try:
+            success, result = self._conn.recv()
+        except (EOFError, ConnectionResetError):
+            raise self._died() from None
+
+        if not success:
+            raise result
+
+        return result
+
+    def _died(self) -> RuntimeError:
+        self._waiting = False
+
+        pid, exitcode = None, None
+        if self._process is not None:
+            self._process.join(timeout=1)
+            pid, exitcode = self._process.pid, self._process.exitcode
+
+        return RuntimeError(
+            "Worker process of {} environment (pid {}) died, exit code {}"
+            .format(self._name, pid, exitcode))
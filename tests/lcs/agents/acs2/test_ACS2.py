@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from lcs.agents.acs2 import ACS2, Configuration
+from tests.lcs.helpers import Corridor, ToyEnvironment, describe
+
+
+class TestACS2:
+
+    @pytest.mark.parametrize("_env, _cfg", [
+        (ToyEnvironment, {}),
+        (Corridor, {'do_ga': True}),
+        (Corridor, {'do_ga': True, 'use_identity_index': True}),
+    ])
+    def test_should_explore_single_environment_as_usual(self, _env, _cfg):
+        # given
+        cfg = Configuration(4, 2, **_cfg)
+
+        # when
+        random.seed(3)
+        population, metrics = ACS2(cfg).explore(_env(), 40)
+        random.seed(3)
+        vectorized, vectorized_metrics = \
+            ACS2(cfg).explore_vectorized([_env()], 40)
+
+        # then
+        assert describe(vectorized) == describe(population)
+        assert vectorized_metrics == metrics
+
+    def test_should_explore_multiple_environments(self):
+        # given
+        cfg = Configuration(4, 2, do_ga=True, theta_ga=5)
+        random.seed(5)
+
+        # when
+        population, metrics = ACS2(cfg).explore_vectorized(
+            [Corridor() for _ in range(3)], 50)
+
+        # then
+        assert [m['agent']['trial'] for m in metrics] == list(range(50))
+        assert metrics[-1]['agent']['total_steps'] >= 50
+        assert len(population) > 0
+        assert all(cl in population.identity_index for cl in population)
+        assert all(cl.num > 0 for cl in population)
+
+    def test_should_not_explore_more_trials_than_requested(self):
+        # given
+        cfg = Configuration(4, 2)
+
+        # when
+        population, metrics = ACS2(cfg).explore_vectorized(
+            [ToyEnvironment() for _ in range(4)], 2)
+
+        # then
+        assert len(metrics) == 2
+
+    def test_should_explore_with_alphabet(self):
+        # given
+        cfg = Configuration(4, 2, do_ga=True)
+        interning = Configuration(4, 2, do_ga=True, alphabet='01')
+
+        # when
+        random.seed(3)
+        population, metrics = ACS2(cfg).explore(Corridor(), 40)
+        random.seed(3)
+        interned, interned_metrics = ACS2(interning).explore(Corridor(), 40)
+
+        # then
+        assert describe(interned) == describe(population)
+        assert interned_metrics == metrics
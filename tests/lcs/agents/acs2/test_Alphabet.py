@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from lcs.agents.acs2 import Alphabet, Configuration, EnvironmentAdapter
+
+
+class TestAlphabet:
+
+    def test_should_intern_symbols(self):
+        # given
+        alphabet = Alphabet(['0', '1', '10'])
+        observation = [str(10), np.str_('1'), '0']
+
+        # when
+        interned = alphabet.intern(observation)
+
+        # then
+        assert interned == ['10', '1', '0']
+        assert all(type(symbol) is str for symbol in interned)
+        assert interned[0] is alphabet.symbols[2]
+
+    def test_should_reject_unknown_symbol(self):
+        with pytest.raises(ValueError):
+            Alphabet('01').intern('012')
+
+    def test_should_reject_duplicated_symbols(self):
+        with pytest.raises(ValueError):
+            Alphabet('010')
+
+    def test_should_take_alphabet_from_adapter(self):
+        # given
+        class Adapter(EnvironmentAdapter):
+            alphabet = Alphabet('01')
+
+        # when
+        cfg = Configuration(4, 2, environment_adapter=Adapter)
+
+        # then
+        assert cfg.alphabet is Adapter.alphabet
+        assert Configuration(4, 2, alphabet='01').alphabet.symbols == \
+            ('0', '1')
+        assert Configuration(4, 2).alphabet is None
+
+    def test_should_reject_wildcard_symbol(self):
+        with pytest.raises(ValueError):
+            Configuration(4, 2, alphabet='01#')
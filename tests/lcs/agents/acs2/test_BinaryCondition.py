@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs2 import Condition, BinaryCondition
+from lcs.agents.acs2.BinaryCondition import pack
+
+
+class TestBinaryCondition:
+
+    @pytest.mark.parametrize("_symbols, _care, _value", [
+        ('', 0, 0),
+        ('####', 0b0000, 0b0000),
+        ('1###', 0b0001, 0b0001),
+        ('0##1', 0b1001, 0b1000),
+        ('1010', 0b1111, 0b0101),
+    ])
+    def test_should_pack(self, _symbols, _care, _value):
+        assert pack(_symbols) == (_care, _value)
+
+    def test_should_pack_perception_once(self):
+        # given
+        p0 = Perception('1010')
+        conditions = [BinaryCondition(c) for c in ('1###', '0###', '#0#0')]
+
+        # when
+        matching = [cond.does_match(p0) for cond in conditions]
+        packed = pack(p0)
+
+        # then
+        assert matching == [True, False, True]
+        assert pack(p0) is packed
+        assert not hasattr(p0, '_packed')
+
+    def test_should_not_pack_non_binary_symbols(self):
+        with pytest.raises(ValueError):
+            pack('10#2')
+
+    def test_should_behave_like_list_condition(self):
+        # given
+        cond = BinaryCondition('1#0#')
+
+        # then
+        assert len(cond) == 4
+        assert list(cond) == ['1', '#', '0', '#']
+        assert cond[-1] == '#'
+        assert cond[1:3] == ['#', '0']
+        assert cond == Condition('1#0#')
+        assert Condition('1#0#') == cond
+        assert cond != BinaryCondition('1#00')
+        assert str(cond) == '1#0#'
+
+    @pytest.mark.parametrize("_symbols", [
+        '',
+        '10#1',
+        '1#0##1101#0#1#0###01',
+    ])
+    def test_should_unpack_all_symbols(self, _symbols):
+        # given
+        cond = BinaryCondition(_symbols)
+
+        # then
+        assert tuple(cond) == tuple(_symbols)
+        assert [cond[i] for i in range(len(cond))] == list(_symbols)
+        assert hash(cond) == hash(Condition(_symbols))
+
+    def test_should_set_items(self):
+        # given
+        cond = BinaryCondition('####')
+
+        # when
+        cond[0] = '1'
+        cond[3] = '0'
+        cond[0] = '#'
+
+        # then
+        assert cond == BinaryCondition('###0')
+        with pytest.raises(IndexError):
+            cond[4] = '1'
+        with pytest.raises(ValueError):
+            cond[1] = '2'
+
+    @pytest.mark.parametrize("_condition, _specificity", [
+        ('####', 0),
+        ('#1#0', 2),
+        ('1010', 4),
+    ])
+    def test_should_calculate_specificity(self, _condition, _specificity):
+        assert BinaryCondition(_condition).specificity == _specificity
+
+    def test_should_specialize_and_generalize(self):
+        # given
+        cond = BinaryCondition('1###')
+
+        # when
+        cond.specialize_with_condition(Condition('#01#'))
+        cond.generalize(0)
+
+        # then
+        assert cond == BinaryCondition('#01#')
+
+    def test_should_match_like_list_condition(self):
+        random.seed(11)
+
+        for _ in range(300):
+            c = ''.join(random.choice('01#') for _ in range(6))
+            o = ''.join(random.choice('01#') for _ in range(6))
+            p = Perception(''.join(random.choice('01') for _ in range(6)))
+
+            assert BinaryCondition(c).does_match(p) == \
+                Condition(c).does_match(p)
+            assert BinaryCondition(c).does_match_condition(
+                BinaryCondition(o)) == \
+                Condition(c).does_match_condition(Condition(o))
+
+    def test_should_hash_like_list_condition(self):
+        # given
+        condition = BinaryCondition('1#0#')
+        assert hash(condition) == hash(Condition('1#0#'))
+
+        # when
+        condition.specialize_with_condition(Condition('#1##'))
+
+        # then
+        assert hash(condition) == hash(Condition('110#'))
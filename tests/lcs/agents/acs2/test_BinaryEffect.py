@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs2 import Effect, BinaryEffect, \
+    ProbabilityEnhancedAttribute
+
+
+class TestBinaryEffect:
+
+    def test_should_behave_like_list_effect(self):
+        # given
+        effect = BinaryEffect('#1#0')
+
+        # then
+        assert len(effect) == 4
+        assert effect == Effect('#1#0')
+        assert str(effect) == '#1#0'
+        assert effect.specify_change is True
+        assert BinaryEffect('####').specify_change is False
+        assert effect.is_enhanced() is False
+
+    def test_should_accept_reduced_enhanced_attribute(self):
+        # given
+        effect = BinaryEffect('####')
+
+        # when
+        effect[0] = ProbabilityEnhancedAttribute('1')
+
+        # then
+        assert effect == BinaryEffect('1###')
+
+    def test_should_reject_enhanced_attribute(self):
+        # given
+        effect = BinaryEffect('####')
+
+        # then
+        with pytest.raises(TypeError):
+            effect[0] = ProbabilityEnhancedAttribute({'0': 0.5, '1': 0.5})
+
+    def test_should_anticipate_like_list_effect(self):
+        random.seed(13)
+
+        for _ in range(300):
+            e = ''.join(random.choice('01##') for _ in range(5))
+            p0 = Perception(''.join(random.choice('01') for _ in range(5)))
+            p1 = Perception(''.join(random.choice('01') for _ in range(5)))
+
+            assert BinaryEffect(e).is_specializable(p0, p1) == \
+                Effect(e).is_specializable(p0, p1)
+            assert BinaryEffect(e).does_anticipate_correctly(p0, p1) == \
+                Effect(e).does_anticipate_correctly(p0, p1)
@@ -2,7 +2,7 @@ import pytest
 
 from lcs import Perception
 from lcs.agents.acs2 import Configuration, Classifier, \
-    Condition, Effect
+    Condition, Effect, ProbabilityEnhancedAttribute
 
 
 class TestClassifier:
@@ -28,6 +28,38 @@ class TestClassifier:
 
         # then
         assert (cl1 == cl2) is _result
+        assert (hash(cl1) == hash(cl2)) is _result
+
+    def test_should_hash_equal_enhanced_classifiers_equally(self, cfg):
+        # given
+        cl1 = Classifier(condition='1#######', effect='0#######', cfg=cfg)
+        cl2 = Classifier(condition='1#######', effect='0#######', cfg=cfg)
+        cl1.effect[1] = ProbabilityEnhancedAttribute({'0': 0.3, '1': 0.7})
+        cl2.effect[1] = ProbabilityEnhancedAttribute({'1': 0.4, '0': 0.6})
+        plain = Classifier(condition='1#######', effect='01######', cfg=cfg)
+        reduced = Classifier(condition='1#######', effect='01######',
+                             cfg=cfg)
+        reduced.effect[1] = ProbabilityEnhancedAttribute('1')
+
+        # when
+        hash(cl1)
+        hash(plain)
+
+        # then
+        assert cl1 == cl2 and cl2 == cl1
+        assert hash(cl1) == hash(cl2)
+        assert plain == reduced and reduced == plain
+        assert hash(plain) == hash(reduced)
+        assert cl1 != plain and plain != cl1
+
+        # when
+        cl1.effect[1].increase_probability('0', 0.5)
+        cl2.effect[1].remove_symbol('0')
+
+        # then
+        assert cl1 != cl2 and cl2 != cl1
+        assert cl2 == reduced and reduced == cl2
+        assert hash(cl2) == hash(reduced)
 
     def test_should_calculate_fitness(self, cfg):
         # given
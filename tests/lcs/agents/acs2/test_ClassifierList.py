@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from lcs import Perception
@@ -46,6 +48,101 @@ class TestClassifierList:
         assert cl_1 in match_set
         assert cl_2 in match_set
 
+    def test_should_form_match_set_using_index(self, cfg):
+        # given
+        cl_1 = Classifier(cfg=cfg)
+        cl_2 = Classifier(condition='1###0###', cfg=cfg)
+        cl_3 = Classifier(condition='0###1###', cfg=cfg)
+        cl_4 = Classifier(condition='1#######', cfg=cfg)
+
+        population = ClassifiersList(*[cl_1, cl_2])
+        population.build_match_index()
+        population.extend([cl_3, cl_4])
+        population.safe_remove(cl_1)
+        p0 = Perception('11110000')
+
+        # when
+        match_set = population.form_match_set(p0)
+
+        # then
+        assert len(match_set) == 2
+        assert match_set[0] is cl_2
+        assert match_set[1] is cl_4
+
+    def test_should_remove_by_identity_using_index(self, cfg):
+        # given
+        clss = [Classifier(cfg=cfg) for _ in range(4)]
+        population = ClassifiersList(*clss)
+        population.build_identity_index()
+
+        # when
+        population.safe_remove(clss[2])
+        population.safe_remove(clss[0])
+        population.append(clss[0])
+
+        # then
+        assert len(population) == 3
+        assert population[0] is clss[1]
+        assert population[1] is clss[3]
+        assert population[2] is clss[0]
+        assert population.identity_index.position(clss[0]) == 2
+
+    def test_should_track_similar_classifiers_using_index(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1#######', action=0, cfg=cfg)
+        cl_2 = Classifier(condition='1#######', action=0, cfg=cfg)
+        cl_3 = Classifier(condition='1#######', action=1, cfg=cfg)
+        population = ClassifiersList(*[cl_1, cl_2])
+        population.build_similarity_index()
+
+        # when
+        population.append(cl_3)
+        population.safe_remove(cl_1)
+
+        # then
+        similar = population.similarity_index.similar(cl_1)
+        assert len(similar) == 1
+        assert similar[0] is cl_2
+        assert population.similarity_index.subsumer_candidates(cl_3) == \
+            [cl_3]
+
+    def test_should_form_match_set_using_cache(self, cfg):
+        # given
+        cl_1 = Classifier(cfg=cfg)
+        cl_2 = Classifier(condition='1###0###', cfg=cfg)
+        cl_3 = Classifier(condition='0###1###', cfg=cfg)
+        cl_4 = Classifier(condition='1#######', cfg=cfg)
+        p0 = Perception('11110000')
+
+        population = ClassifiersList(*[cl_1, cl_2])
+        population.build_match_set_cache()
+        assert len(population.form_match_set(p0)) == 2
+
+        population.extend([cl_3, cl_4])
+        population.safe_remove(cl_1)
+
+        # when
+        match_set = population.form_match_set(p0)
+
+        # then
+        assert len(match_set) == 2
+        assert match_set[0] is cl_2
+        assert match_set[1] is cl_4
+
+    def test_should_not_share_cached_match_set(self, cfg):
+        # given
+        cl_1 = Classifier(cfg=cfg)
+        p0 = Perception('11110000')
+
+        population = ClassifiersList(cl_1)
+        population.build_match_set_cache()
+
+        # when
+        population.form_match_set(p0).append(Classifier(cfg=cfg))
+
+        # then
+        assert list(population.form_match_set(p0)) == [cl_1]
+
     def test_should_form_action_set(self, cfg):
         # given
         cl_1 = Classifier(action=0, cfg=cfg)
@@ -118,3 +215,27 @@ class TestClassifierList:
         # then
         assert abs(33.94 - cl.r) < 0.1
         assert abs(10.74 - cl.ir) < 0.1
+
+    @pytest.mark.parametrize("_first_hash", [0, 1])
+    def test_should_add_children_in_creation_order(
+            self, _first_hash, cfg, monkeypatch):
+        # given
+        # (the hashes of the children put them in different orders in a set)
+        monkeypatch.setattr(
+            Classifier, '__hash__',
+            lambda cl: _first_hash ^ (str(cl.condition) > '1'))
+        parents = [Classifier(condition=condition, action=1, quality=0.5,
+                              cfg=cfg)
+                   for condition in ('11110000', '00001111')]
+        population = ClassifiersList(*parents)
+        action_set = ClassifiersList(*parents)
+        random.seed(4)
+
+        # when
+        ClassifiersList.apply_ga(100, population, ClassifiersList(),
+                                 action_set, Perception('11111111'),
+                                 10, 0.5, 0.0, 20, False, 20)
+
+        # then
+        assert [str(cl.condition) for cl in population] == \
+            ['11110000', '00001111', '####000#', '1####000']
@@ -0,0 +1,174 @@
+import random
+
+import pytest
+
+import lcs.strategies.genetic_algorithms as ga
+from lcs.agents.acs2 import Configuration, Classifier, ClassifiersList, \
+    ClassifiersStore, StoredClassifier
+
+
+class TestClassifiersStore:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(4, 2)
+
+    def test_should_adopt_and_release_classifier(self, cfg):
+        # given
+        store = ClassifiersStore()
+        cl = Classifier(effect='1###', quality=0.7, reward=12.5,
+                        numerosity=3, tga=11, tav=2.5, cfg=cfg)
+
+        # when
+        store.adopt(cl)
+
+        # then
+        assert isinstance(cl, StoredClassifier)
+        assert len(store) == 1
+        assert cl.q == 0.7
+        assert cl.num == 3
+        assert cl.talp is None
+        assert store.change[cl._slot]
+
+        # when
+        cl.q = 0.9
+        cl.talp = 5
+        store.release(cl)
+
+        # then
+        assert type(cl) is Classifier
+        assert len(store) == 0
+        assert cl.q == 0.9
+        assert cl.talp == 5
+        assert cl.r == 12.5
+
+    def test_should_refresh_modified_effect(self, cfg):
+        # given
+        cl = Classifier(condition='1###', effect='####', cfg=cfg)
+        population = ClassifiersList(cl)
+        population.build_store()
+        slots = population.store.slots([cl])
+
+        # when
+        cl.effect[2] = '0'
+        population.refresh(cl)
+
+        # then
+        assert population.store.change[cl._slot]
+        assert population.store.maximum_fitness(slots) == cl.fitness
+
+        # when
+        cl.effect[2] = '#'
+        population.refresh(cl)
+
+        # then
+        assert not population.store.change[cl._slot]
+        assert population.store.maximum_fitness(slots) == 0.0
+
+    def test_should_grow(self, cfg):
+        # given
+        store = ClassifiersStore(capacity=2)
+        classifiers = [Classifier(numerosity=i, cfg=cfg) for i in range(10)]
+
+        # when
+        for cl in classifiers:
+            store.adopt(cl)
+
+        # then
+        assert len(store) == 10
+        assert [cl.num for cl in classifiers] == list(range(10))
+
+    def test_should_not_adopt_classifier_from_other_store(self, cfg):
+        # given
+        cl = Classifier(cfg=cfg)
+        ClassifiersStore().adopt(cl)
+
+        # then
+        with pytest.raises(ValueError):
+            ClassifiersStore().adopt(cl)
+
+    def test_should_copy_stored_classifier(self, cfg):
+        # given
+        cl = Classifier(condition='1###', quality=0.8, cfg=cfg)
+        ClassifiersStore().adopt(cl)
+
+        # when
+        child = cl.copy_from(cl, 10)
+
+        # then
+        assert type(child) is Classifier
+        assert child.q == 0.8
+        assert child.tga == 10
+
+
+class TestStoredClassifiersList:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(4, 2)
+
+    def _random_population(self, cfg, n=30):
+        random.seed(3)
+        return [Classifier(effect=random.choice(['####', '1###', '#0##']),
+                           quality=random.random(),
+                           reward=random.random() * 100,
+                           immediate_reward=random.random(),
+                           numerosity=random.randint(1, 5),
+                           tga=random.randint(0, 100),
+                           cfg=cfg) for _ in range(n)]
+
+    def test_should_release_removed_classifiers(self, cfg):
+        # given
+        cl1, cl2 = Classifier(cfg=cfg), Classifier(cfg=cfg)
+        population = ClassifiersList(cl1)
+        population.build_store()
+        population.append(cl2)
+
+        # when
+        population.safe_remove(cl1)
+
+        # then
+        assert type(cl1) is Classifier
+        assert isinstance(cl2, StoredClassifier)
+        assert len(population.store) == 1
+
+    def test_should_calculate_same_maximum_fitness(self, cfg):
+        # given
+        plain = ClassifiersList(*self._random_population(cfg))
+        stored = ClassifiersList(*self._random_population(cfg))
+        stored.build_store()
+        match_set = ClassifiersList(*stored[5:20])
+
+        # then
+        assert match_set.arrays('q') is not None
+        assert plain.get_maximum_fitness() == stored.get_maximum_fitness()
+        assert ClassifiersList(*plain[5:20]).get_maximum_fitness() == \
+            match_set.get_maximum_fitness()
+
+    def test_should_apply_same_reinforcement_learning(self, cfg):
+        # given
+        plain = ClassifiersList(*self._random_population(cfg))
+        stored = ClassifiersList(*self._random_population(cfg))
+        stored.build_store()
+
+        # when
+        for reward, p in [(0, 12.3), (1000, 0.0), (5, 441.7)]:
+            ClassifiersList.apply_reinforcement_learning(
+                plain, reward, p, cfg.beta, cfg.gamma)
+            ClassifiersList.apply_reinforcement_learning(
+                stored, reward, p, cfg.beta, cfg.gamma)
+
+        # then
+        assert [cl.r for cl in plain] == [cl.r for cl in stored]
+        assert [cl.ir for cl in plain] == [cl.ir for cl in stored]
+
+    def test_should_decide_on_ga_the_same_way(self, cfg):
+        # given
+        plain = ClassifiersList(*self._random_population(cfg))
+        stored = ClassifiersList(*self._random_population(cfg))
+        stored.build_store()
+
+        # then
+        for time in range(0, 300, 10):
+            assert ga.should_apply(plain, time, cfg.theta_ga) == \
+                ga.should_apply(stored, time, cfg.theta_ga)
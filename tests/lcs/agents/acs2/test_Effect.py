@@ -166,3 +166,17 @@ class TestEffect:
 
         # then
         assert effect_a == effect_b
+
+    def test_should_hash_like_equal_effects(self):
+        # given
+        effect = Effect("1011")
+        enhanced = Effect(("1", {"0": 1.0}, "1", "1"))
+        assert enhanced == effect
+        assert hash(enhanced) == hash(effect)
+
+        # when
+        enhanced[1].insert_symbol("1")
+
+        # then
+        assert enhanced != effect
+        assert hash(enhanced) != hash(effect)
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs2 import Configuration, Classifier, MatchIndex
+
+
+class TestMatchIndex:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(4, 2)
+
+    def test_should_match_like_condition(self, cfg):
+        # given
+        random.seed(7)
+        index = MatchIndex()
+        classifiers = []
+        for _ in range(200):
+            condition = ''.join(random.choice('01#') for _ in range(4))
+            cl = Classifier(condition=condition, cfg=cfg)
+            classifiers.append(cl)
+            index.add(cl)
+
+        for _ in range(20):
+            p = Perception(''.join(random.choice('01') for _ in range(4)))
+
+            # when
+            matching = index.match(p)
+
+            # then
+            assert matching == [cl for cl in classifiers
+                                if cl.condition.does_match(p)]
+
+    def test_should_keep_insertion_order(self, cfg):
+        # given
+        cl1 = Classifier(condition='1###', cfg=cfg)
+        cl2 = Classifier(cfg=cfg)
+        cl3 = Classifier(condition='##0#', cfg=cfg)
+        index = MatchIndex()
+
+        # when
+        for cl in [cl1, cl2, cl3]:
+            index.add(cl)
+
+        # then
+        matching = index.match(Perception('1100'))
+        assert len(matching) == 3
+        assert matching[0] is cl1
+        assert matching[1] is cl2
+        assert matching[2] is cl3
+
+    def test_should_remove_classifier(self, cfg):
+        # given
+        cl1 = Classifier(condition='1###', cfg=cfg)
+        cl2 = Classifier(condition='1###', cfg=cfg)
+        index = MatchIndex()
+        index.add(cl1)
+        index.add(cl2)
+
+        # when
+        index.remove(cl1)
+
+        # then
+        assert len(index) == 1
+        assert cl1 not in index
+        matching = index.match(Perception('1000'))
+        assert len(matching) == 1
+        assert matching[0] is cl2
+
+    def test_should_compact_after_many_removals(self, cfg):
+        # given
+        classifiers = [Classifier(condition='0###', cfg=cfg)
+                       for _ in range(100)]
+        index = MatchIndex()
+        for cl in classifiers:
+            index.add(cl)
+
+        # when
+        for cl in classifiers[:90]:
+            index.remove(cl)
+
+        # then
+        assert len(index) == 10
+        assert index.match(Perception('0000')) == classifiers[90:]
+
+    def test_should_update_modified_condition(self, cfg):
+        # given
+        cl = Classifier(condition='1###', cfg=cfg)
+        index = MatchIndex()
+        index.add(cl)
+        assert len(index.match(Perception('0000'))) == 0
+
+        # when
+        cl.condition.generalize(0)
+        index.update(cl)
+
+        # then
+        assert len(index.match(Perception('0000'))) == 1
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs2 import Configuration, Classifier, MatchSetCache
+
+
+class TestMatchSetCache:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(4, 2)
+
+    def _matching(self, population, p):
+        return [cl for cl in population if cl.condition.does_match(p)]
+
+    def test_should_reuse_match_set(self, cfg):
+        # given
+        population = [Classifier(condition='1###', cfg=cfg),
+                      Classifier(condition='0###', cfg=cfg)]
+        cache = MatchSetCache()
+        p = Perception('1010')
+        calls = []
+
+        def form():
+            calls.append(p)
+            return self._matching(population, p)
+
+        # when
+        first = cache.match(p, form)
+        second = cache.match(Perception('1010'), form)
+
+        # then
+        assert len(calls) == 1
+        assert first == second == [population[0]]
+
+    def test_should_patch_match_set_after_changes(self, cfg):
+        # given
+        random.seed(5)
+        population = []
+        cache = MatchSetCache()
+        perceptions = [Perception(''.join(random.choice('01')
+                                          for _ in range(4)))
+                       for _ in range(8)]
+
+        for _ in range(300):
+            if population and random.random() < 0.4:
+                cl = population.pop(random.randrange(len(population)))
+                cache.removed(cl)
+            else:
+                condition = ''.join(random.choice('01##') for _ in range(4))
+                cl = Classifier(condition=condition, cfg=cfg)
+                population.append(cl)
+                cache.added(cl)
+
+            p = random.choice(perceptions)
+
+            # when
+            matching = cache.match(
+                p, lambda: self._matching(population, p))
+
+            # then
+            expected = self._matching(population, p)
+            assert len(matching) == len(expected)
+            assert all(a is b for a, b in zip(matching, expected))
+
+    def test_should_invalidate(self, cfg):
+        # given
+        population = [Classifier(condition='1###', cfg=cfg)]
+        cache = MatchSetCache()
+        p = Perception('0000')
+        assert cache.match(p, lambda: self._matching(population, p)) == []
+
+        # when
+        population[0].condition.generalize(0)
+        cache.invalidate()
+
+        # then
+        assert cache.match(p, lambda: self._matching(population, p)) == \
+            population
+
+    def test_should_limit_number_of_entries(self, cfg):
+        # given
+        cache = MatchSetCache(max_size=2)
+
+        # when
+        for p in ['0000', '0001', '0010']:
+            cache.match(Perception(p), lambda: [])
+
+        # then
+        assert len(cache) == 2
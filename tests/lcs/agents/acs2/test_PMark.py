@@ -17,6 +17,27 @@ class TestPMark:
         for m in mark:
             assert 0 == len(m)
 
+    def test_should_create_sets_only_when_accessed(self, cfg):
+        # given
+        mark = PMark(cfg)
+        other = PMark(cfg)
+
+        # when
+        mark[2].add('1')
+
+        # then
+        assert mark._items.count(None) == 7
+        assert list(mark)[2] == {'1'}
+        assert list(mark)[3] == set()
+        assert mark != other
+
+        # when
+        other[2].add('1')
+        other[5].clear()
+
+        # then
+        assert mark == other
+
     def test_should_detect_if_marked(self, cfg):
         mark = PMark(cfg)
         assert mark.is_marked() is False
@@ -1,7 +1,11 @@
+import math
+
+import numpy as np
 import pytest
 
 from lcs.agents.racs import Classifier, Configuration, Condition, Effect
-from lcs.agents.racs.components.genetic_algorithm import mutate
+from lcs.agents.racs.components.genetic_algorithm import mutate, \
+    mutate_many, _norm_cdf
 from lcs.representations import UBR
 from lcs.representations.RealValueEncoder import RealValueEncoder
 
@@ -56,3 +60,36 @@ class TestGeneticAlgorithm:
             assert c.upper_bound == condition[idx].upper_bound
             assert e.lower_bound == effect[idx].lower_bound
             assert e.upper_bound == effect[idx].upper_bound
+
+    def test_should_mutate_many_within_range(self, cfg):
+        # given
+        rng = np.random.default_rng(42)
+        classifiers = [Classifier(
+            condition=Condition([UBR(2, 5), UBR(0, 15)], cfg),
+            effect=Effect([UBR(14, 15), UBR(0, 0)], cfg),
+            cfg=cfg) for _ in range(50)]
+
+        # when
+        mutate_many(classifiers, cfg.encoder.range, 1.0, rng)
+
+        # then
+        for cl in classifiers:
+            c, e = cl.condition, cl.effect
+            assert 0 <= c[0].lower_bound <= 2 and 5 <= c[0].upper_bound
+            assert c[1] == cfg.classifier_wildcard
+            assert 0 <= e[0].lower_bound <= 14 and e[0].upper_bound == 15
+            assert e[1].lower_bound == 0 and 0 <= e[1].upper_bound <= 15
+            assert all(ubr.upper_bound <= 15 for ubr in list(c) + list(e))
+
+        # mutation is random
+        assert len({cl.condition[0] for cl in classifiers}) > 1
+
+    def test_should_calculate_normal_cdf(self):
+        # given
+        z = np.array([-40.0, -1.0, 0.0, 1.96, 40.0])
+
+        # when
+        cdf = _norm_cdf(z)
+
+        # then
+        assert np.allclose(cdf, [0.0, 0.158655254, 0.5, 0.975002105, 1.0])
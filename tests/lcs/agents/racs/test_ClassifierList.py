@@ -52,6 +52,30 @@ class TestClassifierList:
         assert cl2 not in match_set
         assert cl3 in match_set
 
+    def test_should_form_match_set_using_index(self, cfg):
+        # given
+        cl1 = Classifier(cfg=cfg)
+        cl2 = Classifier(condition=Condition([UBR(2, 5), UBR(8, 11)], cfg=cfg),
+                         cfg=cfg)
+        cl3 = Classifier(condition=Condition([UBR(5, 7), UBR(5, 12)], cfg=cfg),
+                         cfg=cfg)
+        cl4 = Classifier(condition=Condition([UBR(0, 4), UBR(4, 9)], cfg=cfg),
+                         cfg=cfg)
+
+        population = ClassifierList(*[cl1, cl2])
+        population.build_interval_index(cfg)
+        population.extend([cl3, cl4])
+        population.safe_remove(cl1)
+        observation = Perception([0.2, 0.6], oktypes=(float,))
+
+        # when
+        match_set = population.form_match_set(observation)
+
+        # then
+        assert len(match_set) == 2
+        assert match_set[0] is cl2
+        assert match_set[1] is cl4
+
     def test_should_form_action_set(self, cfg):
         # given
         cl1 = Classifier(action=0, cfg=cfg)
@@ -96,6 +96,19 @@ class TestCondition:
         cond = Condition(_condition, cfg=cfg)
         assert abs(cond.cover_ratio - _covered_pct) < 0.05
 
+    def test_should_update_cover_ratio_when_attribute_replaced(self, cfg):
+        # given
+        cond = Condition([UBR(0, 15), UBR(4, 10)], cfg=cfg)
+        assert cond.cover_ratio == 0.7
+
+        # when
+        cond[0] = UBR(3, 6)
+        cond.generalize(1)
+
+        # then
+        assert cond.cover_ratio == 0.6
+        assert cond.cover_ratio == Condition(list(cond), cfg).cover_ratio
+
     @pytest.mark.parametrize("_condition, _perception, _result", [
         ([UBR(0, 15), UBR(0, 15)], [0.2, 0.4], True),
         ([UBR(0, 15), UBR(0, 2)], [0.5, 0.5], False),
@@ -0,0 +1,49 @@
+import pytest
+
+from lcs.agents.racs import Configuration, Condition, EncodedPerception
+from lcs.agents.racs.EncodedPerception import encode
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class TestEncodedPerception:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(classifier_length=2,
+                             number_of_possible_actions=2,
+                             encoder=RealValueEncoder(4))
+
+    def test_should_encode_once(self, cfg):
+        # when
+        p = EncodedPerception([0.2, 0.9], cfg.encoder)
+
+        # then
+        assert list(p) == [0.2, 0.9]
+        assert p.encoded == (3, 14)
+        assert p == [0.2, 0.9]
+        assert encode(p, None) is p.encoded
+
+    def test_should_encode_raw_perception(self, cfg):
+        assert encode([0.2, 0.9], cfg.encoder) == (3, 14)
+
+    def test_should_match_same_as_raw_perception(self, cfg):
+        # given
+        cond = Condition([UBR(2, 5), UBR(12, 15)], cfg)
+        raw = [0.2, 0.9]
+
+        # then
+        assert cond.does_match(raw)
+        assert cond.does_match(EncodedPerception(raw, cfg.encoder))
+        assert not cond.does_match(EncodedPerception([0.5, 0.9], cfg.encoder))
+
+    def test_should_encode_long_perception_in_batch(self, cfg):
+        # given
+        observation = [i / 100 for i in range(100)]
+
+        # when
+        p = EncodedPerception(observation, cfg.encoder)
+
+        # then
+        assert p.encoded == tuple(map(cfg.encoder.encode, observation))
+        assert all(type(v) is int for v in p.encoded)
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from lcs.agents.racs import Configuration, Condition, Classifier, \
+    EncodedPerception, IntervalIndex
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class TestIntervalIndex:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(classifier_length=3,
+                             number_of_possible_actions=2,
+                             encoder=RealValueEncoder(4))
+
+    @staticmethod
+    def _random_classifier(cfg):
+        condition = Condition(
+            [UBR(random.randint(0, 15), random.randint(0, 15))
+             if random.random() < 0.5 else cfg.classifier_wildcard
+             for _ in range(cfg.classifier_length)], cfg)
+        return Classifier(condition=condition, cfg=cfg)
+
+    def test_should_match_like_condition(self, cfg):
+        # given
+        random.seed(7)
+        index = IntervalIndex(cfg.classifier_length, cfg.encoder)
+        classifiers = [self._random_classifier(cfg) for _ in range(200)]
+        for cl in classifiers:
+            index.add(cl)
+
+        for _ in range(20):
+            p = EncodedPerception([random.random() for _ in range(3)],
+                                  cfg.encoder)
+
+            # when
+            matching = index.match(p)
+
+            # then
+            assert matching == [cl for cl in classifiers
+                                if cl.condition.does_match(p)]
+
+    def test_should_remove_and_compact(self, cfg):
+        # given
+        random.seed(11)
+        index = IntervalIndex(cfg.classifier_length, cfg.encoder)
+        classifiers = [self._random_classifier(cfg) for _ in range(300)]
+        for cl in classifiers:
+            index.add(cl)
+
+        # when
+        for cl in classifiers[::3] + classifiers[1::3]:
+            index.remove(cl)
+
+        # then
+        remaining = classifiers[2::3]
+        p = [0.3, 0.5, 0.9]
+        assert len(index) == len(remaining)
+        assert index.match(p) == [cl for cl in remaining
+                                  if cl.condition.does_match(p)]
+
+    def test_should_update_modified_condition(self, cfg):
+        # given
+        cl = Classifier(condition=Condition(
+            [UBR(0, 2), UBR(0, 15), UBR(0, 15)], cfg), cfg=cfg)
+        index = IntervalIndex(cfg.classifier_length, cfg.encoder)
+        index.add(cl)
+        p = [0.5, 0.5, 0.5]
+        assert index.match(p) == []
+
+        # when
+        cl.condition.generalize(0)
+        index.update(cl)
+
+        # then
+        assert index.match(p) == [cl]
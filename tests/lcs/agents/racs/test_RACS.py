@@ -0,0 +1,48 @@
+import random
+
+from lcs.agents.racs import Configuration, RACS
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class TestRACS:
+
+    def test_should_seed_random_number_generator(self):
+        # given
+        cfg = Configuration(2, 2, encoder=RealValueEncoder(4), seed=7)
+
+        # when
+        numbers = [RACS(cfg).rng.random() for _ in range(2)]
+
+        # then
+        assert numbers[0] == numbers[1]
+
+    def test_should_restore_random_number_generator(self, tmpdir):
+        # given
+        path = str(tmpdir.join('agent-{trial}.ckpt'))
+        cfg = Configuration(2, 2, encoder=RealValueEncoder(4),
+                            checkpoint_path=path, checkpoint_frequency=5)
+        random.seed(3)
+        agent = RACS(cfg)
+        agent.rng.random()
+        agent._save_checkpoint(5, 0)
+        expected = agent.rng.random()
+
+        # when
+        resumed = RACS.load(path.format(trial=5))
+        resumed._start_training()
+
+        # then
+        assert resumed.rng.random() == expected
+
+    def test_should_create_random_number_generator_when_used(self):
+        # given
+        cfg = Configuration(2, 2, encoder=RealValueEncoder(4))
+        random.seed(3)
+        state = random.getstate()
+
+        # when
+        agent = RACS(cfg)
+
+        # then
+        assert random.getstate() == state
+        assert agent.rng is agent.rng
@@ -1,3 +1,5 @@
+import pytest
+
 from lcs.agents import PerceptionString
 from lcs.representations import UBR
 
@@ -36,7 +38,26 @@ class TestPerceptionString:
         ps = PerceptionString.empty(length, wildcard, oktypes=(UBR, ))
 
         # when
-        ps[0].x1 = 2
+        ps[0] = UBR(2, 16)
 
-        # then (check if objects are not stored using references)
+        # then (UBRs are immutable, so shared objects can't be modified)
+        with pytest.raises(AttributeError):
+            ps[1].x1 = 2
+        assert ps[0].x1 == 2
         assert ps[1].x1 == 0
+        assert wildcard == UBR(0, 16)
+
+    def test_should_update_hash_after_modification(self):
+        # given
+        ps1 = PerceptionString("foo")
+        ps2 = PerceptionString("fox")
+        assert hash(ps1) == hash(PerceptionString("foo"))
+        assert hash(ps1) != hash(ps2)
+        assert ps1 != ps2
+
+        # when
+        ps2[2] = 'o'
+
+        # then
+        assert ps1 == ps2
+        assert hash(ps1) == hash(ps2)
@@ -0,0 +1,58 @@
+"""
+Environments and utilities shared by tests.
+"""
+import random
+
+
+class ToyEnvironment:
+    """
+    Single-step environment - reward is given when the action equals
+    the first bit of random observation.
+    """
+
+    def __init__(self):
+        self.env = self
+        self.state = None
+
+    def reset(self):
+        self.state = [random.choice('01') for _ in range(3)] + ['0']
+        return self.state
+
+    def step(self, action):
+        correct = action == int(self.state[0])
+        self.state = self.state[:-1] + ['1' if correct else '0']
+        return self.state, 1000 if correct else 0, True, {}
+
+    def render(self, mode='human'):
+        return ''.join(self.state)
+
+
+class Corridor:
+    """
+    Multi-step environment - the agent moves left (0) or right (1)
+    and is rewarded when reaching the right end of the corridor.
+    """
+
+    def __init__(self, length=4):
+        self.length = length
+        self.position = None
+
+    def reset(self):
+        self.position = random.randrange(self.length - 1)
+        return self._observation()
+
+    def step(self, action):
+        move = 1 if action == 1 else -1
+        self.position = min(max(self.position + move, 0), self.length - 1)
+        done = self.position == self.length - 1
+        return self._observation(), 1000 if done else 0, done, {}
+
+    def _observation(self):
+        return ['1' if i == self.position else '0'
+                for i in range(self.length)]
+
+
+def describe(population):
+    return [(str(cl.condition), cl.action, str(cl.effect), list(cl.mark),
+             cl.q, cl.r, cl.ir, cl.num, cl.exp, cl.talp, cl.tga, cl.tav)
+            for cl in population]
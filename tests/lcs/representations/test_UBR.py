@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from lcs.representations import UBR
@@ -45,3 +47,24 @@ class TestUBR:
     ])
     def test_should_detect_incorporation(self, ubr1, ubr2, _result):
         assert ubr1.incorporates(ubr2) == _result
+
+    def test_should_be_immutable(self):
+        # given
+        ubr = UBR(5, 2)
+
+        # then
+        with pytest.raises(AttributeError):
+            ubr.x1 = 0
+        assert (ubr.lower_bound, ubr.upper_bound) == (2, 5)
+
+    def test_should_pickle(self):
+        # given
+        ubr = UBR(5, 2)
+
+        # when
+        restored = pickle.loads(pickle.dumps(ubr))
+
+        # then
+        assert restored == ubr
+        assert hash(restored) == hash(ubr)
+        assert (restored.x1, restored.x2) == (5, 2)
@@ -1,5 +1,6 @@
 from random import random
 
+import numpy as np
 import pytest
 
 from lcs.representations.RealValueEncoder import RealValueEncoder
@@ -106,3 +107,42 @@ class TestRealValueEncoder:
         # then
         assert min_val == _min_range
         assert max_val == _max_range
+
+    def test_should_encode_many_like_encode(self):
+        # given
+        encoder = RealValueEncoder(4)
+        values = [0.0, 0.5, 1 / 30, 0.51, 0.99, 1.0]
+
+        # when
+        encoded = encoder.encode_many(np.array(values))
+
+        # then
+        assert encoded.dtype == np.int64
+        assert encoded.tolist() == [encoder.encode(v) for v in values]
+
+    @pytest.mark.parametrize("_values", [
+        [0.5, -0.1],
+        [1.1],
+        [0.5, float('nan')],
+    ])
+    def test_should_deny_illegal_values_when_encoding_many(self, _values):
+        # given
+        encoder = RealValueEncoder(2)
+
+        # then
+        with pytest.raises(ValueError):
+            encoder.encode_many(_values)
+
+    def test_should_decode_many(self):
+        # given
+        encoder = RealValueEncoder(4)
+        encoded = np.array([0, 8, 15])
+
+        # when
+        decoded = encoder.decode_many(encoded)
+
+        # then
+        assert decoded.tolist() == [encoder.decode(v) for v in encoded]
+
+        with pytest.raises(ValueError):
+            encoder.decode_many([3, 16])
@@ -1,4 +1,5 @@
 import itertools
+import random
 from dataclasses import dataclass
 
 import pytest
@@ -147,6 +148,66 @@ class TestGeneticAlgorithms:
         assert sum(cl.num for cl in population) == 18
         assert sum(cl.num for cl in action_set) == 8
 
+    def test_should_delete_from_numerous_worse_classifier(self):
+        # given
+        random.seed(3)
+        cfg = acs2.Configuration(
+            classifier_length=4, number_of_possible_actions=2)
+        worse = acs2.Classifier(
+            condition='1###', action=1, quality=0.1, numerosity=40, cfg=cfg)
+        better = [acs2.Classifier(
+            condition='0###', action=1, quality=0.9, cfg=cfg)
+            for _ in range(5)]
+        population = acs2.ClassifiersList(worse, *better)
+        action_set = population.form_action_set(1)
+
+        # when
+        ga.delete_classifiers(population, None, action_set, 0, 40)
+
+        # then
+        assert worse.num == 35
+        assert len(population) == 6
+
+    def test_should_delete_classifier_by_identity(self):
+        # given
+        random.seed(4)
+        cfg = acs2.Configuration(
+            classifier_length=4, number_of_possible_actions=2)
+        kept = acs2.Classifier(action=1, quality=0.9, cfg=cfg)
+        worse = acs2.Classifier(action=1, quality=0.1, cfg=cfg)
+        population = acs2.ClassifiersList(kept, worse)
+        match_set = acs2.ClassifiersList(kept, worse)
+        action_set = population.form_action_set(1)
+
+        # when
+        ga.delete_classifiers(population, match_set, action_set, 0, 1)
+
+        # then
+        assert kept == worse
+        assert [cl is kept for cl in population] == [True]
+        assert [cl is kept for cl in match_set] == [True]
+        assert [cl is kept for cl in action_set] == [True]
+        assert population.identity_index is None
+
+    def test_should_delete_classifier_using_identity_index(self):
+        # given
+        random.seed(4)
+        cfg = acs2.Configuration(
+            classifier_length=4, number_of_possible_actions=2)
+        kept = acs2.Classifier(action=1, quality=0.9, cfg=cfg)
+        worse = acs2.Classifier(action=1, quality=0.1, cfg=cfg)
+        population = acs2.ClassifiersList(kept, worse)
+        population.build_identity_index()
+        action_set = population.form_action_set(1)
+
+        # when
+        ga.delete_classifiers(population, None, action_set, 0, 1)
+
+        # then
+        assert [cl is kept for cl in population] == [True]
+        assert population.identity_index.position(kept) == 0
+        assert population.identity_index.position(worse) is None
+
     def test_should_not_find_old_classifier(self):
         # given
         cfg = acs2.Configuration(
@@ -33,3 +33,36 @@ class TestReinforcementLearning:
         # then
         assert abs(cl.r - _r1) < 0.001
         assert abs(cl.ir - _ir1) < 0.001
+
+    def test_should_update_classifiers(self):
+        # given
+        classifiers = [Classifier(r=r, ir=ir) for r, ir in
+                       [(0.5, 0.0), (12.3, 4.1), (977.0, 1000.0)]]
+        expected = [Classifier(r=cl.r, ir=cl.ir) for cl in classifiers]
+
+        # when
+        rl.update_classifiers(classifiers, 1000, 441.7, 0.05, 0.95)
+        for cl in expected:
+            rl.update_classifier(cl, 1000, 441.7, 0.05, 0.95)
+
+        # then
+        assert classifiers == expected
+
+    def test_should_update_arrays_like_classifiers(self):
+        # given
+        np = pytest.importorskip('numpy')
+        classifiers = [Classifier(r=r, ir=ir) for r, ir in
+                       [(0.5, 0.0), (12.3, 4.1), (977.0, 1000.0)]]
+        r = np.array([cl.r for cl in classifiers] + [7.0])
+        ir = np.array([cl.ir for cl in classifiers] + [7.0])
+
+        # when
+        for reward, p in [(0, 12.3), (1000, 0.0), (5, 441.7)]:
+            rl.update_arrays(r, ir, np.array([2, 0, 1]),
+                             reward, p, 0.05, 0.95)
+            for cl in classifiers:
+                rl.update_classifier(cl, reward, p, 0.05, 0.95)
+
+        # then
+        assert list(r) == [cl.r for cl in classifiers] + [7.0]
+        assert list(ir) == [cl.ir for cl in classifiers] + [7.0]
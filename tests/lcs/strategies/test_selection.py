@@ -0,0 +1,45 @@
+import random
+from collections import Counter
+
+import numpy as np
+
+from lcs.strategies.selection import fitness_weights, roulette_wheel
+
+
+class TestSelection:
+
+    def test_should_evaluate_fitness_weights(self):
+        # when
+        weights = fitness_weights([1, 2, 3], lambda x: x ** 2)
+
+        # then
+        assert weights.tolist() == [1.0, 4.0, 9.0]
+
+    def test_should_draw_proportionally_to_weights(self):
+        # given
+        random.seed(3)
+        population = ['a', 'b', 'c', 'd']
+        weights = [0.6, 0.3, 0.1, 0.0]
+
+        # when
+        drawn = roulette_wheel(population, weights, k=10000)
+
+        # then
+        stats = Counter(drawn)
+        assert len(drawn) == 10000
+        assert 'd' not in stats
+        assert abs(stats['a'] / 10000 - 0.6) < 0.03
+        assert abs(stats['b'] / 10000 - 0.3) < 0.03
+        assert abs(stats['c'] / 10000 - 0.1) < 0.03
+
+    def test_should_pick_last_weighted_object_at_the_end(self):
+        # given
+        population = ['a', 'b', 'c']
+        weights = np.array([1.0, 2.0, 0.0])
+
+        # when
+        drawn = roulette_wheel(population, weights, k=3,
+                               randomfunc=iter([0.0, 0.5, 1.0]).__next__)
+
+        # then
+        assert drawn == ['a', 'b', 'b']
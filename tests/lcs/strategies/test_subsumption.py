@@ -4,8 +4,10 @@ import lcs.agents.acs2 as acs2
 import lcs.agents.racs as racs
 from lcs.representations import UBR
 from lcs.representations.RealValueEncoder import RealValueEncoder
+import lcs.strategies.anticipatory_learning_process as alp
+from lcs import Perception
 from lcs.strategies.subsumption import find_subsumers, \
-    is_subsumer, does_subsume
+    is_subsumer, does_subsume, subsumer_candidates
 
 
 class TestSubsumption:
@@ -52,6 +54,41 @@ class TestSubsumption:
         assert len(actual_subsumers) == 1
         assert actual_subsumers[0] == subsumer
 
+    def test_should_look_for_subsumers_only_in_action_set(self):
+        # given
+        cfg = acs2.Configuration(4, 2)
+        subsumer = acs2.Classifier(condition='##0#', action=0,
+                                   effect='###1', quality=0.95,
+                                   experience=30, cfg=cfg)
+        others = [acs2.Classifier(condition=c, action=0, cfg=cfg)
+                  for c in ('1###', '#1##', '##1#', '###0', '11##')]
+        population = acs2.ClassifiersList(subsumer, *others)
+        population.build_similarity_index()
+
+        p0 = Perception('1110')
+        action_set = population.form_match_set(p0).form_action_set(0)
+        child = acs2.Classifier(condition='11##', action=0,
+                                effect='###1', cfg=cfg)
+
+        # when
+        candidates = subsumer_candidates(
+            child, action_set, population.similarity_index)
+
+        # then
+        assert subsumer not in action_set
+        assert does_subsume(subsumer, child, cfg.theta_exp)
+        assert find_subsumers(child, candidates, cfg.theta_exp) == \
+            find_subsumers(child, action_set, cfg.theta_exp) == []
+
+        # when
+        new_list = acs2.ClassifiersList()
+        alp.add_classifier(child, action_set, new_list, cfg.theta_exp,
+                           population.similarity_index)
+
+        # then
+        assert list(new_list) == [child]
+        assert subsumer.q == 0.95
+
     def test_should_find_subsumer_among_nonsubsumers(self, acs2_cfg):
         # given
         subsumer = acs2.Classifier(
@@ -0,0 +1,60 @@
+import random
+
+from lcs import IdentityIndex
+
+
+class Item:
+    def __eq__(self, other):
+        # All items are equal, they can be told apart only by identity
+        return isinstance(other, Item)
+
+
+class TestIdentityIndex:
+
+    def test_should_find_positions_by_identity(self):
+        # given
+        items = [Item() for _ in range(10)]
+
+        # when
+        index = IdentityIndex(items)
+
+        # then
+        assert len(index) == 10
+        assert all(index.position(o) == i for i, o in enumerate(items))
+        assert index.position(Item()) is None
+        assert Item() not in index
+
+    def test_should_keep_positions_after_removals(self):
+        # given
+        random.seed(5)
+        items = [Item() for _ in range(300)]
+        index = IdentityIndex(items)
+
+        # when
+        for _ in range(1000):
+            if random.random() < 0.5 and items:
+                o = items.pop(random.randrange(len(items)))
+                index.remove(o)
+            else:
+                o = Item()
+                items.append(o)
+                index.append(o)
+
+        # then
+        assert len(index) == len(items)
+        assert all(index.position(o) == i for i, o in enumerate(items))
+
+    def test_should_compact_dead_slots(self):
+        # given
+        items = [Item() for _ in range(1000)]
+        index = IdentityIndex(items)
+
+        # when
+        for o in items[:900]:
+            index.remove(o)
+        items = items[900:]
+
+        # then
+        assert len(index) == 100
+        assert len(index._slots) <= 2 * len(items) + 64
+        assert all(index.position(o) == i for i, o in enumerate(items))
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from lcs import Perception
@@ -50,3 +51,50 @@ class TestPerception:
         # when & then
         with pytest.raises(TypeError) as _:
             Perception(obs)
+
+    def test_should_wrap_tuple_without_copying(self):
+        # given
+        obs = ('0', '1', '1')
+
+        # when
+        p = Perception(obs, validate=False)
+
+        # then
+        assert p._items is obs
+        assert list(p) == ['0', '1', '1']
+
+    @pytest.mark.parametrize("_obs", [
+        np.array(['0', '1', '1']),
+        b'011',
+        bytearray(b'011'),
+        '011',
+    ])
+    def test_should_handle_numpy_and_bytes_state(self, _obs):
+        # when
+        p = Perception(_obs)
+
+        # then
+        assert list(p) == ['0', '1', '1']
+        assert all(type(el) is str for el in p)
+
+    def test_should_be_hashable(self):
+        # given
+        p1 = Perception('011')
+        p2 = Perception(['0', '1', '1'])
+
+        # then
+        assert p1 == p2
+        assert p1 == ('0', '1', '1')
+        assert p1 != Perception('010')
+        assert hash(p1) == hash(p2) == hash(('0', '1', '1'))
+        assert {p1: 1}[('0', '1', '1')] == 1
+
+    def test_should_skip_validation(self):
+        # given
+        obs = ["f", "o", 0]
+
+        # when
+        p = Perception(obs, validate=False)
+
+        # then
+        assert p[2] == 0
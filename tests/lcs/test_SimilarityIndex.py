@@ -0,0 +1,103 @@
+from lcs import SimilarityIndex
+from lcs.agents.acs2 import Configuration, Classifier, \
+    ProbabilityEnhancedAttribute
+
+
+class TestSimilarityIndex:
+
+    def setup_method(self):
+        self.cfg = Configuration(4, 2)
+
+    def test_should_find_similar_classifiers(self):
+        # given
+        cl_1 = Classifier(condition='1##0', action=0, cfg=self.cfg)
+        cl_2 = Classifier(condition='1##0', action=1, cfg=self.cfg)
+        cl_3 = Classifier(condition='1##0', action=0, cfg=self.cfg)
+        index = SimilarityIndex([cl_1, cl_2, cl_3])
+
+        # when
+        similar = index.similar(
+            Classifier(condition='1##0', action=0, cfg=self.cfg))
+
+        # then
+        assert len(index) == 3
+        assert similar == [cl_1, cl_3]
+        assert similar[0] is cl_1
+        assert similar[1] is cl_3
+
+    def test_should_find_subsumer_candidates(self):
+        # given
+        cl_1 = Classifier(condition='1###', action=0, effect='0###',
+                          cfg=self.cfg)
+        cl_2 = Classifier(condition='1#1#', action=0, effect='0###',
+                          cfg=self.cfg)
+        cl_3 = Classifier(condition='1###', action=0, effect='1###',
+                          cfg=self.cfg)
+        index = SimilarityIndex([cl_1, cl_2, cl_3])
+
+        # when
+        candidates = index.subsumer_candidates(
+            Classifier(condition='1010', action=0, effect='0###',
+                       cfg=self.cfg))
+
+        # then
+        assert len(candidates) == 2
+        assert candidates[0] is cl_1
+        assert candidates[1] is cl_2
+
+    def test_should_remove_classifiers(self):
+        # given
+        cl_1 = Classifier(condition='1###', cfg=self.cfg)
+        cl_2 = Classifier(condition='1###', cfg=self.cfg)
+        index = SimilarityIndex([cl_1, cl_2])
+
+        # when
+        index.remove(cl_1)
+        index.remove(cl_1)
+
+        # then
+        assert cl_1 not in index
+        assert index.similar(cl_1)[0] is cl_2
+
+        index.remove(cl_2)
+        assert index.similar(cl_1) == []
+        assert index.subsumer_candidates(cl_1) == []
+
+    def test_should_keep_insertion_order_after_update(self):
+        # given
+        cl_1 = Classifier(condition='1###', cfg=self.cfg)
+        cl_2 = Classifier(condition='1#1#', cfg=self.cfg)
+        cl_3 = Classifier(condition='1###', cfg=self.cfg)
+        index = SimilarityIndex([cl_1, cl_2, cl_3])
+
+        # when
+        cl_2.condition.generalize(2)
+        index.update(cl_2)
+
+        # then
+        similar = index.similar(cl_1)
+        assert len(similar) == 3
+        assert similar[0] is cl_1
+        assert similar[1] is cl_2
+        assert similar[2] is cl_3
+
+    def test_should_include_enhanced_classifiers(self):
+        # given
+        cl_1 = Classifier(condition='1###', action=0, effect='0###',
+                          cfg=self.cfg)
+        cl_2 = Classifier(condition='1###', action=0, effect='0###',
+                          cfg=self.cfg)
+        cl_2.effect[0] = ProbabilityEnhancedAttribute('0')
+        index = SimilarityIndex([cl_2, cl_1])
+        child = Classifier(condition='1###', action=0, effect='0###',
+                           cfg=self.cfg)
+
+        # when
+        similar = index.similar(child)
+
+        # then
+        assert len(similar) == 2
+        assert similar[0] is cl_2
+        assert similar[1] is cl_1
+        assert index.similar(cl_2) is None
+        assert index.subsumer_candidates(cl_2) is None
@@ -21,6 +21,21 @@ class TestTypedList:
         for el in elems:
             assert el in lst
 
+    def test_should_take_over_trusted_items(self):
+        # given
+        elems = [1, 2, 3]
+
+        # when
+        lst = TypedList._trusted(elems, (int,))
+
+        # then
+        assert lst._items is elems
+        assert lst == TypedList((int,), 1, 2, 3)
+
+        # when & then
+        with pytest.raises(TypeError):
+            lst.append("4")
+
     def test_should_fail_when_prepopulating_list(self):
         # given
         oktypes = (int,)
@@ -0,0 +1,148 @@
+import random
+
+import pytest
+
+from lcs import checkpoint
+from lcs.agents.acs2 import ACS2, Configuration, Classifier, \
+    ClassifiersList, ProbabilityEnhancedAttribute
+from lcs.agents.racs import Configuration as RConfiguration, \
+    Classifier as RClassifier, ClassifierList as RClassifierList, \
+    Condition as RCondition
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+from tests.lcs.helpers import ToyEnvironment, describe
+
+
+class TestCheckpoint:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(4, 2)
+
+    def test_should_save_and_load_population(self, cfg, tmpdir):
+        # given
+        path = str(tmpdir.join('population.ckpt'))
+        cl1 = Classifier(condition='1#0#', action=1, effect='0###',
+                         quality=0.7, reward=312.5, numerosity=2, tga=17,
+                         cfg=cfg)
+        cl1.mark[1].update({'0', '1'})
+        cl2 = Classifier(action=0, talp=5, cfg=cfg)
+        cl2.effect[2] = ProbabilityEnhancedAttribute({'0': 0.3, '1': 0.7})
+        cl2.ee = True
+        population = ClassifiersList(cl1, cl2)
+
+        # when
+        checkpoint.save(path, cfg, population, {'trial': 3})
+        restored = checkpoint.load(path)
+
+        # then
+        assert restored.state == {'trial': 3}
+        assert type(restored.population) is ClassifiersList
+        assert describe(restored.population) == describe(population)
+        assert restored.population[1].ee is True
+        assert restored.population[1].effect[2] == cl2.effect[2]
+        assert all(cl.cfg is restored.cfg
+                   for cl in restored.population)
+        assert restored.population[0].mark.cfg is restored.cfg
+
+    def test_should_load_population_without_validation(
+            self, cfg, tmpdir, monkeypatch):
+        # given
+        path = str(tmpdir.join('population.ckpt'))
+        marked = Classifier(condition='1###', cfg=cfg)
+        marked.mark[0].add('0')
+        population = ClassifiersList(marked, Classifier(cfg=cfg))
+        checkpoint.save(path, cfg, population)
+
+        def fail(*args):
+            raise AssertionError("Population was validated")
+
+        monkeypatch.setattr(ClassifiersList, '__init__', fail)
+
+        # when
+        restored = checkpoint.load(path).population
+
+        # then
+        assert type(restored) is ClassifiersList
+        assert restored[0].mark._items[0] == {'0'}
+        assert restored[1].mark._items == [None] * 4
+        assert not restored[1].mark.is_marked()
+
+    def test_should_load_empty_population(self, cfg, tmpdir):
+        # given
+        path = str(tmpdir.join('population.ckpt'))
+
+        # when
+        checkpoint.save(path, cfg, ClassifiersList())
+
+        # then
+        assert len(checkpoint.load(path).population) == 0
+
+    @pytest.mark.parametrize("_flags", [
+        {'use_bit_packing': True},
+        {'use_array_store': True},
+    ])
+    def test_should_save_optimized_population(self, _flags, tmpdir):
+        # given
+        path = str(tmpdir.join('population.ckpt'))
+        cfg = Configuration(4, 2, **_flags)
+        agent = ACS2(cfg, ClassifiersList(
+            Classifier(condition='1#0#', effect='0###', quality=0.3,
+                       cfg=cfg),
+            Classifier(condition='##0#', effect='###1', cfg=cfg)))
+
+        # when
+        agent.save(path)
+        restored = ACS2.load(path)
+
+        # then
+        assert describe(restored.population) == describe(agent.population)
+        assert type(restored.population[0].condition) is \
+            type(agent.population[0].condition)
+        assert restored.resume_state is None
+
+    def test_should_save_racs_population(self, tmpdir):
+        # given
+        path = str(tmpdir.join('population.ckpt'))
+        cfg = RConfiguration(2, 2, encoder=RealValueEncoder(4))
+        cl = RClassifier(condition=RCondition([UBR(3, 1), UBR(0, 15)],
+                                              cfg=cfg),
+                         action=1, quality=0.8, cfg=cfg)
+        cl.mark[0].add(4)
+        population = RClassifierList(cl)
+
+        # when
+        checkpoint.save(path, cfg, population)
+        restored = checkpoint.load(path).population
+
+        # then
+        assert describe(restored) == describe(population)
+        assert restored[0].condition[0].x1 == 3
+        assert restored[0].condition.cfg is restored[0].cfg
+
+    def test_should_reject_other_files(self, tmpdir):
+        # given
+        path = tmpdir.join('metrics.csv')
+        path.write('agent.trial\n0\n')
+
+        # then
+        with pytest.raises(ValueError):
+            checkpoint.load(str(path))
+
+    def test_should_resume_training(self, tmpdir):
+        # given
+        path = str(tmpdir.join('agent-{trial}.ckpt'))
+        cfg = Configuration(4, 2, do_ga=True, checkpoint_path=path,
+                            checkpoint_frequency=10)
+
+        # when
+        random.seed(11)
+        population, metrics = ACS2(cfg).explore(ToyEnvironment(), 30)
+        resumed = ACS2.load(path.format(trial=10))
+        resumed_population, resumed_metrics = \
+            resumed.explore(ToyEnvironment(), 30)
+
+        # then
+        assert len(resumed_metrics) == 20
+        assert resumed_metrics == metrics[10:]
+        assert describe(resumed_population) == describe(population)
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from lcs.agents.acs2 import ACS2, Configuration
+from lcs.experiments import Run, make_runs, perform_run, run_experiments
+from tests.lcs.helpers import ToyEnvironment
+
+
+class TestExperiments:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(4, 2)
+
+    def test_should_make_runs(self, cfg):
+        # given
+        cfg2 = Configuration(4, 2, do_ga=True)
+
+        # when
+        runs = make_runs([cfg, cfg2], seeds=[7, 8, 9])
+
+        # then
+        assert len(runs) == 6
+        assert [run.run_id for run in runs] == list(range(6))
+        assert [run.seed for run in runs] == [7, 8, 9] * 2
+        assert runs[3].cfg is cfg2
+        assert runs[3].index(cfg2) == 1
+
+    def test_should_reproduce_run(self, cfg):
+        # given
+        run = Run(0, cfg, seed=42)
+
+        # when
+        result1 = perform_run(ACS2, ToyEnvironment, run, trials=50)
+        random.random()
+        result2 = perform_run(ACS2, ToyEnvironment, run, trials=50)
+
+        # then
+        assert result1.run == run
+        assert len(result1.metrics) == 50
+        assert result1.metrics == result2.metrics
+        assert result1.population is None
+
+    def test_should_run_experiments_in_parallel(self, cfg):
+        # given
+        runs = make_runs([cfg], seeds=[1, 2, 3])
+
+        # when
+        results = list(run_experiments(ACS2, ToyEnvironment, runs,
+                                       trials=20, processes=2,
+                                       keep_population=True))
+        sequential = list(run_experiments(ACS2, ToyEnvironment, runs,
+                                          trials=20, processes=1))
+
+        # then
+        results = sorted(results, key=lambda result: result.run.run_id)
+        assert [result.run.run_id for result in results] == [0, 1, 2]
+        assert all(len(result.population) > 0 for result in results)
+        assert [result.metrics for result in results] == \
+            [result.metrics for result in sequential]
+
+    def test_should_reject_unknown_method(self, cfg):
+        with pytest.raises(ValueError):
+            perform_run(ACS2, ToyEnvironment, Run(0, cfg, 1), 1, 'learn')
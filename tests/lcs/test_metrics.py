@@ -0,0 +1,206 @@
+import numpy as np
+import pytest
+
+from lcs.metrics import flatten, ListSink, RingBufferSink, JsonLinesSink, \
+    CsvSink, NumpySink
+
+
+def trial_metrics(trial):
+    return {
+        'agent': {'trial': trial, 'reward': trial * 10, 'quality': 0.5},
+        'environment': None,
+        'performance': {'was_correct': trial % 2 == 0}
+    }
+
+
+class TestMetrics:
+
+    def test_should_flatten_metrics(self):
+        assert flatten(trial_metrics(3)) == {
+            'agent.trial': 3,
+            'agent.reward': 30,
+            'agent.quality': 0.5,
+            'performance.was_correct': False
+        }
+
+    def test_should_keep_all_metrics(self):
+        # given
+        sink = ListSink()
+
+        # when
+        for trial in range(5):
+            sink.write(trial_metrics(trial))
+
+        # then
+        assert sink.metrics == [trial_metrics(i) for i in range(5)]
+
+    def test_should_keep_last_metrics(self):
+        # given
+        sink = RingBufferSink(size=3)
+
+        # when
+        for trial in range(10):
+            sink.write(trial_metrics(trial))
+
+        # then
+        assert sink.metrics == [trial_metrics(i) for i in range(7, 10)]
+
+    def test_should_write_json_lines_in_batches(self, tmpdir):
+        # given
+        path = str(tmpdir.join('metrics.jsonl'))
+        sink = JsonLinesSink(path, batch_size=4)
+
+        # when
+        for trial in range(6):
+            sink.write(trial_metrics(trial))
+
+        # then
+        assert len(JsonLinesSink.load(path)) == 4
+
+        # when
+        sink.close()
+
+        # then
+        assert JsonLinesSink.load(path) == [trial_metrics(i)
+                                            for i in range(6)]
+        assert sink.metrics == []
+
+    def test_should_write_csv(self, tmpdir):
+        # given
+        path = tmpdir.join('metrics.csv')
+
+        # when
+        with CsvSink(str(path), batch_size=2) as sink:
+            for trial in range(3):
+                sink.write(trial_metrics(trial))
+
+        # then
+        lines = path.read().splitlines()
+        assert lines[0] == \
+            'agent.trial,agent.reward,agent.quality,performance.was_correct'
+        assert lines[1:] == ['0,0,0.5,True', '1,10,0.5,False',
+                             '2,20,0.5,True']
+
+    def test_should_write_columns(self, tmpdir):
+        # given
+        directory = str(tmpdir.join('metrics'))
+
+        # when
+        with NumpySink(directory, batch_size=4) as sink:
+            for trial in range(10):
+                sink.write(trial_metrics(trial))
+
+        # then
+        columns = NumpySink.load(directory)
+        assert list(columns['agent.trial']) == list(range(10))
+        assert columns['agent.reward'].sum() == 450
+        assert columns['performance.was_correct'].dtype == bool
+
+    def test_should_add_csv_columns_appearing_later(self, tmpdir):
+        # given
+        path = tmpdir.join('metrics.csv')
+        extended = trial_metrics(2)
+        extended['profile'] = {'counts': {'deletion': 3}}
+
+        # when
+        with CsvSink(str(path), batch_size=2) as sink:
+            for metric in (trial_metrics(0), trial_metrics(1), extended):
+                sink.write(metric)
+
+        # then
+        lines = path.read().splitlines()
+        assert lines[0].endswith(',profile.counts.deletion')
+        assert lines[1:] == ['0,0,0.5,True,', '1,10,0.5,False,',
+                             '2,20,0.5,True,3']
+
+    def test_should_append_csv_rows_when_resumed(self, tmpdir):
+        # given
+        path = tmpdir.join('metrics.csv')
+        with CsvSink(str(path)) as sink:
+            sink.write(trial_metrics(0))
+
+        # when
+        with CsvSink(str(path)) as sink:
+            sink.write(trial_metrics(1))
+
+        # then
+        lines = path.read().splitlines()
+        assert len(lines) == 3
+        assert lines[2] == '1,10,0.5,False'
+
+    def test_should_write_uneven_columns(self, tmpdir):
+        # given
+        directory = str(tmpdir.join('metrics'))
+        metrics = [trial_metrics(trial) for trial in range(6)]
+        for metric in metrics[3:]:
+            metric['profile'] = {'counts': {'covering': 2}}
+        metrics[1]['agent']['reward'] = None
+
+        # when
+        with NumpySink(directory, batch_size=2) as sink:
+            for metric in metrics:
+                sink.write(metric)
+
+        # then
+        columns = NumpySink.load(directory)
+        counts = columns['profile.counts.covering']
+        assert all(column.dtype != object for column in columns.values())
+        assert len(counts) == 6
+        assert np.isnan(counts[:3]).all()
+        assert list(counts[3:]) == [2, 2, 2]
+        assert np.isnan(columns['agent.reward'][1])
+
+    def test_should_save_profiled_agent_metrics(self, tmpdir):
+        # given
+        from lcs.agents.acs2 import ACS2, Configuration
+        from tests.lcs.helpers import ToyEnvironment
+        directory = str(tmpdir.join('metrics'))
+        agent = ACS2(Configuration(4, 2, do_ga=True, use_profiler=True))
+
+        # when
+        with NumpySink(directory, batch_size=4) as sink:
+            agent.explore(ToyEnvironment(), 30, sink)
+
+        # then
+        columns = NumpySink.load(directory)
+        assert all(len(column) == 30 for column in columns.values())
+
+    def test_should_flush_metrics_when_training_fails(self, tmpdir):
+        # given
+        from lcs.agents.acs2 import ACS2, Configuration
+        from tests.lcs.helpers import ToyEnvironment
+
+        class FailingEnvironment(ToyEnvironment):
+            trials = 0
+
+            def reset(self):
+                self.trials += 1
+                if self.trials > 5:
+                    raise RuntimeError()
+                return super().reset()
+
+        path = str(tmpdir.join('metrics.jsonl'))
+        sink = JsonLinesSink(path, batch_size=100)
+
+        # when
+        with pytest.raises(RuntimeError):
+            ACS2(Configuration(4, 2)).explore(FailingEnvironment(), 10, sink)
+
+        # then
+        assert len(JsonLinesSink.load(path)) == 5
+
+    def test_should_stream_agent_metrics(self, tmpdir):
+        # given
+        from lcs.agents.acs2 import ACS2, Configuration
+        from tests.lcs.helpers import ToyEnvironment
+        path = str(tmpdir.join('metrics.jsonl'))
+        agent = ACS2(Configuration(4, 2))
+
+        # when
+        with JsonLinesSink(path, batch_size=8) as sink:
+            _, metrics = agent.explore(ToyEnvironment(), 20, sink)
+
+        # then
+        assert metrics == []
+        written = JsonLinesSink.load(path)
+        assert [m['agent']['trial'] for m in written] == list(range(20))
@@ -0,0 +1,68 @@
+from lcs import profiling
+from lcs.agents.acs2 import ACS2, Configuration
+from tests.lcs.helpers import ToyEnvironment
+
+
+class TestProfiling:
+
+    def test_should_accumulate_timers_and_counters(self):
+        # given
+        profiler = profiling.Profiler()
+
+        # when
+        t = profiler.lap('alp', 0.0)
+        profiler.lap('alp', t)
+        profiler.count('covering')
+        profiler.count('covering', 2)
+
+        # then
+        snapshot = profiler.snapshot()
+        assert snapshot['time_alp'] > 0
+        assert snapshot['covering'] == 3
+        assert profiler.snapshot() == {}
+
+    def test_should_do_nothing_when_not_activated(self):
+        # when
+        t = profiling.start()
+        profiling.count('covering')
+
+        # then
+        assert t == 0.0
+        assert profiling.lap('alp', t) == 0.0
+
+    def test_should_activate_profiler(self):
+        # given
+        profiler = profiling.Profiler()
+
+        # when
+        with profiling.activated(profiler):
+            profiling.count('deletion')
+            profiling.lap('ga', profiling.start())
+        profiling.count('deletion')
+
+        # then
+        snapshot = profiler.snapshot()
+        assert snapshot['deletion'] == 1
+        assert 'time_ga' in snapshot
+
+    def test_should_report_profile_in_metrics(self):
+        # given
+        cfg = Configuration(4, 2, do_ga=True, use_profiler=True)
+
+        # when
+        _, metrics = ACS2(cfg).explore(ToyEnvironment(), 10)
+
+        # then
+        assert all('profile' in m for m in metrics)
+        assert metrics[0]['profile']['covering'] == 1
+        assert {'time_match_set', 'time_alp', 'time_rl', 'time_ga',
+                'time_action_selection', 'time_environment'} <= \
+            set(metrics[0]['profile'])
+        assert sum(m['profile'].get('covering', 0) for m in metrics) >= 1
+
+    def test_should_not_report_profile_by_default(self):
+        # when
+        _, metrics = ACS2(Configuration(4, 2)).explore(ToyEnvironment(), 1)
+
+        # then
+        assert 'profile' not in metrics[0]
@@ -0,0 +1,87 @@
+import logging
+
+import pytest
+
+from lcs import tracing
+from lcs.agents.acs2 import ACS2, Configuration
+from tests.lcs.helpers import ToyEnvironment
+
+
+class RenderCountingEnvironment(ToyEnvironment):
+
+    def __init__(self):
+        super().__init__()
+        self.renders = 0
+
+    def render(self, mode='human'):
+        self.renders += 1
+        return super().render(mode)
+
+
+class TestTracing:
+
+    @pytest.fixture
+    def logger(self):
+        logger = logging.getLogger('tests.tracing')
+        yield logger
+        logger.setLevel(logging.NOTSET)
+
+    @pytest.mark.parametrize("_level, _trials, _steps, _sets", [
+        (logging.WARNING, False, False, False),
+        (tracing.TRIAL, True, False, False),
+        (tracing.STEP, True, True, False),
+        (tracing.SETS, True, True, True),
+    ])
+    def test_should_enable_levels(self, logger, _level,
+                                  _trials, _steps, _sets):
+        # given
+        logger.setLevel(_level)
+
+        # when
+        trace = tracing.Tracer(logger)
+
+        # then
+        assert trace.trials is _trials
+        assert trace.steps is _steps
+        assert trace.sets is _sets
+
+    def test_should_not_format_disabled_messages(self, logger, caplog):
+        # given
+        class Dump:
+            formatted = False
+
+            def __str__(self):
+                self.formatted = True
+                return 'dump'
+
+        dump = Dump()
+        logger.setLevel(tracing.STEP)
+        trace = tracing.Tracer(logger)
+
+        # when
+        trace.step("step %d", 1)
+        trace.dump("set %s", dump)
+
+        # then
+        assert not dump.formatted
+        assert [r.getMessage() for r in caplog.records] == ['step 1']
+
+    @pytest.mark.parametrize("_level, _renders", [
+        (logging.WARNING, 0),
+        (tracing.STEP, 5),
+    ])
+    def test_should_render_environment_only_when_traced(self, _level,
+                                                        _renders):
+        # given
+        logger = logging.getLogger('lcs.agents.acs2.ACS2')
+        logger.setLevel(_level)
+        env = RenderCountingEnvironment()
+
+        # when
+        try:
+            ACS2(Configuration(4, 2)).explore(env, 5)
+        finally:
+            logger.setLevel(logging.NOTSET)
+
+        # then
+        assert env.renders == _renders
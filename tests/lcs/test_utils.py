@@ -1,6 +1,7 @@
 import pytest
 
-from lcs import check_types
+from lcs import check_types, set_validation, validation_enabled, \
+    Perception, TypedList
 
 
 class TestUtils:
@@ -13,3 +14,21 @@ class TestUtils:
     def test_deny_mismatched_types(self):
         with pytest.raises(TypeError) as _:
             check_types((str,), 5)
+
+    def test_should_disable_validation(self):
+        # when
+        previous = set_validation(False)
+        try:
+            lst = TypedList((int,), 1, "2")
+            lst.append("3")
+            p = Perception([1, 2])
+        finally:
+            set_validation(previous)
+
+        # then
+        assert previous is True
+        assert validation_enabled() is True
+        assert list(lst) == [1, "2", "3"]
+        assert list(p) == [1, 2]
+        with pytest.raises(TypeError):
+            lst.append("4")
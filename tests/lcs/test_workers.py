@@ -0,0 +1,100 @@
+import os
+import random
+
+import pytest
+
+from lcs.agents.acs2 import ACS2, Configuration
+from lcs.workers import EnvWorker
+from tests.lcs.helpers import ToyEnvironment
+
+
+class CrashingEnvironment(ToyEnvironment):
+
+    def step(self, action):
+        os._exit(3)
+
+
+class TestWorkers:
+
+    @pytest.fixture
+    def worker(self):
+        with EnvWorker(ToyEnvironment, seed=7) as worker:
+            yield worker
+
+    def test_should_step_environment_in_worker(self, worker):
+        # given
+        random.seed(7)
+        env = ToyEnvironment()
+        expected = env.reset(), env.step(1)
+
+        # when
+        state = worker.reset()
+        worker.step_async(1)
+        outcome = worker.step_wait()
+
+        # then
+        assert (state, outcome) == expected
+        assert worker.render() == env.render()
+        assert worker.call('state') == env.state
+
+    def test_should_raise_errors_of_environment(self, worker):
+        # given
+        worker.reset()
+
+        # when & then
+        with pytest.raises(AttributeError):
+            worker.call('unknown')
+
+        assert worker.call('render') is not None
+
+    def test_should_not_wait_without_action(self, worker):
+        with pytest.raises(RuntimeError):
+            worker.step_wait()
+
+    def test_should_stop_worker(self):
+        # given
+        worker = EnvWorker(ToyEnvironment)
+
+        # when
+        worker.close()
+        worker.close()
+
+        # then
+        with pytest.raises(RuntimeError):
+            worker.reset()
+
+    def test_should_explore_environments_in_workers(self):
+        # given
+        cfg = Configuration(4, 2)
+        envs = [EnvWorker(ToyEnvironment, seed=seed) for seed in range(3)]
+
+        # when
+        try:
+            population, metrics = ACS2(cfg).explore_vectorized(envs, 30)
+        finally:
+            for env in envs:
+                env.close()
+
+        # then
+        assert len(metrics) == 30
+        assert len(population) > 0
+
+    def test_should_report_dead_worker(self):
+        # given
+        worker = EnvWorker(CrashingEnvironment)
+        worker.reset()
+
+        # when
+        worker.step_async(1)
+        with pytest.raises(RuntimeError,
+                           match="CrashingEnvironment .* exit code 3"):
+            worker.step_wait()
+
+        # then
+        with pytest.raises(RuntimeError, match="CrashingEnvironment"):
+            worker.call('render')
+        worker.close()
+
+    def test_should_not_expose_environment(self, worker):
+        with pytest.raises(AttributeError, match="call"):
+            worker.env